@@ -1,231 +1,365 @@
-from typing import Dict, Any, List
+from typing import Callable, Dict, Any, List, Mapping, NamedTuple, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
 import random
+import re
 
 class PersonaType(Enum):
     SINGLE_MOTHER = "single_mother"
     YOUNG_MALE = "young_male"
     ELDERLY_RETIREE = "elderly_retiree"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PersonaResponse:
     persona_type: PersonaType
     purchase_likelihood: float  # 0.0 to 1.0
-    reasoning: str
-    key_factors: List[str]
-    emotional_response: str
-    budget_consideration: str
+    reasoning: Optional[str]  # None when narrative was not requested
+    key_factors: Optional[List[str]]
+    emotional_response: Optional[str]
+    budget_consideration: Optional[str]
+
+# Keyword groups matched against image descriptions, one bit per group
+_SAFETY = 1 << 0
+_PRACTICAL = 1 << 1
+_STATUS = 1 << 2
+_SOCIAL_PROOF = 1 << 3
+_INSTANT = 1 << 4
+_QUALITY = 1 << 5
+_SIMPLE = 1 << 6
+_COMPLEX = 1 << 7
+_WELLNESS = 1 << 8
+
+_SAFETY_KEYWORDS = frozenset({"safe", "certified"})
+_PRACTICAL_KEYWORDS = frozenset({"practical", "useful", "convenient", "durable"})
+_STATUS_KEYWORDS = frozenset({"premium", "exclusive", "latest", "trending"})
+_SOCIAL_PROOF_KEYWORDS = frozenset({"popular", "trending", "recommended", "rated"})
+_INSTANT_KEYWORDS = frozenset({"fast", "instant", "immediate", "quick"})
+_QUALITY_KEYWORDS = frozenset({"quality", "durable", "long-lasting", "reliable"})
+_SIMPLE_KEYWORDS = frozenset({"simple", "easy", "basic", "traditional"})
+_COMPLEX_KEYWORDS = frozenset({"complex", "advanced", "high-tech"})
+_WELLNESS_KEYWORDS = frozenset({"health", "comfort", "mobility", "wellness"})
+
+_DESCRIPTION_KEYWORDS = {
+    _SAFETY: _SAFETY_KEYWORDS,
+    _PRACTICAL: _PRACTICAL_KEYWORDS,
+    _STATUS: _STATUS_KEYWORDS,
+    _SOCIAL_PROOF: _SOCIAL_PROOF_KEYWORDS,
+    _INSTANT: _INSTANT_KEYWORDS,
+    _QUALITY: _QUALITY_KEYWORDS,
+    _SIMPLE: _SIMPLE_KEYWORDS,
+    _COMPLEX: _COMPLEX_KEYWORDS,
+    _WELLNESS: _WELLNESS_KEYWORDS,
+}
+
+# Keyword groups matched against the product category
+_FAMILY_CATEGORY = 1 << 16
+_INTEREST_CATEGORY = 1 << 17
+_NECESSITY_CATEGORY = 1 << 18
+
+_FAMILY_CATEGORIES = frozenset({"baby", "child", "family", "home", "food", "health"})
+_INTEREST_CATEGORIES = frozenset({"tech", "gaming", "fashion", "sports", "car", "electronics"})
+_NECESSITY_CATEGORIES = frozenset({"health", "medical", "food", "home", "utility"})
+
+_CATEGORY_KEYWORDS = {
+    _FAMILY_CATEGORY: _FAMILY_CATEGORIES,
+    _INTEREST_CATEGORY: _INTEREST_CATEGORIES,
+    _NECESSITY_CATEGORY: _NECESSITY_CATEGORIES,
+}
+
+def _compile_keywords(groups: Dict[int, frozenset]):
+    """Build a single-pass scanner and a keyword -> group bitmask table."""
+    bits: Dict[str, int] = {}
+    for bit, keywords in groups.items():
+        for keyword in keywords:
+            bits[keyword] = bits.get(keyword, 0) | bit
+    # The scanner reports only the longest keyword starting at each position,
+    # so fold in the bits of any shorter keyword contained in it
+    table = {
+        keyword: bit | sum(other_bit for other, other_bit in bits.items() if other != keyword and other in keyword)
+        for keyword, bit in bits.items()
+    }
+    alternation = "|".join(re.escape(keyword) for keyword in sorted(table, key=lambda keyword: (-len(keyword), keyword)))
+    return re.compile(f"(?=({alternation}))"), table
+
+_DESCRIPTION_SCANNER, _DESCRIPTION_BITS = _compile_keywords(_DESCRIPTION_KEYWORDS)
+_CATEGORY_SCANNER, _CATEGORY_BITS = _compile_keywords(_CATEGORY_KEYWORDS)
+
+def _keyword_mask(scanner, bits: Dict[str, int], text: str) -> int:
+    """OR together the group bits of every keyword occurring in lowercased text."""
+    # Single-keyword text (typically a category) resolves with one hash lookup
+    mask = bits.get(text)
+    if mask is not None:
+        return mask
+    mask = 0
+    for match in scanner.finditer(text):
+        mask |= bits[match.group(1)]
+    return mask
+
+# Descriptions repeat across personas and variants, categories across whole sweeps
+@lru_cache(maxsize=256)
+def _description_mask(description_lower: str) -> int:
+    return _keyword_mask(_DESCRIPTION_SCANNER, _DESCRIPTION_BITS, description_lower)
+
+@lru_cache(maxsize=1024)
+def _category_mask(category: str) -> int:
+    return _keyword_mask(_CATEGORY_SCANNER, _CATEGORY_BITS, category.lower())
+
+# Price bands, resolved per persona
+_LOW_PRICE = 1 << 24
+_MID_PRICE = 1 << 25
+_HIGH_PRICE = 1 << 26
+
+class _ScoringModel(NamedTuple):
+    base: float
+    price_bands: Tuple[Tuple[float, int], ...]  # (max price, feature bit), first match wins
+    rules: Tuple[Tuple[int, int, float, str], ...]  # (required bits, excluded bits, delta, key factor)
+
+_SINGLE_MOTHER_MODEL = _ScoringModel(
+    base=0.3,
+    price_bands=((50, _LOW_PRICE), (100, 0), (float("inf"), _HIGH_PRICE)),
+    rules=(
+        (_FAMILY_CATEGORY, 0, 0.4, "Benefits my children"),
+        (_LOW_PRICE, 0, 0.2, "Affordable price point"),
+        (_HIGH_PRICE, 0, -0.3, "Too expensive for budget"),
+        (_SAFETY, 0, 0.2, "Safety certified"),
+        (_PRACTICAL, 0, 0.1, "Practical value"),
+    ),
+)
+
+_YOUNG_MALE_MODEL = _ScoringModel(
+    base=0.4,  # More impulsive
+    price_bands=((200, _LOW_PRICE), (400, 0), (float("inf"), _HIGH_PRICE)),
+    rules=(
+        (_INTEREST_CATEGORY, 0, 0.3, "Appeals to my interests"),
+        (_STATUS, 0, 0.2, "Status and brand appeal"),
+        (_LOW_PRICE, 0, 0.1, "Reasonable price"),
+        (_HIGH_PRICE, 0, -0.1, "Expensive but might be worth it"),
+        (_SOCIAL_PROOF, 0, 0.15, "Social proof and popularity"),
+        (_INSTANT, 0, 0.1, "Immediate satisfaction"),
+    ),
+)
+
+_ELDERLY_RETIREE_MODEL = _ScoringModel(
+    base=0.2,  # Very conservative
+    price_bands=((25, _LOW_PRICE), (50, _MID_PRICE), (float("inf"), _HIGH_PRICE)),
+    rules=(
+        (_NECESSITY_CATEGORY, 0, 0.3, "Necessary for daily life"),
+        (_LOW_PRICE, 0, 0.3, "Very affordable"),
+        (_MID_PRICE, 0, 0.1, "Reasonably priced"),
+        (_HIGH_PRICE, 0, -0.2, "Too expensive for fixed income"),
+        (_QUALITY, 0, 0.2, "Good quality and durability"),
+        (_SIMPLE, 0, 0.1, "Simple and easy to use"),
+        (_COMPLEX, _SIMPLE, -0.1, "Too complicated"),
+        (_WELLNESS, 0, 0.2, "Health and wellness benefits"),
+    ),
+)
+
+def _price_band(price_bands: Tuple[Tuple[float, int], ...], price: float) -> int:
+    for max_price, bit in price_bands:
+        if price <= max_price:
+            return bit
+    return 0
+
+_SCORING_MODELS = {
+    PersonaType.SINGLE_MOTHER: _SINGLE_MOTHER_MODEL,
+    PersonaType.YOUNG_MALE: _YOUNG_MALE_MODEL,
+    PersonaType.ELDERLY_RETIREE: _ELDERLY_RETIREE_MODEL,
+}
+
+def _score(persona_type: PersonaType, description_lower: str, product_info: Dict[str, Any]) -> Tuple[float, int]:
+    """Apply a persona's scoring rules; returns the clamped likelihood and a bitmask of the rules that fired."""
+    features = _description_mask(description_lower) | _category_mask(product_info.get("category", ""))
+    return _apply_rules(persona_type, features, product_info.get("price", 0))
+
+def _apply_rules(persona_type: PersonaType, features: int, price: float) -> Tuple[float, int]:
+    price_band = _price_band(_SCORING_MODELS[persona_type].price_bands, price)
+    return _fire_rules(persona_type, features | price_band)
+
+# Once price is reduced to its band the feature mask has few distinct values, so hits are common
+@lru_cache(maxsize=4096)
+def _fire_rules(persona_type: PersonaType, features: int) -> Tuple[float, int]:
+    model = _SCORING_MODELS[persona_type]
+    purchase_likelihood = model.base
+    fired = 0
+    for rule_id, (required, excluded, delta, _) in enumerate(model.rules):
+        if features & required and not features & excluded:
+            purchase_likelihood += delta
+            fired |= 1 << rule_id
+    
+    return max(0.0, min(1.0, purchase_likelihood)), fired
+
+def _key_factors(model: _ScoringModel, fired: int) -> List[str]:
+    return [rule[3] for rule_id, rule in enumerate(model.rules) if fired >> rule_id & 1]
+
+def score_batch(variants: List[Tuple[str, Dict[str, Any]]]) -> Dict[PersonaType, List[float]]:
+    """
+    Score many (image_description, product_info) variants against every persona.
+    Each description and category is scanned once and shared by all personas;
+    only purchase likelihoods are produced, in variant order.
+    """
+    shared = [
+        (_description_mask(description.lower()) | _category_mask(info.get("category", "")), info.get("price", 0))
+        for description, info in variants
+    ]
+    return {
+        persona_type: [_apply_rules(persona_type, features, price)[0] for features, price in shared]
+        for persona_type in _SCORING_MODELS
+    }
+
+def _analyze(persona_type: PersonaType, narrate: Callable[[float, float], Tuple[str, str, str]],
+             description_lower: str, product_info: Dict[str, Any], include_narrative: bool) -> PersonaResponse:
+    purchase_likelihood, fired = _score(persona_type, description_lower, product_info)
+    
+    key_factors = reasoning = emotional_response = budget_consideration = None
+    if include_narrative:
+        key_factors = _key_factors(_SCORING_MODELS[persona_type], fired)
+        reasoning, emotional_response, budget_consideration = narrate(purchase_likelihood, product_info.get("price", 0))
+    
+    return PersonaResponse(
+        persona_type=persona_type,
+        purchase_likelihood=purchase_likelihood,
+        reasoning=reasoning,
+        key_factors=key_factors,
+        emotional_response=emotional_response,
+        budget_consideration=budget_consideration
+    )
+
+# Single mother: reasoning by likelihood bucket (low, medium, high) and emotional response (low, high)
+_SINGLE_MOTHER_MONTHLY_BUDGET = 200
+_SINGLE_MOTHER_MAX_PURCHASE = 100
+_SINGLE_MOTHER_REASONING = tuple(
+    "As a single mother, I need to consider how this purchase affects my children and fits our budget. " + outlook
+    for outlook in (
+        "This doesn't seem necessary for our current needs.",
+        "I'm somewhat interested but need to think about the cost.",
+        "This seems like a good investment for our family.",
+    )
+)
+_SINGLE_MOTHER_EMOTIONS = ("Cautious but caring", "Interested and hopeful")
+
+def _narrate_single_mother(purchase_likelihood: float, price: float) -> Tuple[str, str, str]:
+    return (
+        _SINGLE_MOTHER_REASONING[(purchase_likelihood > 0.6) + (purchase_likelihood > 0.4)],
+        _SINGLE_MOTHER_EMOTIONS[purchase_likelihood >= 0.5],
+        f"Monthly budget allows ${_SINGLE_MOTHER_MONTHLY_BUDGET}, this costs ${price}",
+    )
+
+def analyze_single_mother(description_lower: str, product_info: Dict[str, Any],
+                          include_narrative: bool = True) -> PersonaResponse:
+    return _analyze(PersonaType.SINGLE_MOTHER, _narrate_single_mother, description_lower, product_info, include_narrative)
+
+# Young male
+_YOUNG_MALE_MONTHLY_BUDGET = 800
+_YOUNG_MALE_MAX_PURCHASE = 500
+_YOUNG_MALE_REASONING = tuple(
+    "This looks pretty cool and I can afford it. " + outlook
+    for outlook in (
+        "Not really my thing, I'll pass.",
+        "I'm really tempted, might get it this weekend.",
+        "I'm definitely getting this - it's exactly what I want.",
+    )
+)
+_YOUNG_MALE_EMOTIONS = ("Mildly interested", "Excited and impulsive")
+
+def _narrate_young_male(purchase_likelihood: float, price: float) -> Tuple[str, str, str]:
+    return (
+        _YOUNG_MALE_REASONING[(purchase_likelihood > 0.7) + (purchase_likelihood > 0.5)],
+        _YOUNG_MALE_EMOTIONS[purchase_likelihood > 0.6],
+        f"I can easily afford ${price} with my ${_YOUNG_MALE_MONTHLY_BUDGET} monthly budget",
+    )
+
+def analyze_young_male(description_lower: str, product_info: Dict[str, Any],
+                       include_narrative: bool = True) -> PersonaResponse:
+    return _analyze(PersonaType.YOUNG_MALE, _narrate_young_male, description_lower, product_info, include_narrative)
+
+# Elderly retiree
+_ELDERLY_RETIREE_MONTHLY_BUDGET = 150
+_ELDERLY_RETIREE_MAX_PURCHASE = 75
+_ELDERLY_RETIREE_REASONING = tuple(
+    "At my age and on a fixed income, I need to be careful with purchases. " + outlook
+    for outlook in (
+        "This isn't something I need right now.",
+        "I'll think about it and maybe ask my children's opinion.",
+        "This seems like a wise investment that I actually need.",
+    )
+)
+_ELDERLY_RETIREE_EMOTIONS = ("Cautious and practical", "Carefully optimistic")
+
+def _narrate_elderly_retiree(purchase_likelihood: float, price: float) -> Tuple[str, str, str]:
+    return (
+        _ELDERLY_RETIREE_REASONING[(purchase_likelihood > 0.6) + (purchase_likelihood > 0.3)],
+        _ELDERLY_RETIREE_EMOTIONS[purchase_likelihood >= 0.5],
+        f"Fixed income limits me to ${_ELDERLY_RETIREE_MONTHLY_BUDGET}/month, this costs ${price}",
+    )
+
+def analyze_elderly_retiree(description_lower: str, product_info: Dict[str, Any],
+                            include_narrative: bool = True) -> PersonaResponse:
+    return _analyze(PersonaType.ELDERLY_RETIREE, _narrate_elderly_retiree, description_lower, product_info, include_narrative)
+
+# Stateless analyzers; each takes an already lowercased description
+PERSONA_ANALYZERS: Dict[PersonaType, Callable[..., PersonaResponse]] = {
+    PersonaType.SINGLE_MOTHER: analyze_single_mother,
+    PersonaType.YOUNG_MALE: analyze_young_male,
+    PersonaType.ELDERLY_RETIREE: analyze_elderly_retiree,
+}
 
 class BasePersona:
-    def __init__(self, name: str, persona_type: PersonaType):
-        self.name = name
-        self.persona_type = persona_type
-        self.decision_factors = []
-        self.budget_constraints = {}
-        
-    def analyze_image(self, image_description: str, product_info: Dict[str, Any]) -> PersonaResponse:
-        raise NotImplementedError("Subclasses must implement analyze_image")
+    # Shared, immutable persona metadata lives on the class rather than each instance
+    name: str = ""
+    persona_type: PersonaType
+    decision_factors: Tuple[str, ...] = ()
+    budget_constraints: Mapping[str, int] = MappingProxyType({})
+    priorities: Tuple[str, ...] = ()
+    
+    def analyze_image(self, image_description: str, product_info: Dict[str, Any],
+                      include_narrative: bool = True) -> PersonaResponse:
+        return self.analyze_lowered(image_description.lower(), product_info, include_narrative)
+    
+    def analyze_lowered(self, description_lower: str, product_info: Dict[str, Any],
+                        include_narrative: bool = True) -> PersonaResponse:
+        """
+        Analyze an already lowercased description, letting callers lowercase once for all personas.
+        Score-only callers can pass include_narrative=False to skip building key_factors and the text fields.
+        """
+        return PERSONA_ANALYZERS[self.persona_type](description_lower, product_info, include_narrative)
 
 class SingleMotherPersona(BasePersona):
-    def __init__(self):
-        super().__init__("Sarah", PersonaType.SINGLE_MOTHER)
-        self.decision_factors = [
-            "child_safety", "value_for_money", "durability", 
-            "family_benefit", "time_saving", "necessity"
-        ]
-        self.budget_constraints = {"monthly_discretionary": 200, "max_single_purchase": 100}
-        self.priorities = ["kids_wellbeing", "practical_value", "safety"]
-        
-    def analyze_image(self, image_description: str, product_info: Dict[str, Any]) -> PersonaResponse:
-        price = product_info.get("price", 0)
-        category = product_info.get("category", "").lower()
-        
-        # Decision logic based on single mother priorities
-        purchase_likelihood = 0.3  # Base likelihood
-        key_factors = []
-        
-        # Family-oriented products get higher likelihood
-        if any(word in category for word in ["baby", "child", "family", "home", "food", "health"]):
-            purchase_likelihood += 0.4
-            key_factors.append("Benefits my children")
-            
-        # Price sensitivity
-        if price <= 50:
-            purchase_likelihood += 0.2
-            key_factors.append("Affordable price point")
-        elif price > 100:
-            purchase_likelihood -= 0.3
-            key_factors.append("Too expensive for budget")
-            
-        # Safety considerations
-        if "safe" in image_description.lower() or "certified" in image_description.lower():
-            purchase_likelihood += 0.2
-            key_factors.append("Safety certified")
-            
-        # Practical value
-        if any(word in image_description.lower() for word in ["practical", "useful", "convenient", "durable"]):
-            purchase_likelihood += 0.1
-            key_factors.append("Practical value")
-            
-        purchase_likelihood = max(0.0, min(1.0, purchase_likelihood))
-        
-        reasoning = f"As a single mother, I need to consider how this purchase affects my children and fits our budget. "
-        if purchase_likelihood > 0.6:
-            reasoning += "This seems like a good investment for our family."
-        elif purchase_likelihood > 0.4:
-            reasoning += "I'm somewhat interested but need to think about the cost."
-        else:
-            reasoning += "This doesn't seem necessary for our current needs."
-            
-        emotional_response = "Cautious but caring" if purchase_likelihood < 0.5 else "Interested and hopeful"
-        budget_consideration = f"Monthly budget allows ${self.budget_constraints['monthly_discretionary']}, this costs ${price}"
-        
-        return PersonaResponse(
-            persona_type=self.persona_type,
-            purchase_likelihood=purchase_likelihood,
-            reasoning=reasoning,
-            key_factors=key_factors,
-            emotional_response=emotional_response,
-            budget_consideration=budget_consideration
-        )
+    name = "Sarah"
+    persona_type = PersonaType.SINGLE_MOTHER
+    decision_factors = (
+        "child_safety", "value_for_money", "durability", 
+        "family_benefit", "time_saving", "necessity"
+    )
+    budget_constraints = MappingProxyType({
+        "monthly_discretionary": _SINGLE_MOTHER_MONTHLY_BUDGET,
+        "max_single_purchase": _SINGLE_MOTHER_MAX_PURCHASE
+    })
+    priorities = ("kids_wellbeing", "practical_value", "safety")
 
 class YoungMalePersona(BasePersona):
-    def __init__(self):
-        super().__init__("Jake", PersonaType.YOUNG_MALE)
-        self.decision_factors = [
-            "status_symbol", "personal_enjoyment", "technology", 
-            "style", "performance", "social_approval"
-        ]
-        self.budget_constraints = {"monthly_discretionary": 800, "max_single_purchase": 500}
-        self.priorities = ["self_image", "instant_gratification", "social_status"]
-        
-    def analyze_image(self, image_description: str, product_info: Dict[str, Any]) -> PersonaResponse:
-        price = product_info.get("price", 0)
-        category = product_info.get("category", "").lower()
-        
-        purchase_likelihood = 0.4  # Base likelihood - more impulsive
-        key_factors = []
-        
-        # Tech and status items get higher likelihood
-        if any(word in category for word in ["tech", "gaming", "fashion", "sports", "car", "electronics"]):
-            purchase_likelihood += 0.3
-            key_factors.append("Appeals to my interests")
-            
-        # Brand and status considerations
-        if any(word in image_description.lower() for word in ["premium", "exclusive", "latest", "trending"]):
-            purchase_likelihood += 0.2
-            key_factors.append("Status and brand appeal")
-            
-        # Price sensitivity (less than other personas)
-        if price <= 200:
-            purchase_likelihood += 0.1
-            key_factors.append("Reasonable price")
-        elif price > 400:
-            purchase_likelihood -= 0.1
-            key_factors.append("Expensive but might be worth it")
-            
-        # Social proof
-        if any(word in image_description.lower() for word in ["popular", "trending", "recommended", "rated"]):
-            purchase_likelihood += 0.15
-            key_factors.append("Social proof and popularity")
-            
-        # Instant gratification appeal
-        if any(word in image_description.lower() for word in ["fast", "instant", "immediate", "quick"]):
-            purchase_likelihood += 0.1
-            key_factors.append("Immediate satisfaction")
-            
-        purchase_likelihood = max(0.0, min(1.0, purchase_likelihood))
-        
-        reasoning = f"This looks pretty cool and I can afford it. "
-        if purchase_likelihood > 0.7:
-            reasoning += "I'm definitely getting this - it's exactly what I want."
-        elif purchase_likelihood > 0.5:
-            reasoning += "I'm really tempted, might get it this weekend."
-        else:
-            reasoning += "Not really my thing, I'll pass."
-            
-        emotional_response = "Excited and impulsive" if purchase_likelihood > 0.6 else "Mildly interested"
-        budget_consideration = f"I can easily afford ${price} with my ${self.budget_constraints['monthly_discretionary']} monthly budget"
-        
-        return PersonaResponse(
-            persona_type=self.persona_type,
-            purchase_likelihood=purchase_likelihood,
-            reasoning=reasoning,
-            key_factors=key_factors,
-            emotional_response=emotional_response,
-            budget_consideration=budget_consideration
-        )
+    name = "Jake"
+    persona_type = PersonaType.YOUNG_MALE
+    decision_factors = (
+        "status_symbol", "personal_enjoyment", "technology", 
+        "style", "performance", "social_approval"
+    )
+    budget_constraints = MappingProxyType({
+        "monthly_discretionary": _YOUNG_MALE_MONTHLY_BUDGET,
+        "max_single_purchase": _YOUNG_MALE_MAX_PURCHASE
+    })
+    priorities = ("self_image", "instant_gratification", "social_status")
 
 class ElderlyRetireePersona(BasePersona):
-    def __init__(self):
-        super().__init__("Robert", PersonaType.ELDERLY_RETIREE)
-        self.decision_factors = [
-            "value_for_money", "necessity", "quality", 
-            "health_benefit", "simplicity", "longevity"
-        ]
-        self.budget_constraints = {"monthly_discretionary": 150, "max_single_purchase": 75}
-        self.priorities = ["frugality", "health", "practicality"]
-        
-    def analyze_image(self, image_description: str, product_info: Dict[str, Any]) -> PersonaResponse:
-        price = product_info.get("price", 0)
-        category = product_info.get("category", "").lower()
-        
-        purchase_likelihood = 0.2  # Base likelihood - very conservative
-        key_factors = []
-        
-        # Health and necessity items get priority
-        if any(word in category for word in ["health", "medical", "food", "home", "utility"]):
-            purchase_likelihood += 0.3
-            key_factors.append("Necessary for daily life")
-            
-        # Strong price sensitivity
-        if price <= 25:
-            purchase_likelihood += 0.3
-            key_factors.append("Very affordable")
-        elif price <= 50:
-            purchase_likelihood += 0.1
-            key_factors.append("Reasonably priced")
-        else:
-            purchase_likelihood -= 0.2
-            key_factors.append("Too expensive for fixed income")
-            
-        # Quality and durability matter
-        if any(word in image_description.lower() for word in ["quality", "durable", "long-lasting", "reliable"]):
-            purchase_likelihood += 0.2
-            key_factors.append("Good quality and durability")
-            
-        # Simplicity preference
-        if any(word in image_description.lower() for word in ["simple", "easy", "basic", "traditional"]):
-            purchase_likelihood += 0.1
-            key_factors.append("Simple and easy to use")
-        elif any(word in image_description.lower() for word in ["complex", "advanced", "high-tech"]):
-            purchase_likelihood -= 0.1
-            key_factors.append("Too complicated")
-            
-        # Health benefits
-        if any(word in image_description.lower() for word in ["health", "comfort", "mobility", "wellness"]):
-            purchase_likelihood += 0.2
-            key_factors.append("Health and wellness benefits")
-            
-        purchase_likelihood = max(0.0, min(1.0, purchase_likelihood))
-        
-        reasoning = f"At my age and on a fixed income, I need to be careful with purchases. "
-        if purchase_likelihood > 0.6:
-            reasoning += "This seems like a wise investment that I actually need."
-        elif purchase_likelihood > 0.3:
-            reasoning += "I'll think about it and maybe ask my children's opinion."
-        else:
-            reasoning += "This isn't something I need right now."
-            
-        emotional_response = "Cautious and practical" if purchase_likelihood < 0.5 else "Carefully optimistic"
-        budget_consideration = f"Fixed income limits me to ${self.budget_constraints['monthly_discretionary']}/month, this costs ${price}"
-        
-        return PersonaResponse(
-            persona_type=self.persona_type,
-            purchase_likelihood=purchase_likelihood,
-            reasoning=reasoning,
-            key_factors=key_factors,
-            emotional_response=emotional_response,
-            budget_consideration=budget_consideration
-        )
\ No newline at end of file
+    name = "Robert"
+    persona_type = PersonaType.ELDERLY_RETIREE
+    decision_factors = (
+        "value_for_money", "necessity", "quality", 
+        "health_benefit", "simplicity", "longevity"
+    )
+    budget_constraints = MappingProxyType({
+        "monthly_discretionary": _ELDERLY_RETIREE_MONTHLY_BUDGET,
+        "max_single_purchase": _ELDERLY_RETIREE_MAX_PURCHASE
+    })
+    priorities = ("frugality", "health", "practicality")
@@ -167,6 +167,23 @@ def example_persona_analysis():
             print(f"  {persona_name}: {response.purchase_likelihood:.1%} likelihood")
             print(f"    Reasoning: {response.reasoning[:60]}...")
 
+def example_batch_scoring():
+    """Example scoring many variants against all personas in one call"""
+    print("\n=== Batch Scoring Example ===")
+    
+    from agents.personas import score_batch
+    
+    variants = [
+        ("Premium organic baby food with safety certifications", {"category": "baby", "price": 15.99}),
+        ("Latest smartphone with cutting-edge features and premium design", {"category": "tech", "price": 899.99}),
+        ("Simple, reliable health monitoring device with large display", {"category": "health", "price": 49.99}),
+    ]
+    
+    scores = score_batch(variants)
+    for persona_type, likelihoods in scores.items():
+        persona_name = persona_type.value.replace('_', ' ').title()
+        print(f"  {persona_name}: {', '.join(f'{score:.1%}' for score in likelihoods)}")
+
 async def main():
     """Run all examples"""
     print("Marketing A/B Testing Examples")
@@ -179,6 +196,7 @@ async def main():
     # await example_basic_test()
     # await example_custom_personas()
     example_persona_analysis()
+    example_batch_scoring()
     
     print("\nExamples completed! Check the main.py script for actual execution.")
 
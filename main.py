@@ -13,13 +13,13 @@ import json
 import os
 import argparse
 from typing import Dict, Any
-from dotenv import load_dotenv
 
-from workflow.ab_testing_graph import ABTestingWorkflow, ABTestState
-from utils.image_processor import ImageProcessor
+# dotenv, the LangGraph workflow and the image processor are imported where they
+# are used, so importing this module (or --help) skips the LangChain/Pillow stack
 
 def load_config() -> Dict[str, Any]:
     """Load configuration from environment variables"""
+    from dotenv import load_dotenv
     load_dotenv()
     
     config = {
@@ -123,6 +123,8 @@ def print_detailed_persona_responses(results: Dict[str, Any]):
 
 async def run_ab_test_simulation(image_url: str, variant_a: Dict[str, Any], variant_b: Dict[str, Any]) -> Dict[str, Any]:
     """Run the complete A/B test simulation"""
+    from workflow.ab_testing_graph import ABTestingWorkflow, ABTestState
+    
     config = load_config()
     
     # Initialize the workflow
@@ -164,11 +166,9 @@ def save_results(results: Dict[str, Any], output_dir: str):
     filename = f"ab_test_results_{timestamp}.json"
     filepath = os.path.join(output_dir, filename)
     
-    # Convert results to JSON-serializable format
-    json_results = json.loads(json.dumps(results, default=str))
-    
+    # default=str coerces non-serializable values (e.g. PersonaType) during the single dump
     with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(json_results, f, indent=2, ensure_ascii=False)
+        json.dump(results, f, indent=2, ensure_ascii=False, default=str)
     
     print(f"=� Results saved to: {filepath}")
     return filepath
@@ -197,6 +197,7 @@ async def main():
         
         # Validate image if it's a URL
         if image_url.startswith('http'):
+            from utils.image_processor import ImageProcessor
             if not ImageProcessor.validate_image_url(image_url):
                 print(f"L Invalid image URL: {image_url}")
                 return
@@ -13,9 +13,13 @@ Usage:
 
 import argparse
 import asyncio
-import json
+import logging
+import orjson
+import os
 import sys
 import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -25,16 +29,22 @@ sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
 from src.utils.config import load_config, get_config
 from src.utils.logger import setup_logger, get_app_logger
-from src.scrapers.linkedin_scraper import LinkedInScraper, MockLinkedInScraper
-from src.scrapers.reddit_scraper import RedditScraper, MockRedditScraper
-from src.analyzers.style_analyzer import WritingStyleAnalyzer
-from src.analyzers.content_summarizer import ContentSummarizer
-from src.generators.linkedin_post_generator import LinkedInPostGenerator
+
+# Scrapers, analyzers and the generator pull in selenium, praw and the openai SDK;
+# they are imported where they are used so --help and argument errors stay fast.
+
+# Separator lines for the console output
+HEADER_BAR = "=" * 60
+SUB_BAR = "-" * 40
+FOOT_BAR = "-" * 60
 
 
 class SocialMediaReaderApp:
     """Main application class for Social Media Reader."""
     
+    # Profiles kept in the style cache; the least recently analyzed are evicted beyond this
+    STYLE_CACHE_MAX_PROFILES = 32
+    
     def __init__(self, config_file: Optional[str] = None):
         """
         Initialize the application.
@@ -58,6 +68,11 @@ class SocialMediaReaderApp:
         # Create output directories
         self.config.create_directories()
         
+        # Resolve output locations once rather than rebuilding the paths in every step
+        self._data_dir = Path(self.config.DATA_DIR).resolve()
+        self._output_dir = Path(self.config.OUTPUT_DIR).resolve()
+        self._style_cache_path = self._data_dir / "style_cache.json"
+        
         # Initialize components
         self.linkedin_scraper = None
         self.reddit_scraper = None
@@ -65,6 +80,21 @@ class SocialMediaReaderApp:
         self.content_summarizer = None
         self.post_generator = None
         
+        # Shared by every file written during a pipeline run
+        self._run_timestamp = None
+        
+        # Files written by the pipeline steps, and the generated posts of the last run
+        # (the only output displayed after the run; the rest is released with the results)
+        self._artifact_files = {}
+        self._last_generated_posts = {}
+        
+        # Background writer so the results dump overlaps with displaying the summary
+        self._io_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='results-writer')
+        self._pending_write: Optional[Future] = None
+        
+        # The LinkedIn browser session stays open across runs until close()
+        self._linkedin_logged_in = False
+        
         self.logger.info("Social Media Reader application initialized")
     
     def initialize_components(self):
@@ -72,10 +102,16 @@ class SocialMediaReaderApp:
         try:
             # Initialize scrapers
             if self.config.USE_MOCK_DATA:
+                from src.scrapers.linkedin_scraper import MockLinkedInScraper
+                from src.scrapers.reddit_scraper import MockRedditScraper
+                
                 self.linkedin_scraper = MockLinkedInScraper()
                 self.reddit_scraper = MockRedditScraper()
                 self.logger.info("Initialized with mock data scrapers")
             else:
+                from src.scrapers.linkedin_scraper import LinkedInScraper, MockLinkedInScraper
+                from src.scrapers.reddit_scraper import RedditScraper, MockRedditScraper
+                
                 # LinkedIn scraper
                 if self.config.LINKEDIN_EMAIL and self.config.LINKEDIN_PASSWORD:
                     self.linkedin_scraper = LinkedInScraper(
@@ -99,26 +135,88 @@ class SocialMediaReaderApp:
             
             # Initialize analyzers and generators
             if self.config.OPENAI_API_KEY:
+                import openai
+                from src.utils.completion_cache import CompletionCache
+                from src.analyzers.style_analyzer import WritingStyleAnalyzer
+                from src.analyzers.content_summarizer import ContentSummarizer
+                from src.generators.linkedin_post_generator import LinkedInPostGenerator
+                
+                # One sync and one async client, and so one HTTP connection pool each, shared by
+                # every AI component; the components retry failed requests themselves, so the SDK does not
+                openai_client = openai.OpenAI(api_key=self.config.OPENAI_API_KEY, max_retries=0)
+                openai_async_client = openai.AsyncOpenAI(api_key=self.config.OPENAI_API_KEY, max_retries=0)
+                
+                completion_cache = None
+                if self.config.ENABLE_CACHE:
+                    completion_cache = CompletionCache(
+                        str(self._data_dir / '.llm_cache'),
+                        capacity=self.config.LLM_CACHE_CAPACITY,
+                        ttl_hours=self.config.CACHE_DURATION_HOURS
+                    )
+                
                 self.style_analyzer = WritingStyleAnalyzer(
                     openai_api_key=self.config.OPENAI_API_KEY,
-                    model=self.config.OPENAI_MODEL
+                    model=self.config.OPENAI_MODEL_LIGHT,
+                    use_batch_api=self.config.USE_BATCH_API,
+                    completion_cache=completion_cache,
+                    client=openai_client
                 )
                 self.content_summarizer = ContentSummarizer(
                     openai_api_key=self.config.OPENAI_API_KEY,
-                    model=self.config.OPENAI_MODEL
+                    model=self.config.OPENAI_MODEL_LIGHT,
+                    rewrite_model=self.config.OPENAI_MODEL_LIGHT,
+                    use_batch_api=self.config.USE_BATCH_API,
+                    completion_cache=completion_cache,
+                    use_semantic_cache=self.config.ENABLE_CACHE and self.config.ENABLE_SEMANTIC_CACHE,
+                    response_cache_size=self.config.LLM_CACHE_CAPACITY if self.config.ENABLE_CACHE else 0,
+                    client=openai_client,
+                    async_client=openai_async_client
                 )
                 self.post_generator = LinkedInPostGenerator(
                     openai_api_key=self.config.OPENAI_API_KEY,
-                    model=self.config.OPENAI_MODEL
+                    model=self.config.OPENAI_MODEL_HEAVY,
+                    use_batch_api=self.config.USE_BATCH_API,
+                    completion_cache=completion_cache,
+                    client=openai_client,
+                    async_client=openai_async_client
                 )
                 self.logger.info("Initialized AI components with OpenAI API")
             else:
                 raise ValueError("OpenAI API key is required but not provided")
             
         except Exception as e:
-            self.logger.error(f"Failed to initialize components: {str(e)}")
+            self.logger.error("Failed to initialize components: %s", e)
             raise
     
+    def _output_timestamp(self) -> str:
+        """Timestamp for output filenames, shared across a pipeline run."""
+        return self._run_timestamp or datetime.now().strftime('%Y%m%d_%H%M%S')
+    
+    def _dump(self, obj, output_file: Path):
+        """
+        Write a pipeline-internal artifact as compact orjson-encoded JSON.
+        
+        Intermediate files are not read back by the pipeline, so they skip the
+        indentation of the user-facing outputs.
+        
+        Args:
+            obj: Artifact to write
+            output_file: Destination file
+        """
+        try:
+            # Encode before opening so a failed encode never leaves a partial file behind
+            data = orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+            with open(output_file, 'wb') as f:
+                f.write(data)
+            self.logger.info("Saved %s", output_file)
+        except (OSError, TypeError) as e:
+            self.logger.error("Failed to save %s: %s", output_file, e)
+    
+    def _record_artifact(self, name: str, output_file: Path):
+        """Remember where a step saved its output so pipeline results can reference it."""
+        if output_file.exists():
+            self._artifact_files[name] = str(output_file)
+    
     def scrape_linkedin_posts(self, profile_url: str) -> List[Dict]:
         """
         Scrape LinkedIn posts for style analysis.
@@ -129,17 +227,20 @@ class SocialMediaReaderApp:
         Returns:
             List of LinkedIn posts
         """
-        self.logger.info(f"Starting LinkedIn post scraping for: {profile_url}")
+        self.logger.info("Starting LinkedIn post scraping for: %s", profile_url)
+        
+        from src.scrapers.linkedin_scraper import MockLinkedInScraper
         
         try:
-            # Login if real scraper
-            if not isinstance(self.linkedin_scraper, MockLinkedInScraper):
+            # Login once per browser session if real scraper
+            if not isinstance(self.linkedin_scraper, MockLinkedInScraper) and not self._linkedin_logged_in:
                 login_success = self.linkedin_scraper.login(
                     self.config.LINKEDIN_EMAIL,
                     self.config.LINKEDIN_PASSWORD
                 )
                 if not login_success:
                     raise Exception("LinkedIn login failed")
+                self._linkedin_logged_in = True
             
             # Scrape posts
             posts = self.linkedin_scraper.get_user_posts(
@@ -147,21 +248,19 @@ class SocialMediaReaderApp:
                 max_posts=self.config.MAX_LINKEDIN_POSTS
             )
             
-            self.logger.info(f"Successfully scraped {len(posts)} LinkedIn posts")
+            self.logger.info("Successfully scraped %d LinkedIn posts", len(posts))
             
-            # Save posts
-            output_file = Path(self.config.DATA_DIR) / f"linkedin_posts_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            self.linkedin_scraper.save_posts(posts, str(output_file))
+            # Save posts (intermediate artifact, only kept when requested)
+            if self.config.SAVE_INTERMEDIATES:
+                output_file = self._data_dir / f"linkedin_posts_{self._output_timestamp()}.json"
+                self._dump(posts, output_file)
+                self._record_artifact('linkedin_posts', output_file)
             
             return posts
             
         except Exception as e:
-            self.logger.error(f"LinkedIn scraping failed: {str(e)}")
+            self.logger.error("LinkedIn scraping failed: %s", e)
             raise
-        finally:
-            # Cleanup
-            if hasattr(self.linkedin_scraper, 'close'):
-                self.linkedin_scraper.close()
     
     def scrape_reddit_posts(self) -> List[Dict]:
         """
@@ -172,6 +271,8 @@ class SocialMediaReaderApp:
         """
         self.logger.info("Starting Reddit post scraping from r/dataisbeautiful")
         
+        from src.scrapers.reddit_scraper import MockRedditScraper
+        
         try:
             # Setup Reddit client if needed
             if not isinstance(self.reddit_scraper, MockRedditScraper):
@@ -179,30 +280,31 @@ class SocialMediaReaderApp:
                 if not setup_success:
                     raise Exception("Reddit client setup failed")
             
-            # Scrape posts
-            posts = self.reddit_scraper.get_dataisbeautiful_posts(
+            # Scrape posts, filtering for high quality ones as they stream in
+            # so the unfiltered list is never materialized
+            posts = self.reddit_scraper.iter_dataisbeautiful_posts(
                 time_filter=self.config.REDDIT_TIME_FILTER,
                 limit=self.config.MAX_REDDIT_POSTS,
                 sort=self.config.REDDIT_SORT_METHOD
             )
-            
-            # Filter for high quality posts
             filtered_posts = self.reddit_scraper.filter_high_quality_posts(
                 posts,
                 min_score=self.config.MIN_POST_SCORE,
                 min_comments=self.config.MIN_POST_COMMENTS
             )
             
-            self.logger.info(f"Scraped {len(posts)} Reddit posts, {len(filtered_posts)} high quality")
+            self.logger.info("Scraped %d high quality Reddit posts", len(filtered_posts))
             
-            # Save posts
-            output_file = Path(self.config.DATA_DIR) / f"reddit_posts_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            self.reddit_scraper.save_posts(filtered_posts, str(output_file))
+            # Save posts (intermediate artifact, only kept when requested)
+            if self.config.SAVE_INTERMEDIATES:
+                output_file = self._data_dir / f"reddit_posts_{self._output_timestamp()}.json"
+                self._dump(filtered_posts, output_file)
+                self._record_artifact('reddit_posts', output_file)
             
             return filtered_posts
             
         except Exception as e:
-            self.logger.error(f"Reddit scraping failed: {str(e)}")
+            self.logger.error("Reddit scraping failed: %s", e)
             raise
     
     def analyze_writing_style(self, linkedin_posts: List[Dict]) -> Dict:
@@ -220,20 +322,94 @@ class SocialMediaReaderApp:
         try:
             style_profile = self.style_analyzer.analyze_posts(linkedin_posts)
             
-            # Generate style summary
-            style_summary = self.style_analyzer.generate_style_summary()
-            self.logger.info(f"Style analysis completed: {style_summary}")
+            # Generate style summary (only used for logging, so skip it when INFO is filtered)
+            if self.logger.isEnabledFor(logging.INFO):
+                style_summary = self.style_analyzer.generate_style_summary()
+                self.logger.info("Style analysis completed: %s", style_summary)
             
-            # Save style profile
-            output_file = Path(self.config.DATA_DIR) / f"style_profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            self.style_analyzer.save_style_profile(str(output_file))
+            # Save style profile (intermediate artifact, only kept when requested)
+            if self.config.SAVE_INTERMEDIATES:
+                output_file = self._data_dir / f"style_profile_{self._output_timestamp()}.json"
+                self._dump(style_profile, output_file)
+                self._record_artifact('style_profile', output_file)
             
             return style_profile
             
         except Exception as e:
-            self.logger.error(f"Style analysis failed: {str(e)}")
+            self.logger.error("Style analysis failed: %s", e)
             raise
     
+    def _read_style_cache(self) -> Dict:
+        """Read the style cache file, treating a missing or corrupt file as empty."""
+        try:
+            with open(self._style_cache_path, 'rb') as f:
+                cache = orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            return {}
+        
+        return cache if isinstance(cache, dict) else {}
+    
+    def _load_cached_style(self, profile_url: str) -> Optional[Dict]:
+        """
+        Look up the cached LinkedIn posts and style profile for a profile.
+        
+        Args:
+            profile_url: LinkedIn profile URL
+            
+        Returns:
+            Cache entry with 'linkedin_posts' and 'style_profile', or None if missing or stale
+        """
+        if not self.config.ENABLE_CACHE:
+            return None
+        
+        entry = self._read_style_cache().get(profile_url)
+        
+        if not entry or time.time() - entry.get('timestamp', 0) > self.config.STYLE_CACHE_TTL_HOURS * 3600:
+            return None
+        
+        return entry
+    
+    def _save_cached_style(self, profile_url: str, linkedin_posts: List[Dict], style_profile: Dict):
+        """
+        Store the LinkedIn posts and style profile for a profile in the style cache.
+        
+        Expired entries are dropped and only the STYLE_CACHE_MAX_PROFILES most recently
+        analyzed profiles are kept. The cache file is replaced atomically so a crash
+        never leaves it half-written.
+        
+        Args:
+            profile_url: LinkedIn profile URL
+            linkedin_posts: Scraped LinkedIn posts
+            style_profile: Style analysis profile
+        """
+        if not self.config.ENABLE_CACHE or not style_profile:
+            return
+        
+        now = time.time()
+        ttl_seconds = self.config.STYLE_CACHE_TTL_HOURS * 3600
+        cache = OrderedDict(
+            (url, entry) for url, entry in self._read_style_cache().items()
+            if url != profile_url and isinstance(entry, dict)
+            and now - entry.get('timestamp', 0) <= ttl_seconds
+        )
+        cache[profile_url] = {
+            'timestamp': now,
+            'linkedin_posts': linkedin_posts,
+            'style_profile': style_profile
+        }
+        
+        while len(cache) > self.STYLE_CACHE_MAX_PROFILES:
+            cache.popitem(last=False)
+        
+        tmp_path = self._style_cache_path.with_suffix('.json.tmp')
+        
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(cache, option=orjson.OPT_NON_STR_KEYS))
+            os.replace(tmp_path, self._style_cache_path)
+        except (OSError, TypeError) as e:
+            self.logger.warning("Failed to update style cache: %s", e)
+    
     def generate_content_summary(self, reddit_posts: List[Dict], style_profile: Dict) -> Dict:
         """
         Generate content summary of Reddit posts in user's style.
@@ -256,20 +432,36 @@ class SocialMediaReaderApp:
             
             self.logger.info("Content summarization completed")
             
-            # Save summary
-            output_file = Path(self.config.OUTPUT_DIR) / f"content_summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            self.content_summarizer.save_summary(summary_data, str(output_file))
+            # Save summary (intermediate artifact, only kept when requested)
+            if self.config.SAVE_INTERMEDIATES:
+                output_file = self._output_dir / f"content_summary_{self._output_timestamp()}.json"
+                self._dump(summary_data, output_file)
+                self._record_artifact('content_summary', output_file)
             
             return summary_data
             
         except Exception as e:
-            self.logger.error(f"Content summarization failed: {str(e)}")
+            self.logger.error("Content summarization failed: %s", e)
             raise
     
     def generate_linkedin_posts(self, summary_data: Dict, style_profile: Dict) -> Dict:
         """
         Generate LinkedIn posts from summary data.
         
+        Args:
+            summary_data: Content summary data
+            style_profile: User's writing style profile
+            
+        Returns:
+            Generated posts data
+        """
+        return asyncio.run(self.agenerate_linkedin_posts(summary_data, style_profile))
+    
+    async def agenerate_linkedin_posts(self, summary_data: Dict, style_profile: Dict) -> Dict:
+        """
+        Generate LinkedIn posts from summary data, issuing every post type
+        and the content calendar concurrently.
+        
         Args:
             summary_data: Content summary data
             style_profile: User's writing style profile
@@ -292,37 +484,57 @@ class SocialMediaReaderApp:
             if self.config.ENABLE_VIDEO_SCRIPTS:
                 post_types.append('video_script')
             
-            for post_type in post_types:
-                post = self.post_generator.generate_post_from_summary(
+            include_calendar = self.config.CONTENT_CALENDAR_DAYS > 0
+            if self.config.USE_BATCH_API:
+                results = await asyncio.to_thread(
+                    self.post_generator.generate_posts_batch,
                     summary_data,
                     style_profile,
-                    post_type=post_type
+                    post_types,
+                    calendar_days=self.config.CONTENT_CALENDAR_DAYS if include_calendar else 0
                 )
+            else:
+                results = await self._generate_all_posts_async(summary_data, style_profile, post_types, include_calendar)
+            
+            for post_type, post in zip(post_types, results):
                 generated_posts[post_type] = post
                 
-                self.logger.info(f"Generated {post_type} post")
+                self.logger.info("Generated %s post", post_type)
             
             # Generate content calendar if enabled
-            if self.config.CONTENT_CALENDAR_DAYS > 0:
-                calendar = self.post_generator.generate_content_calendar(
-                    summary_data,
-                    style_profile,
-                    days=self.config.CONTENT_CALENDAR_DAYS
-                )
-                generated_posts['content_calendar'] = calendar
-                self.logger.info(f"Generated {self.config.CONTENT_CALENDAR_DAYS}-day content calendar")
+            if include_calendar:
+                generated_posts['content_calendar'] = results[-1]
+                self.logger.info("Generated %s-day content calendar", self.config.CONTENT_CALENDAR_DAYS)
             
             # Save generated posts
-            output_file = Path(self.config.OUTPUT_DIR) / f"linkedin_posts_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            output_file = self._output_dir / f"linkedin_posts_{self._output_timestamp()}.json"
             self.post_generator.save_generated_content(generated_posts, str(output_file))
+            self._record_artifact('generated_posts', output_file)
             
             return generated_posts
             
         except Exception as e:
-            self.logger.error(f"LinkedIn post generation failed: {str(e)}")
+            self.logger.error("LinkedIn post generation failed: %s", e)
             raise
     
-    def run_full_pipeline(self, linkedin_profile_url: str) -> Dict:
+    async def _generate_all_posts_async(self, summary_data: Dict, style_profile: Dict,
+                                        post_types: List[str], include_calendar: bool) -> List:
+        """Run one completion per post type, plus the content calendar, concurrently."""
+        coros = [
+            self.post_generator.agenerate_post_from_summary(summary_data, style_profile, post_type=post_type)
+            for post_type in post_types
+        ]
+        
+        if include_calendar:
+            coros.append(self.post_generator.agenerate_content_calendar(
+                summary_data,
+                style_profile,
+                days=self.config.CONTENT_CALENDAR_DAYS
+            ))
+        
+        return await asyncio.gather(*coros)
+    
+    async def run_full_pipeline(self, linkedin_profile_url: str) -> Dict:
         """
         Run the complete pipeline from scraping to post generation.
         
@@ -332,32 +544,48 @@ class SocialMediaReaderApp:
         Returns:
             Complete pipeline results
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
+        self._run_timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        self._artifact_files = {}
         self.logger.info("Starting full Social Media Reader pipeline")
         
         try:
-            # Step 1: Initialize components
-            self.initialize_components()
-            
-            # Step 2: Scrape LinkedIn posts
-            linkedin_posts = self.scrape_linkedin_posts(linkedin_profile_url)
-            
-            # Step 3: Scrape Reddit posts
-            reddit_posts = self.scrape_reddit_posts()
-            
-            # Step 4: Analyze writing style
-            style_profile = self.analyze_writing_style(linkedin_posts)
+            # Step 1: Initialize components (once, so the scraper sessions are reused across runs)
+            if self.post_generator is None:
+                self.initialize_components()
+            
+            # A user's writing style is stable across runs, so a fresh cached profile
+            # skips the LinkedIn scrape (step 2) and the style analysis (step 4)
+            cached_style = self._load_cached_style(linkedin_profile_url)
+            
+            if cached_style is not None:
+                self.logger.info("Using cached style profile for: %s", linkedin_profile_url)
+                linkedin_posts = cached_style['linkedin_posts']
+                style_profile = cached_style['style_profile']
+                
+                # Step 3: Scrape Reddit posts
+                reddit_posts = await asyncio.to_thread(self.scrape_reddit_posts)
+            else:
+                # Steps 2 & 3: Scrape LinkedIn and Reddit posts concurrently (independent, I/O-bound)
+                linkedin_posts, reddit_posts = await asyncio.gather(
+                    asyncio.to_thread(self.scrape_linkedin_posts, linkedin_profile_url),
+                    asyncio.to_thread(self.scrape_reddit_posts)
+                )
+                
+                # Step 4: Analyze writing style
+                style_profile = self.analyze_writing_style(linkedin_posts)
+                self._save_cached_style(linkedin_profile_url, linkedin_posts, style_profile)
             
             # Step 5: Generate content summary
             summary_data = self.generate_content_summary(reddit_posts, style_profile)
             
             # Step 6: Generate LinkedIn posts
-            generated_posts = self.generate_linkedin_posts(summary_data, style_profile)
+            generated_posts = await self.agenerate_linkedin_posts(summary_data, style_profile)
             
             # Compile results
             pipeline_results = {
                 'execution_timestamp': datetime.now().isoformat(),
-                'execution_time_seconds': round(time.time() - start_time, 2),
+                'execution_time_seconds': round(time.perf_counter() - start_time, 2),
                 'config_summary': self.config.get_config_summary(),
                 'data_summary': {
                     'linkedin_posts_scraped': len(linkedin_posts),
@@ -365,7 +593,12 @@ class SocialMediaReaderApp:
                     'style_profile_generated': bool(style_profile),
                     'content_summary_generated': bool(summary_data),
                     'posts_generated': list(generated_posts.keys())
-                },
+                }
+            }
+            
+            # Outputs already written to their own file are referenced by path
+            # rather than serialized a second time
+            outputs = {
                 'linkedin_posts': linkedin_posts,
                 'reddit_posts': reddit_posts,
                 'style_profile': style_profile,
@@ -373,64 +606,113 @@ class SocialMediaReaderApp:
                 'generated_posts': generated_posts
             }
             
+            self._last_generated_posts = generated_posts
+            
+            for name, data in outputs.items():
+                if name in self._artifact_files:
+                    pipeline_results[f'{name}_file'] = self._artifact_files[name]
+                else:
+                    pipeline_results[name] = data
+            
             # Save complete results
-            results_file = Path(self.config.OUTPUT_DIR) / f"pipeline_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            with open(results_file, 'w', encoding='utf-8') as f:
-                json.dump(pipeline_results, f, indent=2, ensure_ascii=False)
+            results_file = self._output_dir / f"pipeline_results_{self._output_timestamp()}.json"
+            self._pending_write = self._io_executor.submit(
+                self._write_pipeline_results, pipeline_results, results_file
+            )
             
-            self.logger.info(f"Pipeline completed successfully in {pipeline_results['execution_time_seconds']} seconds")
-            self.logger.info(f"Results saved to: {results_file}")
+            self.logger.info("Pipeline completed successfully in %s seconds", pipeline_results['execution_time_seconds'])
             
             return pipeline_results
             
         except Exception as e:
-            self.logger.error(f"Pipeline failed: {str(e)}")
+            self.logger.error("Pipeline failed: %s", e)
             raise
     
+    def _write_pipeline_results(self, pipeline_results: Dict, results_file: Path):
+        """
+        Write the complete pipeline results to disk.
+        
+        Runs on the I/O executor; the results must not be mutated while it is pending.
+        
+        Args:
+            pipeline_results: Results returned by run_full_pipeline
+            results_file: Destination JSON file
+        """
+        # orjson encodes straight to UTF-8 bytes; a 1 MiB buffer writes them in large chunks
+        with open(results_file, 'wb', buffering=1024 * 1024) as f:
+            f.write(orjson.dumps(pipeline_results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        
+        self.logger.info("Results saved to: %s", results_file)
+    
+    def wait_for_pending_writes(self):
+        """Block until the background results write has finished, re-raising any error."""
+        if self._pending_write is not None:
+            pending, self._pending_write = self._pending_write, None
+            pending.result()
+    
+    def close(self):
+        """Release the scraper browser session and finish any pending results write."""
+        if self.linkedin_scraper is not None and hasattr(self.linkedin_scraper, 'close'):
+            self.linkedin_scraper.close()
+        self._linkedin_logged_in = False
+        
+        self._io_executor.shutdown(wait=True)
+    
     def display_results_summary(self, results: Dict):
         """
         Display a summary of pipeline results.
         
+        The summary is assembled first and written to stdout in one call, so it
+        is not interleaved with other output.
+        
         Args:
             results: Pipeline results dictionary
         """
-        print("\n" + "="*60)
-        print("           SOCIAL MEDIA READER RESULTS")
-        print("="*60)
-        
         data_summary = results.get('data_summary', {})
         
-        print(f"📊 Execution Time: {results.get('execution_time_seconds', 0)} seconds")
-        print(f"📱 LinkedIn Posts Analyzed: {data_summary.get('linkedin_posts_scraped', 0)}")
-        print(f"🔍 Reddit Posts Processed: {data_summary.get('reddit_posts_scraped', 0)}")
-        print(f"✍️  Posts Generated: {', '.join(data_summary.get('posts_generated', []))}")
+        lines = [
+            "",
+            HEADER_BAR,
+            "           SOCIAL MEDIA READER RESULTS",
+            HEADER_BAR,
+            f"📊 Execution Time: {results.get('execution_time_seconds', 0)} seconds",
+            f"📱 LinkedIn Posts Analyzed: {data_summary.get('linkedin_posts_scraped', 0)}",
+            f"🔍 Reddit Posts Processed: {data_summary.get('reddit_posts_scraped', 0)}",
+            f"✍️  Posts Generated: {', '.join(data_summary.get('posts_generated', []))}"
+        ]
         
-        # Display generated posts
-        generated_posts = results.get('generated_posts', {})
+        # Display generated posts (kept in memory when the results only reference the file)
+        generated_posts = self._last_generated_posts or results.get('generated_posts', {})
         
         if 'standard' in generated_posts:
             standard_post = generated_posts['standard']
-            print(f"\n📝 GENERATED LINKEDIN POST:")
-            print("-" * 40)
-            print(standard_post.get('content', ''))
-            print("-" * 40)
-            
             engagement = standard_post.get('estimated_engagement', {})
-            print(f"📈 Estimated Engagement:")
-            print(f"   Likes: {engagement.get('estimated_likes', 0)}")
-            print(f"   Comments: {engagement.get('estimated_comments', 0)}")
-            print(f"   Shares: {engagement.get('estimated_shares', 0)}")
+            lines += [
+                "",
+                "📝 GENERATED LINKEDIN POST:",
+                SUB_BAR,
+                standard_post.get('content', ''),
+                SUB_BAR,
+                "📈 Estimated Engagement:",
+                f"   Likes: {engagement.get('estimated_likes', 0)}",
+                f"   Comments: {engagement.get('estimated_comments', 0)}",
+                f"   Shares: {engagement.get('estimated_shares', 0)}"
+            ]
         
         if 'content_calendar' in generated_posts:
             calendar = generated_posts['content_calendar']
-            print(f"\n📅 CONTENT CALENDAR ({len(calendar)} days):")
-            for entry in calendar[:3]:  # Show first 3 days
-                print(f"   Day {entry['day']}: {entry['post_type']} post at {entry['suggested_post_time']}")
+            lines += ["", f"📅 CONTENT CALENDAR ({len(calendar)} days):"]
+            lines += [
+                f"   Day {entry['day']}: {entry['post_type']} post at {entry['suggested_post_time']}"
+                for entry in calendar[:3]  # Show first 3 days
+            ]
             if len(calendar) > 3:
-                print(f"   ... and {len(calendar) - 3} more days")
+                lines.append(f"   ... and {len(calendar) - 3} more days")
+        
+        lines += ["", f"💾 Full results saved to: {self.config.OUTPUT_DIR}", HEADER_BAR]
         
-        print(f"\n💾 Full results saved to: {self.config.OUTPUT_DIR}")
-        print("="*60)
+        sys.stdout.write('\n'.join(lines) + '\n')
+        sys.stdout.flush()
 
 
 def create_argument_parser() -> argparse.ArgumentParser:
@@ -498,6 +780,12 @@ Examples:
         help='Number of days for content calendar'
     )
     
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Bypass the on-disk completion cache and force fresh API calls'
+    )
+    
     parser.add_argument(
         '--version',
         action='version',
@@ -511,6 +799,7 @@ def main():
     """Main application entry point."""
     parser = create_argument_parser()
     args = parser.parse_args()
+    app = None
     
     try:
         # Load configuration
@@ -527,6 +816,9 @@ def main():
             app.config.LOG_LEVEL = args.log_level
         if args.calendar_days:
             app.config.CONTENT_CALENDAR_DAYS = args.calendar_days
+        if args.no_cache:
+            # Config properties read the environment, which the config file has already populated
+            os.environ['ENABLE_CACHE'] = 'false'
         
         # Ensure directories exist
         app.config.create_directories()
@@ -550,13 +842,14 @@ def main():
         print(f"Mode: {'Mock Data' if app.config.USE_MOCK_DATA else 'Live APIs'}")
         print(f"Output Directory: {app.config.OUTPUT_DIR}")
         print(f"LinkedIn Profile: {linkedin_profile or 'Mock Profile'}")
-        print("-" * 60)
+        print(FOOT_BAR)
         
         # Run pipeline
-        results = app.run_full_pipeline(linkedin_profile or "mock_profile")
+        results = asyncio.run(app.run_full_pipeline(linkedin_profile or "mock_profile"))
         
         # Display results
         app.display_results_summary(results)
+        app.wait_for_pending_writes()
         
         return 0
         
@@ -569,6 +862,9 @@ def main():
             import traceback
             traceback.print_exc()
         return 1
+    finally:
+        if app is not None:
+            app.close()
 
 
 if __name__ == '__main__':
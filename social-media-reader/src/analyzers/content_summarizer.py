@@ -1,29 +1,263 @@
 import openai
+import asyncio
+import hashlib
 import json
-from typing import List, Dict, Optional
+import re
+import orjson
+import numpy as np
+from collections import Counter, OrderedDict
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 import logging
 
+try:
+    import ahocorasick
+except ImportError:  # optional: keyword matching falls back to substring checks
+    ahocorasick = None
+
+from src.utils.completion_cache import CompletionCache
+from src.utils.openai_batch import create_batch_completion
+from src.utils.rate_limiter import AsyncRateLimiter, call_with_retries, estimate_request_tokens
+
 logger = logging.getLogger(__name__)
 
 
+# Tools and data sources counted in post titles
+TOOL_PATTERN = re.compile(r'\b(python|r|javascript|d3|tableau|excel|sql|pandas|numpy)\b')
+SOURCE_PATTERN = re.compile(r'\b(nasa|census|who|world bank|github|kaggle|netflix|spotify)\b')
+
+
 class ContentSummarizer:
     """
     AI-powered content summarizer that processes Reddit posts from r/dataisbeautiful
     and creates summaries in the user's writing style.
     """
     
-    def __init__(self, openai_api_key: str, model: str = "gpt-4"):
+    # Content categories in priority order; a post goes to the first one whose keywords it contains
+    CATEGORY_KEYWORDS = {
+        'data_visualizations': ('visualization', 'chart', 'graph', 'plot', '[oc]'),
+        'datasets_and_tools': ('dataset', 'data source', 'api', 'tool', 'library'),
+        'analysis_and_insights': ('analysis', 'research', 'study', 'findings'),
+        'tutorials_and_guides': ('tutorial', 'how to', 'guide', 'learn'),
+        'trends_and_patterns': ('trend', 'pattern', 'over time', 'years')
+    }
+    FALLBACK_CATEGORY = 'personal_projects'
+    
+    # Common themes in r/dataisbeautiful
+    THEME_KEYWORDS = {
+        'Climate & Environment': ('climate', 'temperature', 'carbon', 'emission', 'weather', 'global warming'),
+        'Technology & AI': ('ai', 'machine learning', 'algorithm', 'tech', 'software', 'coding'),
+        'Economics & Finance': ('salary', 'income', 'gdp', 'stock', 'economy', 'finance', 'money'),
+        'Health & Demographics': ('covid', 'health', 'population', 'age', 'demographics', 'life expectancy'),
+        'Entertainment & Media': ('movie', 'netflix', 'spotify', 'youtube', 'tv', 'music', 'game'),
+        'Sports & Competition': ('olympic', 'sport', 'football', 'basketball', 'soccer', 'competition')
+    }
+    
+    # Data science/visualization keywords counted in post titles
+    TRENDING_KEYWORDS = (
+        'python', 'r', 'javascript', 'tableau', 'matplotlib', 'seaborn', 'plotly',
+        'covid', 'climate', 'temperature', 'salary', 'income', 'population',
+        'election', 'sports', 'netflix', 'spotify', 'uber', 'tesla',
+        'machine learning', 'ai', 'neural network', 'algorithm'
+    )
+    
+    def __init__(self, openai_api_key: str, model: str = "gpt-4", use_batch_api: bool = False,
+                 completion_cache: Optional[CompletionCache] = None,
+                 max_requests_per_minute: float = 500,
+                 max_tokens_per_minute: float = 30000,
+                 max_attempts: int = 5,
+                 use_semantic_cache: bool = False,
+                 embed_model: str = "text-embedding-3-small",
+                 sim_threshold: float = 0.92,
+                 semantic_cache_size: int = 1000,
+                 response_cache_size: int = 10000,
+                 deterministic: bool = False,
+                 rewrite_model: str = "gpt-4o-mini",
+                 client: Optional[openai.OpenAI] = None,
+                 async_client: Optional[openai.AsyncOpenAI] = None):
         """
         Initialize the content summarizer.
         
         Args:
             openai_api_key: OpenAI API key
             model: OpenAI model to use for summarization
+            use_batch_api: Route completions through the OpenAI Batch API
+            completion_cache: Optional on-disk cache for completions
+            max_requests_per_minute: Request budget for concurrent async completions
+            max_tokens_per_minute: Token budget for concurrent async completions
+            max_attempts: Attempts per async completion on rate limit or transient errors
+            use_semantic_cache: Reuse styled summaries generated for near-identical content
+            embed_model: OpenAI embedding model for the semantic cache
+            sim_threshold: Cosine similarity above which a cached summary is reused
+            semantic_cache_size: Maximum number of summaries kept in the semantic cache
+            response_cache_size: Maximum number of completions kept in memory for identical
+                requests (0 disables the in-memory cache)
+            deterministic: Sample at temperature 0 so identical inputs give identical,
+                cacheable completions (e.g. for regression tests)
+            rewrite_model: Cheaper OpenAI model for refocusing an existing summary
+            client: Shared OpenAI client, built with max_retries=0 as failed requests are
+                retried here; one is created from the API key when not given
+            async_client: Shared async OpenAI client, likewise built with max_retries=0;
+                one is created on first async use when not given
         """
-        self.client = openai.OpenAI(api_key=openai_api_key)
+        self.client = client if client is not None else openai.OpenAI(api_key=openai_api_key, max_retries=0)
         self.model = model
+        self.rewrite_model = rewrite_model
+        self.use_batch_api = use_batch_api
+        self.completion_cache = completion_cache
+        self._openai_api_key = openai_api_key
+        self._async_client = async_client
+        self.rate_limiter = AsyncRateLimiter(
+            max_requests_per_minute=max_requests_per_minute,
+            max_tokens_per_minute=max_tokens_per_minute,
+            max_attempts=max_attempts
+        )
+        
+        # In-memory LRU of (normalized embedding, summary) keyed by a hash of the embedded text
+        self.use_semantic_cache = use_semantic_cache
+        self.embed_model = embed_model
+        self.sim_threshold = sim_threshold
+        self.semantic_cache_size = semantic_cache_size
+        self._semantic_cache: OrderedDict = OrderedDict()
+        
+        # In-memory LRU of completions keyed by a SHA256 of the exact request,
+        # in front of the on-disk completion cache
+        self.response_cache_size = response_cache_size
+        self._response_cache: OrderedDict = OrderedDict()
+        self.temperature = 0 if deterministic else 0.7
+        
+        # Keyword -> [(bucket type, bucket name)] for single-pass categorization
+        self._keyword_index = self._build_keyword_index()
+        self._keyword_automaton = self._build_keyword_automaton(self._keyword_index)
+        
+    def _cached_response(self, key: str):
+        """Return the in-memory completion for a request key, marking it recently used."""
+        response = self._response_cache.get(key)
+        if response is not None:
+            self._response_cache.move_to_end(key)
+        return response
+    
+    def _cache_response(self, key: str, response):
+        """Keep a completion in memory, evicting the least recently used above capacity."""
+        if self.response_cache_size <= 0:
+            return
+        
+        self._response_cache[key] = response
+        self._response_cache.move_to_end(key)
+        
+        while len(self._response_cache) > self.response_cache_size:
+            self._response_cache.popitem(last=False)
+    
+    def _create_completion(self, **request):
+        """Create a chat completion, through the completion caches and the Batch API when enabled."""
+        key = CompletionCache.make_key(request)
+        cached = self._cached_response(key)
+        if cached is not None:
+            return cached
+        
+        if self.completion_cache is not None:
+            cached = self.completion_cache.get(request)
+            if cached is not None:
+                return cached
+        
+        if self.use_batch_api:
+            response = create_batch_completion(self.client, request)
+        else:
+            # Retry throttled or transient failures before callers fall back
+            response = call_with_retries(
+                lambda: self.client.chat.completions.create(**request),
+                max_attempts=self.rate_limiter.max_attempts,
+                base_delay=self.rate_limiter.base_delay,
+                max_delay=self.rate_limiter.max_delay
+            )
+        
+        if self.completion_cache is not None:
+            self.completion_cache.set(request, response)
+        self._cache_response(key, response)
+        return response
+    
+    async def _acreate_completion(self, **request):
+        """Async variant of _create_completion using the async OpenAI client."""
+        if self.use_batch_api:
+            return await asyncio.to_thread(self._create_completion, **request)
+        
+        key = CompletionCache.make_key(request)
+        cached = self._cached_response(key)
+        if cached is not None:
+            return cached
+        
+        if self.completion_cache is not None:
+            cached = self.completion_cache.get(request)
+            if cached is not None:
+                return cached
+        
+        # Concurrent requests are throttled to the RPM/TPM budgets and retried on rate limits
+        response = await self.rate_limiter.run(
+            lambda: self.async_client.chat.completions.create(**request),
+            estimate_request_tokens(request)
+        )
+        
+        if self.completion_cache is not None:
+            self.completion_cache.set(request, response)
+        self._cache_response(key, response)
+        return response
+    
+    def _embed(self, text: str) -> Optional[np.ndarray]:
+        """Embed text for the semantic cache, returning a unit vector or None on failure."""
+        try:
+            response = call_with_retries(
+                lambda: self.client.embeddings.create(model=self.embed_model, input=text),
+                max_attempts=self.rate_limiter.max_attempts,
+                base_delay=self.rate_limiter.base_delay,
+                max_delay=self.rate_limiter.max_delay
+            )
+            embedding = np.asarray(response.data[0].embedding, dtype=np.float32)
+            return embedding / np.linalg.norm(embedding)
+        except Exception as e:
+            logger.warning(f"Failed to embed semantic cache probe: {str(e)}")
+            return None
+    
+    def _semantic_cache_lookup(self, embedding: np.ndarray) -> Optional[str]:
+        """
+        Find a cached summary whose embedding is similar enough to the probe.
+        
+        Args:
+            embedding: Normalized embedding of the cache probe
+            
+        Returns:
+            Cached summary text, or None on a miss
+        """
+        if not self._semantic_cache:
+            return None
+        
+        keys = list(self._semantic_cache)
+        # Embeddings are normalized, so one matrix-vector product gives every cosine similarity
+        similarities = np.stack([self._semantic_cache[key][0] for key in keys]) @ embedding
+        best = int(np.argmax(similarities))
         
+        if similarities[best] < self.sim_threshold:
+            return None
+        
+        self._semantic_cache.move_to_end(keys[best])
+        logger.debug(f"Semantic cache hit (similarity {similarities[best]:.3f})")
+        return self._semantic_cache[keys[best]][1]
+    
+    def _semantic_cache_store(self, cache_probe: str, embedding: np.ndarray, summary: str):
+        """Store a summary in the semantic cache, evicting the least recently used above capacity."""
+        key = hashlib.sha256(cache_probe.encode('utf-8')).hexdigest()
+        self._semantic_cache[key] = (embedding, summary)
+        self._semantic_cache.move_to_end(key)
+        
+        while len(self._semantic_cache) > self.semantic_cache_size:
+            self._semantic_cache.popitem(last=False)
+    
+    @property
+    def async_client(self) -> openai.AsyncOpenAI:
+        """Async OpenAI client, the injected one or created on first use by the async generation methods."""
+        if self._async_client is None:
+            self._async_client = openai.AsyncOpenAI(api_key=self._openai_api_key, max_retries=0)
+        return self._async_client
+    
     def summarize_reddit_content(self, reddit_posts: List[Dict], 
                                 style_profile: Dict, 
                                 max_posts_to_analyze: int = 20) -> Dict:
@@ -47,11 +281,8 @@ class ContentSummarizer:
         # Select top posts for analysis
         top_posts = self._select_top_posts(reddit_posts, max_posts_to_analyze)
         
-        # Categorize content
-        categorized_content = self._categorize_content(top_posts)
-        
-        # Generate insights and trends
-        insights = self._extract_insights(top_posts)
+        # Categorize content and generate insights and trends in one pass
+        categorized_content, insights = self._analyze_posts(top_posts)
         
         # Create styled summary
         summary = self._generate_styled_summary(categorized_content, insights, style_profile)
@@ -66,7 +297,7 @@ class ContentSummarizer:
                 'style_applied': True
             },
             'insights': insights,
-            'categorized_content': categorized_content
+            'categorized_content': self._compact_categorized_content(categorized_content)
         }
     
     def _select_top_posts(self, posts: List[Dict], max_posts: int) -> List[Dict]:
@@ -93,91 +324,143 @@ class ContentSummarizer:
                 engagement_score *= 1.5
             
             # Penalize deleted/removed content
-            if post.get('author') in ['[deleted]', '[removed]']:
+            if post.get('author') in ('[deleted]', '[removed]'):
                 engagement_score *= 0.1
             
             return engagement_score
         
-        sorted_posts = sorted(posts, key=calculate_engagement_score, reverse=True)
-        return sorted_posts[:max_posts]
+        n = len(posts)
+        engagement = np.fromiter((calculate_engagement_score(post) for post in posts), dtype=np.float64, count=n)
+        
+        if 0 < max_posts < n:
+            # Select the top posts in O(N) before sorting them; ties at the cut-off
+            # keep their original order, as with a stable sort of every post
+            threshold = np.partition(engagement, n - max_posts)[n - max_posts]
+            above = np.flatnonzero(engagement > threshold)
+            at_threshold = np.flatnonzero(engagement == threshold)[:max_posts - len(above)]
+            candidates = np.sort(np.concatenate([above, at_threshold]))
+        else:
+            candidates = np.arange(n)
+        
+        order = candidates[np.argsort(-engagement[candidates], kind='stable')]
+        return [posts[i] for i in order[:max_posts]]
     
-    def _categorize_content(self, posts: List[Dict]) -> Dict[str, List[Dict]]:
+    def _analyze_posts(self, posts: List[Dict]) -> Tuple[Dict[str, List[Dict]], Dict]:
         """
-        Categorize Reddit posts by content type and theme.
+        Categorize posts and extract insights and content themes in a single pass.
+        
+        Each post's text is lowercased once and probed once per distinct keyword,
+        instead of being rescanned by every categorization helper.
         
         Args:
             posts: List of Reddit posts
             
         Returns:
-            Dictionary with categorized posts
-        """
-        categories = {
-            'data_visualizations': [],
-            'datasets_and_tools': [],
-            'analysis_and_insights': [],
-            'tutorials_and_guides': [],
-            'trends_and_patterns': [],
-            'personal_projects': []
-        }
-        
-        for post in posts:
+            Tuple of (categorized posts, insights including content themes)
+        """
+        categories = {category: [] for category in self.CATEGORY_KEYWORDS}
+        categories[self.FALLBACK_CATEGORY] = []
+        theme_posts = {theme: [] for theme in self.THEME_KEYWORDS}
+        keyword_counts = Counter()
+        tool_counts = Counter()
+        source_counts = Counter()
+        
+        for i, post in enumerate(posts):
             title = post.get('title', '').lower()
-            selftext = post.get('selftext', '').lower()
-            combined_text = f"{title} {selftext}"
-            
-            # Categorization logic
-            if any(keyword in combined_text for keyword in ['visualization', 'chart', 'graph', 'plot', '[oc]']):
-                categories['data_visualizations'].append(post)
-            elif any(keyword in combined_text for keyword in ['dataset', 'data source', 'api', 'tool', 'library']):
-                categories['datasets_and_tools'].append(post)
-            elif any(keyword in combined_text for keyword in ['analysis', 'research', 'study', 'findings']):
-                categories['analysis_and_insights'].append(post)
-            elif any(keyword in combined_text for keyword in ['tutorial', 'how to', 'guide', 'learn']):
-                categories['tutorials_and_guides'].append(post)
-            elif any(keyword in combined_text for keyword in ['trend', 'pattern', 'over time', 'years']):
-                categories['trends_and_patterns'].append(post)
-            else:
-                categories['personal_projects'].append(post)
-        
-        return categories
+            for keyword in self.TRENDING_KEYWORDS:
+                keyword_counts[keyword] += title.count(keyword)
+            tool_counts.update(TOOL_PATTERN.findall(title))
+            source_counts.update(SOURCE_PATTERN.findall(title))
+            category, themes = self._match_buckets(f"{title} {post.get('selftext', '').lower()}")
+            
+            categories[category].append(post)
+            for theme in themes:
+                theme_posts[theme].append(i)
+        
+        insights = self._build_insights(
+            posts, keyword_counts, tool_counts, source_counts, self._build_content_themes(posts, theme_posts)
+        )
+        return categories, insights
     
-    def _extract_insights(self, posts: List[Dict]) -> Dict:
+    def _match_buckets(self, combined_text: str) -> Tuple[str, set]:
         """
-        Extract key insights and trending topics from Reddit posts.
+        Find the category and themes whose keywords occur in a post's lowercased text.
         
         Args:
-            posts: List of Reddit posts
+            combined_text: Lowercased title and selftext
             
         Returns:
-            Dictionary with insights and trends
+            Tuple of (first matching category, set of matching themes)
         """
-        from collections import Counter
-        import re
-        
-        # Extract trending topics
-        all_titles = ' '.join([post.get('title', '') for post in posts]).lower()
+        if self._keyword_automaton is not None:
+            # One linear scan finds every (possibly overlapping) keyword occurrence
+            matched = {keyword for _, keyword in self._keyword_automaton.iter(combined_text)}
+        else:
+            matched = [keyword for keyword in self._keyword_index if keyword in combined_text]
+        
+        buckets = set()
+        for keyword in matched:
+            buckets.update(self._keyword_index[keyword])
+        
+        category = next(
+            (category for category in self.CATEGORY_KEYWORDS if ('category', category) in buckets),
+            self.FALLBACK_CATEGORY
+        )
+        themes = {name for bucket_type, name in buckets if bucket_type == 'theme'}
+        return category, themes
+    
+    @classmethod
+    def _build_keyword_index(cls) -> Dict[str, List[Tuple[str, str]]]:
+        """Map every category and theme keyword to the buckets it belongs to."""
+        index = {}
+        for bucket_type, bucket_keywords in (('category', cls.CATEGORY_KEYWORDS), ('theme', cls.THEME_KEYWORDS)):
+            for name, keywords in bucket_keywords.items():
+                for keyword in keywords:
+                    index.setdefault(keyword, []).append((bucket_type, name))
+        return index
+    
+    @staticmethod
+    def _build_keyword_automaton(keyword_index: Dict):
+        """
+        Build an Aho-Corasick automaton over every keyword when pyahocorasick is installed.
         
-        # Data science/visualization keywords
-        keywords = [
-            'python', 'r', 'javascript', 'tableau', 'matplotlib', 'seaborn', 'plotly',
-            'covid', 'climate', 'temperature', 'salary', 'income', 'population',
-            'election', 'sports', 'netflix', 'spotify', 'uber', 'tesla',
-            'machine learning', 'ai', 'neural network', 'algorithm'
-        ]
+        Without it, each keyword is checked with a substring search; those run in C
+        and beat a regex alternation, so no pure-Python matcher is used instead.
+        """
+        if ahocorasick is None:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for keyword in keyword_index:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return automaton
+    
+    def _build_insights(self, posts: List[Dict], keyword_counts: Counter, tool_counts: Counter,
+                        source_counts: Counter, content_themes: List[Dict]) -> Dict:
+        """
+        Build insights from the posts and the mentions counted in their titles.
         
-        keyword_mentions = {}
-        for keyword in keywords:
-            count = all_titles.count(keyword)
-            if count > 0:
-                keyword_mentions[keyword] = count
+        Args:
+            posts: List of Reddit posts
+            keyword_counts: Trending keyword mentions counted per title
+            tool_counts: Tool/technology mentions counted per title
+            source_counts: Data source mentions counted per title
+            content_themes: Content themes identified for the posts
+            
+        Returns:
+            Dictionary with insights and trends
+        """
+        # Keep TRENDING_KEYWORDS order so ties rank the same way
+        keyword_mentions = {
+            keyword: keyword_counts[keyword] for keyword in self.TRENDING_KEYWORDS if keyword_counts[keyword] > 0
+        }
         
         # Top tools/technologies mentioned
-        tool_patterns = re.findall(r'\b(python|r|javascript|d3|tableau|excel|sql|pandas|numpy)\b', all_titles)
-        top_tools = Counter(tool_patterns).most_common(5)
+        top_tools = tool_counts.most_common(5)
         
         # Popular data sources
-        source_patterns = re.findall(r'\b(nasa|census|who|world bank|github|kaggle|netflix|spotify)\b', all_titles)
-        popular_sources = Counter(source_patterns).most_common(5)
+        popular_sources = source_counts.most_common(5)
         
         # Calculate average engagement
         avg_score = sum(post.get('score', 0) for post in posts) / len(posts) if posts else 0
@@ -192,39 +475,25 @@ class ContentSummarizer:
                 'avg_comments': round(avg_comments, 1),
                 'total_posts_analyzed': len(posts)
             },
-            'content_themes': self._identify_content_themes(posts)
+            'content_themes': content_themes
         }
     
-    def _identify_content_themes(self, posts: List[Dict]) -> List[Dict]:
+    def _build_content_themes(self, posts: List[Dict], theme_posts: Dict[str, List[int]]) -> List[Dict]:
         """
-        Identify major content themes from the posts.
+        Summarize the posts matched to each theme.
         
         Args:
-            posts: List of Reddit posts
+            posts: Posts that were matched
+            theme_posts: Indices into posts matching each theme, in THEME_KEYWORDS order
             
         Returns:
-            List of theme dictionaries
+            List of theme dictionaries, most common first
         """
         themes = []
         
-        # Common themes in r/dataisbeautiful
-        theme_keywords = {
-            'Climate & Environment': ['climate', 'temperature', 'carbon', 'emission', 'weather', 'global warming'],
-            'Technology & AI': ['ai', 'machine learning', 'algorithm', 'tech', 'software', 'coding'],
-            'Economics & Finance': ['salary', 'income', 'gdp', 'stock', 'economy', 'finance', 'money'],
-            'Health & Demographics': ['covid', 'health', 'population', 'age', 'demographics', 'life expectancy'],
-            'Entertainment & Media': ['movie', 'netflix', 'spotify', 'youtube', 'tv', 'music', 'game'],
-            'Sports & Competition': ['olympic', 'sport', 'football', 'basketball', 'soccer', 'competition']
-        }
-        
-        for theme_name, keywords in theme_keywords.items():
-            matching_posts = []
-            for post in posts:
-                title_text = f"{post.get('title', '')} {post.get('selftext', '')}".lower()
-                if any(keyword in title_text for keyword in keywords):
-                    matching_posts.append(post)
-            
-            if matching_posts:
+        for theme_name, indices in theme_posts.items():
+            if indices:
+                matching_posts = [posts[i] for i in indices]
                 avg_engagement = sum(p.get('score', 0) for p in matching_posts) / len(matching_posts)
                 themes.append({
                     'theme': theme_name,
@@ -263,8 +532,21 @@ class ContentSummarizer:
             # Prepare content for summarization
             content_summary = self._prepare_content_for_ai(categorized_content, insights)
             
-            # Create style instruction
+            # Create style instruction; it leads the messages as a static block so OpenAI
+            # prompt caching can reuse it once the prompt reaches the 1024-token minimum
             style_instruction = self._create_style_instruction(style_profile)
+            # Near-identical content in the same style reuses an earlier summary
+            cache_probe = f"{content_summary}|{style_instruction}"
+            probe_embedding = self._embed(cache_probe) if self.use_semantic_cache else None
+            if probe_embedding is not None:
+                cached_summary = self._semantic_cache_lookup(probe_embedding)
+                if cached_summary is not None:
+                    return cached_summary
+            
+            static_prefix = f"""You are an expert LinkedIn content creator who specializes in data science and technology topics.
+
+Writing Style Guidelines:
+{style_instruction}"""
             
             prompt = f"""
             Create a LinkedIn post that summarizes the latest trends from r/dataisbeautiful. 
@@ -272,9 +554,6 @@ class ContentSummarizer:
             Content to summarize:
             {content_summary}
             
-            Writing Style Guidelines:
-            {style_instruction}
-            
             Requirements:
             1. Write in the specified tone and style
             2. Include 2-3 key insights or trends
@@ -286,22 +565,49 @@ class ContentSummarizer:
             Write the LinkedIn post now:
             """
             
-            response = self.client.chat.completions.create(
+            response = self._create_completion(
                 model=self.model,
                 messages=[
-                    {"role": "system", "content": "You are an expert LinkedIn content creator who specializes in data science and technology topics."},
+                    {"role": "system", "content": static_prefix},
                     {"role": "user", "content": prompt}
                 ],
-                temperature=0.7,
+                prompt_cache_key=hashlib.sha256(static_prefix.encode('utf-8')).hexdigest(),
+                temperature=self.temperature,
                 max_tokens=500
             )
             
-            return response.choices[0].message.content.strip()
+            summary = response.choices[0].message.content.strip()
+            
+            if probe_embedding is not None:
+                self._semantic_cache_store(cache_probe, probe_embedding, summary)
+            
+            return summary
             
         except Exception as e:
             logger.error(f"Failed to generate styled summary: {str(e)}")
             return self._generate_fallback_summary(categorized_content, insights)
     
+    def _compact_categorized_content(self, categorized_content: Dict[str, List[Dict]]) -> Dict[str, List[Dict]]:
+        """
+        Reduce categorized posts to the fields needed to identify them in saved output.
+        
+        The full posts are already part of the pipeline results, so repeating them
+        under every summary would only inflate the serialized output.
+        
+        Args:
+            categorized_content: Categorized posts
+            
+        Returns:
+            Categories mapped to {id, title, score} references
+        """
+        return {
+            category: [
+                {'id': post.get('id'), 'title': post.get('title', ''), 'score': post.get('score', 0)}
+                for post in posts
+            ]
+            for category, posts in categorized_content.items()
+        }
+    
     def _prepare_content_for_ai(self, categorized_content: Dict, insights: Dict) -> str:
         """
         Prepare structured content summary for AI processing.
@@ -441,10 +747,18 @@ class ContentSummarizer:
         Returns:
             List of summary variations
         """
-        variations = []
-        
-        # Generate base summary
-        base_summary = self.summarize_reddit_content(reddit_posts, style_profile)
+        return asyncio.run(self.agenerate_multiple_variations(reddit_posts, style_profile, num_variations))
+    
+    async def agenerate_multiple_variations(self, reddit_posts: List[Dict], 
+                                          style_profile: Dict, 
+                                          num_variations: int = 3) -> List[Dict]:
+        """
+        Async variant of generate_multiple_variations that rewrites the base
+        summary for every angle concurrently.
+        """
+        # Generate base summary once; every variation rewrites it
+        base_summary = await asyncio.to_thread(self.summarize_reddit_content, reddit_posts, style_profile)
+        base_text = base_summary.get('summary', '')
         
         # Create variations with different focuses
         focus_angles = [
@@ -452,56 +766,107 @@ class ContentSummarizer:
             "interesting datasets and findings",
             "visualization techniques and best practices"
         ]
+        angles = [focus_angles[i % len(focus_angles)] for i in range(num_variations)]
         
-        for i in range(num_variations):
-            angle = focus_angles[i % len(focus_angles)]
-            
-            # Modify the generation to focus on specific angle
-            variation = self._generate_focused_summary(reddit_posts, style_profile, angle)
-            variations.append({
+        try:
+            # Rewrite for every angle in a single request
+            response = await self._acreate_completion(**self._focused_summaries_request(base_text, angles))
+            summaries = self._focused_summaries_from_response(response.choices[0].message.content, angles)
+        except Exception as e:
+            logger.warning(f"Batched focused summaries failed, rewriting per angle: {str(e)}")
+            summaries = await asyncio.gather(*[
+                self._agenerate_focused_summary(base_text, angle) for angle in angles
+            ])
+        
+        return [
+            {
                 'variation': i + 1,
                 'focus': angle,
-                'summary': variation,
+                'summary': summary,
                 'timestamp': datetime.now().isoformat()
-            })
+            }
+            for i, (angle, summary) in enumerate(zip(angles, summaries))
+        ]
+    
+    def _focused_summaries_request(self, base_summary: str, focus_angles: List[str]) -> Dict:
+        """Build a single chat completion request rewriting the summary for every angle."""
+        angle_list = '\n            '.join(f"{i + 1}. {angle}" for i, angle in enumerate(focus_angles))
         
-        return variations
+        focused_prompt = f"""
+            Take this summary and rewrite it once for each of the following focus angles:
+            {angle_list}
+            
+            Original summary:
+            {base_summary}
+            
+            Keep the same writing style in every rewrite but emphasize its focus angle.
+            
+            Respond with a JSON object of the form
+            {{"variations": [{{"focus": "...", "summary": "..."}}]}}
+            containing exactly one entry per focus angle, in the order listed.
+            """
+        
+        return {
+            'model': self.rewrite_model,
+            'messages': [
+                {"role": "system", "content": "You are an expert at adapting content focus while maintaining writing style."},
+                {"role": "user", "content": focused_prompt}
+            ],
+            'temperature': self.temperature,
+            'max_tokens': min(400 * len(focus_angles), 4096),
+            'response_format': {"type": "json_object"}
+        }
     
-    def _generate_focused_summary(self, reddit_posts: List[Dict], 
-                                 style_profile: Dict, 
-                                 focus_angle: str) -> str:
+    def _focused_summaries_from_response(self, content: str, focus_angles: List[str]) -> List[str]:
         """
-        Generate a summary focused on a specific angle or theme.
+        Extract the focused rewrites from a batched completion.
+        
+        Raises:
+            ValueError: If the response does not hold one rewrite per focus angle
+        """
+        entries = json.loads(content).get('variations')
+        
+        if not isinstance(entries, list) or len(entries) != len(focus_angles):
+            raise ValueError(f"Expected {len(focus_angles)} variations in the response")
+        
+        summaries = []
+        
+        for i, entry in enumerate(entries):
+            summary = entry.get('summary') if isinstance(entry, dict) else None
+            if not isinstance(summary, str) or not summary.strip():
+                raise ValueError(f"Variation {i + 1} has no summary")
+            summaries.append(summary.strip())
+        
+        return summaries
+    
+    async def _agenerate_focused_summary(self, base_summary: str, focus_angle: str) -> str:
+        """
+        Rewrite a summary to focus on a specific angle or theme.
         
         Args:
-            reddit_posts: List of Reddit posts
-            style_profile: User's writing style profile
+            base_summary: Summary text to rewrite
             focus_angle: Specific angle to focus on
             
         Returns:
             Focused summary string
         """
-        # This would be similar to the main summary generation
-        # but with modified prompts to focus on the specific angle
-        base_summary = self.summarize_reddit_content(reddit_posts, style_profile)
-        
         try:
             focused_prompt = f"""
             Take this summary and rewrite it to focus specifically on: {focus_angle}
             
             Original summary:
-            {base_summary.get('summary', '')}
+            {base_summary}
             
             Keep the same writing style but emphasize the {focus_angle} aspect.
             """
             
-            response = self.client.chat.completions.create(
-                model=self.model,
+            response = await self._acreate_completion(
+                model=self.rewrite_model,
                 messages=[
                     {"role": "system", "content": "You are an expert at adapting content focus while maintaining writing style."},
                     {"role": "user", "content": focused_prompt}
                 ],
-                temperature=0.7,
+                temperature=self.temperature,
                 max_tokens=400
             )
             
@@ -509,13 +874,14 @@ class ContentSummarizer:
             
         except Exception as e:
             logger.error(f"Failed to generate focused summary: {str(e)}")
-            return base_summary.get('summary', 'Unable to generate focused summary.')
+            return base_summary or 'Unable to generate focused summary.'
     
     def save_summary(self, summary_data: Dict, filename: str = "reddit_summary.json"):
         """Save the generated summary to a JSON file."""
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(summary_data, f, indent=2, ensure_ascii=False)
+            # orjson encodes straight to UTF-8 bytes, much faster than json.dump with indent
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(summary_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
             logger.info(f"Summary saved to {filename}")
         except Exception as e:
             logger.error(f"Failed to save summary: {str(e)}")
\ No newline at end of file
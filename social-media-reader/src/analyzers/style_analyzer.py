@@ -3,12 +3,49 @@ import json
 import re
 from typing import List, Dict, Optional, Tuple
 from collections import Counter
-import statistics
+from concurrent.futures import ThreadPoolExecutor
 import logging
+import numpy as np
+import orjson
 from textstat import flesch_reading_ease, flesch_kincaid_grade, automated_readability_index
 
+try:
+    import ahocorasick
+except ImportError:  # optional: theme keywords fall back to per-keyword counting
+    ahocorasick = None
+
+from src.utils.completion_cache import CompletionCache
+from src.utils.openai_batch import create_batch_completion, run_chat_batch
+from src.utils.rate_limiter import call_with_retries
+
 logger = logging.getLogger(__name__)
 
+# Text patterns shared by the linguistic and structural analyses
+SENTENCE_SPLIT_PATTERN = re.compile(r'[.!?]+')
+WORD_PATTERN = re.compile(r'\b\w+\b')
+EMOJI_PATTERN = re.compile(r'[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF\U0001F1E0-\U0001F1FF]')
+HASHTAG_PATTERN = re.compile(r'#\w+')
+MENTION_PATTERN = re.compile(r'@\w+')
+URL_PATTERN = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+NUMBERED_LIST_PATTERN = re.compile(r'\d+[\.\)]\s')
+BULLET_PATTERN = re.compile(r'[•·▪▫-]\s|\n\s*[-*]\s')
+
+# Call-to-action phrases, matched against lowercased text in a single alternation
+CTA_PATTERN = re.compile('|'.join([
+    r'what do you think\?',
+    r'share your thoughts',
+    r'let me know',
+    r'comment below',
+    r'thoughts\?',
+    r'what\'s your experience',
+    r'agree or disagree\?'
+]))
+
+
+def _mean(values) -> float:
+    """Arithmetic mean of the values, or 0 when there are none."""
+    return sum(values) / len(values) if values else 0
+
 
 class WritingStyleAnalyzer:
     """
@@ -16,18 +53,65 @@ class WritingStyleAnalyzer:
     and can mimic the writing style for new content generation.
     """
     
-    def __init__(self, openai_api_key: str, model: str = "gpt-4"):
+    # Professional themes
+    PROFESSIONAL_KEYWORDS = {
+        'career': ('career', 'job', 'work', 'profession', 'experience', 'role'),
+        'learning': ('learn', 'education', 'skill', 'knowledge', 'growth', 'development'),
+        'technology': ('tech', 'technology', 'digital', 'ai', 'data', 'software', 'coding'),
+        'leadership': ('lead', 'leadership', 'manage', 'team', 'mentor', 'coach'),
+        'networking': ('network', 'connect', 'relationship', 'community', 'collaboration'),
+        'success': ('success', 'achievement', 'goal', 'accomplish', 'win', 'victory'),
+        'insights': ('insight', 'lesson', 'takeaway', 'learning', 'realization', 'discovery')
+    }
+    
+    # Emotional tone indicators
+    POSITIVE_WORDS = ('great', 'amazing', 'excellent', 'fantastic', 'wonderful', 'love', 'excited', 'proud')
+    NEGATIVE_WORDS = ('difficult', 'challenge', 'problem', 'issue', 'struggle', 'hard', 'tough')
+    
+    def __init__(self, openai_api_key: str, model: str = "gpt-4o-mini", use_batch_api: bool = False,
+                 completion_cache: Optional[CompletionCache] = None,
+                 client: Optional[openai.OpenAI] = None):
         """
         Initialize the style analyzer with OpenAI API credentials.
         
         Args:
             openai_api_key: OpenAI API key
-            model: OpenAI model to use for analysis
+            model: OpenAI model to use for analysis; must support JSON mode
+            use_batch_api: Route completions through the OpenAI Batch API
+            completion_cache: Optional on-disk cache for completions
+            client: Shared OpenAI client, built with max_retries=0 as failed requests are
+                retried here; one is created from the API key when not given
         """
-        self.client = openai.OpenAI(api_key=openai_api_key)
+        self.client = client if client is not None else openai.OpenAI(api_key=openai_api_key, max_retries=0)
         self.model = model
+        self.use_batch_api = use_batch_api
+        self.completion_cache = completion_cache
         self.style_profile = {}
         
+        # Every theme and tone keyword, counted in one pass over the combined text
+        self._theme_keywords = tuple(dict.fromkeys(
+            [keyword for keywords in self.PROFESSIONAL_KEYWORDS.values() for keyword in keywords]
+            + list(self.POSITIVE_WORDS) + list(self.NEGATIVE_WORDS)
+        ))
+        self._keyword_automaton = self._build_keyword_automaton(self._theme_keywords)
+        
+    def _create_completion(self, **request):
+        """Create a chat completion, through the completion cache and the Batch API when enabled."""
+        if self.completion_cache is not None:
+            cached = self.completion_cache.get(request)
+            if cached is not None:
+                return cached
+        
+        if self.use_batch_api:
+            response = create_batch_completion(self.client, request)
+        else:
+            # Retry throttled or transient failures before callers fall back
+            response = call_with_retries(lambda: self.client.chat.completions.create(**request))
+        
+        if self.completion_cache is not None:
+            self.completion_cache.set(request, response)
+        return response
+    
     def analyze_posts(self, posts: List[Dict]) -> Dict:
         """
         Analyze a collection of LinkedIn posts to extract writing style patterns.
@@ -50,14 +134,13 @@ class WritingStyleAnalyzer:
             logger.warning("No text content found in posts")
             return {}
         
-        # Perform multi-dimensional analysis
-        style_analysis = {
-            'linguistic_patterns': self._analyze_linguistic_patterns(texts),
-            'structural_patterns': self._analyze_structural_patterns(texts),
-            'content_themes': self._analyze_content_themes(texts),
-            'engagement_patterns': self._analyze_engagement_patterns(posts),
-            'ai_style_profile': self._generate_ai_style_profile(texts)
-        }
+        # Perform multi-dimensional analysis; the AI style profile request is started
+        # first so its network round trip overlaps the local analyses
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix='style-profile') as executor:
+            ai_style_profile = executor.submit(self._generate_ai_style_profile, texts)
+            
+            style_analysis = self._analyze_local_patterns(posts, texts)
+            style_analysis['ai_style_profile'] = ai_style_profile.result()
         
         # Store for later use
         self.style_profile = style_analysis
@@ -65,76 +148,201 @@ class WritingStyleAnalyzer:
         logger.info("Writing style analysis completed")
         return style_analysis
     
-    def _analyze_linguistic_patterns(self, texts: List[str]) -> Dict:
+    def analyze_posts_batch(self, posts_by_author: Dict[str, List[Dict]]) -> Dict[str, Dict]:
+        """
+        Analyze the writing style of several authors, generating every AI style
+        profile in a single OpenAI Batch API job.
+        
+        The Batch API is billed at half the real-time price and is not bound by the
+        per-minute request limit, which suits profiling many authors offline. The
+        analyzer's own style_profile is left unchanged.
+        
+        Args:
+            posts_by_author: Mapping of author identifier (e.g. profile URL) to LinkedIn posts
+            
+        Returns:
+            Mapping of author identifier to style analysis (empty for authors without text)
+        """
+        texts_by_author = {}
+        for author, posts in posts_by_author.items():
+            texts = [post.get('text', '') for post in posts if post.get('text')]
+            if texts:
+                texts_by_author[author] = texts
+            else:
+                logger.warning(f"No text content found in posts for {author}")
+        
+        # Author identifiers may be arbitrary strings, so the batch uses positional ids
+        custom_ids = {author: f"author-{index}" for index, author in enumerate(texts_by_author)}
+        requests = {
+            custom_ids[author]: self._ai_style_profile_request(texts) for author, texts in texts_by_author.items()
+        }
+        
+        # Serve cached completions directly and only submit the misses
+        responses = {}
+        if self.completion_cache is not None:
+            for custom_id, request in requests.items():
+                cached = self.completion_cache.get(request)
+                if cached is not None:
+                    responses[custom_id] = cached
+        
+        pending = {custom_id: request for custom_id, request in requests.items() if custom_id not in responses}
+        
+        if pending:
+            logger.info(f"Generating {len(pending)} AI style profiles as one batch job")
+            try:
+                batch_responses = run_chat_batch(self.client, pending)
+            except Exception as e:
+                logger.error(f"Batch style profile generation failed: {str(e)}")
+                batch_responses = {}
+            
+            if self.completion_cache is not None:
+                for custom_id, response in batch_responses.items():
+                    self.completion_cache.set(pending[custom_id], response)
+            responses.update(batch_responses)
+        
+        results = {}
+        
+        for author, posts in posts_by_author.items():
+            if author not in texts_by_author:
+                results[author] = {}
+                continue
+            
+            style_analysis = self._analyze_local_patterns(posts, texts_by_author[author])
+            
+            try:
+                response = responses[custom_ids[author]]
+                style_analysis['ai_style_profile'] = json.loads(response.choices[0].message.content)
+            except Exception as e:
+                logger.error(f"Failed to generate AI style profile for {author}: {str(e)}")
+                style_analysis['ai_style_profile'] = self._fallback_ai_style_profile()
+            
+            results[author] = style_analysis
+        
+        return results
+    
+    def _analyze_local_patterns(self, posts: List[Dict], texts: List[str]) -> Dict:
+        """Run the analyses that need no API call."""
+        # Lowercased once here for every case-insensitive match below
+        lowered_texts = [text.lower() for text in texts]
+        
+        # Words are counted once per post; texts holds the posts that have text
+        word_counts = [len(post.get('text', '').split()) for post in posts]
+        text_word_counts = [count for post, count in zip(posts, word_counts) if post.get('text')]
+        
+        return {
+            'linguistic_patterns': self._analyze_linguistic_patterns(texts, lowered_texts, text_word_counts),
+            'structural_patterns': self._analyze_structural_patterns(texts, lowered_texts),
+            'content_themes': self._analyze_content_themes(texts, lowered_texts),
+            'engagement_patterns': self._analyze_engagement_patterns(posts, word_counts)
+        }
+    
+    def _analyze_linguistic_patterns(self, texts: List[str],
+                                     lowered_texts: Optional[List[str]] = None,
+                                     word_counts: Optional[List[int]] = None) -> Dict:
         """
         Analyze linguistic patterns including vocabulary, sentence structure, etc.
         
         Args:
             texts: List of post texts
+            lowered_texts: The texts lowercased, computed here when not given
+            word_counts: Word count of each text, computed here when not given
             
         Returns:
             Dictionary with linguistic analysis
         """
-        combined_text = ' '.join(texts)
-        
-        # Basic statistics
-        word_counts = [len(text.split()) for text in texts]
-        sentence_counts = [len(re.split(r'[.!?]+', text)) for text in texts]
-        char_counts = [len(text) for text in texts]
-        
-        # Vocabulary analysis
-        all_words = re.findall(r'\b\w+\b', combined_text.lower())
-        word_freq = Counter(all_words)
-        unique_words = len(set(all_words))
-        total_words = len(all_words)
-        
-        # Readability metrics
-        readability_scores = []
-        for text in texts:
-            if len(text.strip()) > 0:
-                try:
-                    readability_scores.append({
-                        'flesch_reading_ease': flesch_reading_ease(text),
-                        'flesch_kincaid_grade': flesch_kincaid_grade(text),
-                        'automated_readability_index': automated_readability_index(text)
-                    })
-                except:
-                    continue
+        if lowered_texts is None:
+            lowered_texts = [text.lower() for text in texts]
+        if word_counts is None:
+            word_counts = [len(text.split()) for text in texts]
+        
+        # Every other aggregate is accumulated in a single pass over the posts,
+        # keeping running sums rather than per-post lists
+        total_word_count = sum(word_counts)
+        total_sentence_count = total_char_count = 0
+        word_freq = Counter()
+        readability_totals = {
+            'flesch_reading_ease': 0.0,
+            'flesch_kincaid_grade': 0.0,
+            'automated_readability_index': 0.0
+        }
+        readability_count = 0
         
-        # Punctuation and formatting patterns
+        # Punctuation and formatting patterns; each is a single C-level scan, and
+        # str.isascii() is O(1), so ASCII-only text skips the emoji scan entirely
         punctuation_usage = {
-            'exclamation_marks': combined_text.count('!'),
-            'question_marks': combined_text.count('?'),
-            'emojis': len(re.findall(r'[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF\U0001F1E0-\U0001F1FF]', combined_text)),
-            'hashtags': len(re.findall(r'#\w+', combined_text)),
-            'mentions': len(re.findall(r'@\w+', combined_text)),
-            'urls': len(re.findall(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', combined_text))
+            'exclamation_marks': 0,
+            'question_marks': 0,
+            'emojis': 0,
+            'hashtags': 0,
+            'mentions': 0,
+            'urls': 0
         }
         
+        for text, lowered in zip(texts, lowered_texts):
+            # Basic statistics
+            total_sentence_count += len(SENTENCE_SPLIT_PATTERN.split(text))
+            total_char_count += len(text)
+            
+            # Vocabulary, counted per text rather than over a joined copy of every
+            # post; no pattern can span the separator between posts
+            word_freq.update(WORD_PATTERN.findall(lowered))
+            
+            # Readability metrics
+            if len(text.strip()) > 0:
+                try:
+                    scores = (
+                        flesch_reading_ease(text),
+                        flesch_kincaid_grade(text),
+                        automated_readability_index(text)
+                    )
+                except:
+                    pass
+                else:
+                    readability_totals['flesch_reading_ease'] += scores[0]
+                    readability_totals['flesch_kincaid_grade'] += scores[1]
+                    readability_totals['automated_readability_index'] += scores[2]
+                    readability_count += 1
+            
+            punctuation_usage['exclamation_marks'] += text.count('!')
+            punctuation_usage['question_marks'] += text.count('?')
+            if not text.isascii():
+                punctuation_usage['emojis'] += len(EMOJI_PATTERN.findall(text))
+            punctuation_usage['hashtags'] += len(HASHTAG_PATTERN.findall(text))
+            punctuation_usage['mentions'] += len(MENTION_PATTERN.findall(text))
+            punctuation_usage['urls'] += len(URL_PATTERN.findall(text))
+        
+        post_count = len(texts)
+        unique_words = len(word_freq)
+        total_words = sum(word_freq.values())
+        
         return {
-            'avg_words_per_post': statistics.mean(word_counts) if word_counts else 0,
-            'avg_sentences_per_post': statistics.mean(sentence_counts) if sentence_counts else 0,
-            'avg_chars_per_post': statistics.mean(char_counts) if char_counts else 0,
+            'avg_words_per_post': total_word_count / post_count if post_count else 0,
+            'avg_sentences_per_post': total_sentence_count / post_count if post_count else 0,
+            'avg_chars_per_post': total_char_count / post_count if post_count else 0,
             'vocabulary_diversity': unique_words / total_words if total_words > 0 else 0,
             'most_common_words': word_freq.most_common(20),
             'readability': {
-                'avg_flesch_reading_ease': statistics.mean([s['flesch_reading_ease'] for s in readability_scores]) if readability_scores else 0,
-                'avg_flesch_kincaid_grade': statistics.mean([s['flesch_kincaid_grade'] for s in readability_scores]) if readability_scores else 0,
-                'avg_automated_readability_index': statistics.mean([s['automated_readability_index'] for s in readability_scores]) if readability_scores else 0
+                f'avg_{metric}': total / readability_count if readability_count else 0
+                for metric, total in readability_totals.items()
             },
             'punctuation_usage': punctuation_usage
         }
     
-    def _analyze_structural_patterns(self, texts: List[str]) -> Dict:
+    def _analyze_structural_patterns(self, texts: List[str],
+                                     lowered_texts: Optional[List[str]] = None) -> Dict:
         """
         Analyze structural patterns in posts (lists, bullet points, formatting).
         
         Args:
             texts: List of post texts
+            lowered_texts: The texts lowercased, computed here when not given
             
         Returns:
             Dictionary with structural analysis
         """
+        if lowered_texts is None:
+            lowered_texts = [text.lower() for text in texts]
+        
         patterns = {
             'uses_lists': 0,
             'uses_bullet_points': 0,
@@ -145,30 +353,19 @@ class WritingStyleAnalyzer:
             'call_to_action_usage': 0
         }
         
-        # Call-to-action phrases
-        cta_patterns = [
-            r'what do you think\?',
-            r'share your thoughts',
-            r'let me know',
-            r'comment below',
-            r'thoughts\?',
-            r'what\'s your experience',
-            r'agree or disagree\?'
-        ]
-        
-        for text in texts:
+        for text, lowered in zip(texts, lowered_texts):
             # Check for list patterns
-            if re.search(r'\d+[\.\)]\s', text):
+            if NUMBERED_LIST_PATTERN.search(text):
                 patterns['uses_numbers'] += 1
             
-            if re.search(r'[•·▪▫-]\s', text) or re.search(r'\n\s*[-*]\s', text):
+            if BULLET_PATTERN.search(text):
                 patterns['uses_bullet_points'] += 1
             
             if '\n' in text:
                 patterns['uses_line_breaks'] += 1
             
             # Extract opening and closing sentences
-            sentences = re.split(r'[.!?]+', text.strip())
+            sentences = SENTENCE_SPLIT_PATTERN.split(text.strip())
             if sentences and len(sentences[0]) > 10:
                 patterns['opening_patterns'].append(sentences[0].strip())
             
@@ -176,10 +373,8 @@ class WritingStyleAnalyzer:
                 patterns['closing_patterns'].append(sentences[-1].strip())
             
             # Check for call-to-action patterns
-            for cta_pattern in cta_patterns:
-                if re.search(cta_pattern, text.lower()):
-                    patterns['call_to_action_usage'] += 1
-                    break
+            if CTA_PATTERN.search(lowered):
+                patterns['call_to_action_usage'] += 1
         
         # Calculate percentages
         total_posts = len(texts)
@@ -191,40 +386,31 @@ class WritingStyleAnalyzer:
         
         return patterns
     
-    def _analyze_content_themes(self, texts: List[str]) -> Dict:
+    def _analyze_content_themes(self, texts: List[str],
+                                lowered_texts: Optional[List[str]] = None) -> Dict:
         """
         Analyze content themes and topics using keyword extraction.
         
         Args:
             texts: List of post texts
+            lowered_texts: The texts lowercased, computed here when not given
             
         Returns:
             Dictionary with content theme analysis
         """
-        combined_text = ' '.join(texts).lower()
-        
-        # Professional themes
-        professional_keywords = {
-            'career': ['career', 'job', 'work', 'profession', 'experience', 'role'],
-            'learning': ['learn', 'education', 'skill', 'knowledge', 'growth', 'development'],
-            'technology': ['tech', 'technology', 'digital', 'ai', 'data', 'software', 'coding'],
-            'leadership': ['lead', 'leadership', 'manage', 'team', 'mentor', 'coach'],
-            'networking': ['network', 'connect', 'relationship', 'community', 'collaboration'],
-            'success': ['success', 'achievement', 'goal', 'accomplish', 'win', 'victory'],
-            'insights': ['insight', 'lesson', 'takeaway', 'learning', 'realization', 'discovery']
-        }
+        if lowered_texts is None:
+            lowered_texts = [text.lower() for text in texts]
+        
+        combined_text = ' '.join(lowered_texts)
+        keyword_counts = self._count_keywords(combined_text)
         
         theme_scores = {}
-        for theme, keywords in professional_keywords.items():
-            score = sum(combined_text.count(keyword) for keyword in keywords)
+        for theme, keywords in self.PROFESSIONAL_KEYWORDS.items():
+            score = sum(keyword_counts[keyword] for keyword in keywords)
             theme_scores[theme] = score
         
-        # Emotional tone indicators
-        positive_words = ['great', 'amazing', 'excellent', 'fantastic', 'wonderful', 'love', 'excited', 'proud']
-        negative_words = ['difficult', 'challenge', 'problem', 'issue', 'struggle', 'hard', 'tough']
-        
-        positive_score = sum(combined_text.count(word) for word in positive_words)
-        negative_score = sum(combined_text.count(word) for word in negative_words)
+        positive_score = sum(keyword_counts[word] for word in self.POSITIVE_WORDS)
+        negative_score = sum(keyword_counts[word] for word in self.NEGATIVE_WORDS)
         
         return {
             'theme_scores': theme_scores,
@@ -236,12 +422,54 @@ class WritingStyleAnalyzer:
             }
         }
     
-    def _analyze_engagement_patterns(self, posts: List[Dict]) -> Dict:
+    def _count_keywords(self, text: str) -> Counter:
+        """
+        Count occurrences of every theme and tone keyword in the text.
+        
+        Matches str.count: occurrences of one keyword never overlap, while different
+        keywords (e.g. 'learn' and 'learning') are counted independently.
+        
+        Args:
+            text: Lowercased text to scan
+            
+        Returns:
+            Counter of keyword occurrences
+        """
+        if self._keyword_automaton is None:
+            return Counter({keyword: text.count(keyword) for keyword in self._theme_keywords})
+        
+        counts = Counter()
+        last_end = {}
+        
+        # One scan reports every occurrence; skip those overlapping the previous
+        # counted occurrence of the same keyword
+        for end, keyword in self._keyword_automaton.iter(text):
+            if end - len(keyword) >= last_end.get(keyword, -1):
+                counts[keyword] += 1
+                last_end[keyword] = end
+        
+        return counts
+    
+    @staticmethod
+    def _build_keyword_automaton(keywords: Tuple[str, ...]):
+        """Build an Aho-Corasick automaton over the keywords when pyahocorasick is installed."""
+        if ahocorasick is None:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return automaton
+    
+    def _analyze_engagement_patterns(self, posts: List[Dict],
+                                     word_counts: Optional[List[int]] = None) -> Dict:
         """
         Analyze which types of posts get better engagement.
         
         Args:
             posts: List of LinkedIn post dictionaries
+            word_counts: Word count of each post, computed here when not given
             
         Returns:
             Dictionary with engagement analysis
@@ -253,37 +481,43 @@ class WritingStyleAnalyzer:
         likes = [post.get('likes', 0) for post in posts]
         comments = [post.get('comments', 0) for post in posts]
         shares = [post.get('shares', 0) for post in posts]
-        word_counts = [len(post.get('text', '').split()) for post in posts]
-        
-        # Find correlations
-        high_engagement_posts = []
-        for i, post in enumerate(posts):
-            total_engagement = likes[i] + comments[i] + shares[i]
-            if total_engagement > statistics.mean(likes + comments + shares):
-                high_engagement_posts.append({
-                    'text': post.get('text', ''),
-                    'likes': likes[i],
-                    'comments': comments[i],
-                    'shares': shares[i],
-                    'word_count': word_counts[i]
-                })
+        if word_counts is None:
+            word_counts = [len(post.get('text', '').split()) for post in posts]
+        
+        # Find correlations: posts whose total engagement beats the average single
+        # metric (likes, comments and shares pooled), compared for all posts at once
+        total_engagement = np.add(np.add(likes, comments), shares)
+        threshold = total_engagement.sum() / (3 * len(posts))
+        high_engagement_posts = [
+            {
+                'text': posts[i].get('text', ''),
+                'likes': likes[i],
+                'comments': comments[i],
+                'shares': shares[i],
+                'word_count': word_counts[i]
+            }
+            for i in np.flatnonzero(total_engagement > threshold).tolist()
+        ]
         
         return {
-            'avg_likes': statistics.mean(likes) if likes else 0,
-            'avg_comments': statistics.mean(comments) if comments else 0,
-            'avg_shares': statistics.mean(shares) if shares else 0,
+            'avg_likes': _mean(likes),
+            'avg_comments': _mean(comments),
+            'avg_shares': _mean(shares),
             'high_engagement_posts': high_engagement_posts,
-            'optimal_word_count_range': self._find_optimal_word_count(posts)
+            'optimal_word_count_range': self._find_optimal_word_count(posts, word_counts)
         }
     
-    def _find_optimal_word_count(self, posts: List[Dict]) -> Tuple[int, int]:
+    def _find_optimal_word_count(self, posts: List[Dict],
+                                 word_counts: Optional[List[int]] = None) -> Tuple[int, int]:
         """Find the word count range that generates the best engagement."""
         if not posts:
             return (0, 0)
         
+        if word_counts is None:
+            word_counts = [len(post.get('text', '').split()) for post in posts]
+        
         engagement_by_length = []
-        for post in posts:
-            word_count = len(post.get('text', '').split())
+        for post, word_count in zip(posts, word_counts):
             total_engagement = post.get('likes', 0) + post.get('comments', 0) + post.get('shares', 0)
             engagement_by_length.append((word_count, total_engagement))
         
@@ -291,9 +525,9 @@ class WritingStyleAnalyzer:
         sorted_by_engagement = sorted(engagement_by_length, key=lambda x: x[1], reverse=True)
         top_quarter = sorted_by_engagement[:len(sorted_by_engagement)//4 or 1]
         
-        word_counts = [wc for wc, _ in top_quarter]
-        if word_counts:
-            return (min(word_counts), max(word_counts))
+        top_word_counts = [wc for wc, _ in top_quarter]
+        if top_word_counts:
+            return (min(top_word_counts), max(top_word_counts))
         return (0, 0)
     
     def _generate_ai_style_profile(self, texts: List[str]) -> Dict:
@@ -307,9 +541,21 @@ class WritingStyleAnalyzer:
             Dictionary with AI-generated style insights
         """
         try:
-            sample_texts = texts[:5]  # Use first 5 posts as sample
+            response = self._create_completion(**self._ai_style_profile_request(texts))
             
-            prompt = f"""
+            # Parse the JSON response
+            style_profile = json.loads(response.choices[0].message.content)
+            return style_profile
+            
+        except Exception as e:
+            logger.error(f"Failed to generate AI style profile: {str(e)}")
+            return self._fallback_ai_style_profile()
+    
+    def _ai_style_profile_request(self, texts: List[str]) -> Dict:
+        """Build the chat completion request for an AI style profile."""
+        sample_texts = texts[:5]  # Use first 5 posts as sample
+        
+        prompt = f"""
             Analyze the following LinkedIn posts and create a comprehensive writing style profile. 
             Focus on:
             1. Tone and voice characteristics
@@ -333,31 +579,31 @@ class WritingStyleAnalyzer:
                 "key_style_elements": ["element1", "element2"]
             }}
             """
-            
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert in writing style analysis and social media content."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3
-            )
-            
-            # Parse the JSON response
-            style_profile = json.loads(response.choices[0].message.content)
-            return style_profile
-            
-        except Exception as e:
-            logger.error(f"Failed to generate AI style profile: {str(e)}")
-            return {
-                "tone": "professional",
-                "voice_characteristics": ["analytical"],
-                "common_phrases": [],
-                "storytelling_style": "direct",
-                "engagement_techniques": [],
-                "typical_post_structure": "linear",
-                "key_style_elements": []
-            }
+        
+        return {
+            'model': self.model,
+            'messages': [
+                {"role": "system", "content": "You are an expert in writing style analysis and social media content."},
+                {"role": "user", "content": prompt}
+            ],
+            'temperature': 0.3,
+            # JSON mode: the reply always parses, instead of occasionally arriving
+            # wrapped in prose and falling back to the default profile
+            'response_format': {"type": "json_object"}
+        }
+    
+    @staticmethod
+    def _fallback_ai_style_profile() -> Dict:
+        """Default AI style profile used when generation fails."""
+        return {
+            "tone": "professional",
+            "voice_characteristics": ["analytical"],
+            "common_phrases": [],
+            "storytelling_style": "direct",
+            "engagement_techniques": [],
+            "typical_post_structure": "linear",
+            "key_style_elements": []
+        }
     
     def generate_style_summary(self) -> str:
         """
@@ -409,8 +655,9 @@ class WritingStyleAnalyzer:
             return
         
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(self.style_profile, f, indent=2, ensure_ascii=False)
+            # orjson encodes straight to UTF-8 bytes, much faster than json.dump with indent
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(self.style_profile, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
             logger.info(f"Style profile saved to {filename}")
         except Exception as e:
             logger.error(f"Failed to save style profile: {str(e)}")
@@ -418,8 +665,8 @@ class WritingStyleAnalyzer:
     def load_style_profile(self, filename: str = "style_profile.json"):
         """Load a previously saved style profile."""
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                self.style_profile = json.load(f)
+            with open(filename, 'rb') as f:
+                self.style_profile = orjson.loads(f.read())
             logger.info(f"Style profile loaded from {filename}")
         except Exception as e:
             logger.error(f"Failed to load style profile: {str(e)}")
\ No newline at end of file
@@ -1,11 +1,52 @@
 import openai
+import asyncio
+import hashlib
 import json
-from typing import List, Dict, Optional
+import re
+import orjson
+from typing import AsyncIterator, Iterable, List, Dict, Optional, Tuple
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
+from src.utils.completion_cache import CompletionCache
+from src.utils.openai_batch import create_batch_completion, run_chat_batch
+from src.utils.rate_limiter import AsyncRateLimiter, call_with_retries, estimate_request_tokens
+
 logger = logging.getLogger(__name__)
 
+HASHTAG_PATTERN = re.compile(r'#\w+')
+MENTION_PATTERN = re.compile(r'@\w+')
+# Poll option line ("A) ...", "1. ...", "- ...", "• ..."), capturing the option text
+POLL_OPTION_PATTERN = re.compile(r'(?:[A-D]\)|[1-4]\.|[-•])[\s\-•]*(.*)')
+
+# Template post used when generation fails
+FALLBACK_CONTENT = """🔍 Latest insights from the data visualization community:
+
+📈 Trending topics include climate data, tech salaries, and personal analytics
+🛠️ Python and R continue to dominate as preferred tools
+📊 Original content (OC) posts are getting the most engagement
+
+The r/dataisbeautiful community never ceases to amaze with creative data storytelling!
+
+What's your favorite data visualization from this week?
+
+#DataScience #DataVisualization #Analytics #DataStorytelling"""
+FALLBACK_HASHTAGS = ('#DataScience', '#DataVisualization', '#Analytics', '#DataStorytelling')
+FALLBACK_WORD_COUNT = len(FALLBACK_CONTENT.split())
+
+# Legacy models that reject JSON mode (response_format={"type": "json_object"})
+NO_JSON_MODE_MODELS = frozenset({
+    'gpt-4', 'gpt-4-0314', 'gpt-4-0613', 'gpt-4-32k', 'gpt-4-32k-0314', 'gpt-4-32k-0613',
+    'gpt-4-vision-preview', 'gpt-3.5-turbo-0301', 'gpt-3.5-turbo-0613',
+    'gpt-3.5-turbo-16k', 'gpt-3.5-turbo-16k-0613'
+})
+
+# Days per batched calendar request, and the completion budget per day; six days keep
+# a request within the 4096-token output limit of the smaller models
+CALENDAR_CHUNK_DAYS = 6
+CALENDAR_TOKENS_PER_DAY = 600
+
 
 class LinkedInPostGenerator:
     """
@@ -13,16 +54,90 @@ class LinkedInPostGenerator:
     optimized for engagement and professional presentation.
     """
     
-    def __init__(self, openai_api_key: str, model: str = "gpt-4"):
+    def __init__(self, openai_api_key: str, model: str = "gpt-4", use_batch_api: bool = False,
+                 completion_cache: Optional[CompletionCache] = None,
+                 max_concurrent: int = 10,
+                 max_requests_per_minute: float = 500,
+                 max_tokens_per_minute: float = 30000,
+                 max_attempts: int = 5,
+                 client: Optional[openai.OpenAI] = None,
+                 async_client: Optional[openai.AsyncOpenAI] = None):
         """
         Initialize the LinkedIn post generator.
         
         Args:
             openai_api_key: OpenAI API key
             model: OpenAI model to use for generation
+            use_batch_api: Route completions through the OpenAI Batch API
+            completion_cache: Optional on-disk cache for completions
+            max_concurrent: Maximum number of generation requests in flight at once
+            max_requests_per_minute: Request budget for concurrent async completions
+            max_tokens_per_minute: Token budget for concurrent async completions
+            max_attempts: Attempts per completion on rate limit or transient errors
+            client: Shared OpenAI client, built with max_retries=0 as failed requests are
+                retried here; one is created from the API key when not given
+            async_client: Shared async OpenAI client, likewise built with max_retries=0;
+                one is created on first async use when not given
         """
-        self.client = openai.OpenAI(api_key=openai_api_key)
+        self.client = client if client is not None else openai.OpenAI(api_key=openai_api_key, max_retries=0)
         self.model = model
+        self.use_batch_api = use_batch_api
+        self.completion_cache = completion_cache
+        self.max_concurrent = max_concurrent
+        self._openai_api_key = openai_api_key
+        self._async_client = async_client
+        self.rate_limiter = AsyncRateLimiter(
+            max_requests_per_minute=max_requests_per_minute,
+            max_tokens_per_minute=max_tokens_per_minute,
+            max_concurrent=max_concurrent,
+            max_attempts=max_attempts
+        )
+    
+    def _create_completion(self, **request):
+        """Create a chat completion, through the completion cache and the Batch API when enabled."""
+        if self.completion_cache is not None:
+            cached = self.completion_cache.get(request)
+            if cached is not None:
+                return cached
+        
+        if self.use_batch_api:
+            response = create_batch_completion(self.client, request)
+        else:
+            # Retry throttled or transient failures before callers fall back
+            response = call_with_retries(
+                lambda: self.client.chat.completions.create(**request),
+                max_attempts=self.rate_limiter.max_attempts,
+                base_delay=self.rate_limiter.base_delay,
+                max_delay=self.rate_limiter.max_delay
+            )
+        
+        if self.completion_cache is not None:
+            self.completion_cache.set(request, response)
+        return response
+    
+    async def _acreate_completion(self, **request):
+        """Async variant of _create_completion using the async OpenAI client."""
+        if self.completion_cache is not None:
+            cached = self.completion_cache.get(request)
+            if cached is not None:
+                return cached
+        
+        # Concurrent requests are throttled to the RPM/TPM budgets and retried on rate limits
+        response = await self.rate_limiter.run(
+            lambda: self.async_client.chat.completions.create(**request),
+            estimate_request_tokens(request)
+        )
+        
+        if self.completion_cache is not None:
+            self.completion_cache.set(request, response)
+        return response
+    
+    @property
+    def async_client(self) -> openai.AsyncOpenAI:
+        """Async OpenAI client, the injected one or created on first use by the async generation methods."""
+        if self._async_client is None:
+            self._async_client = openai.AsyncOpenAI(api_key=self._openai_api_key, max_retries=0)
+        return self._async_client
         
     def generate_post_from_summary(self, summary_data: Dict, 
                                   style_profile: Dict, 
@@ -38,149 +153,284 @@ class LinkedInPostGenerator:
         Returns:
             Dictionary containing the generated post and metadata
         """
-        if post_type == "standard":
-            return self._generate_standard_post(summary_data, style_profile)
-        elif post_type == "carousel":
-            return self._generate_carousel_post(summary_data, style_profile)
-        elif post_type == "video_script":
-            return self._generate_video_script(summary_data, style_profile)
-        elif post_type == "poll":
-            return self._generate_poll_post(summary_data, style_profile)
-        else:
-            logger.warning(f"Unknown post type: {post_type}, defaulting to standard")
-            return self._generate_standard_post(summary_data, style_profile)
+        post_type, (build_request, build_result, label) = self._post_builders(post_type)
+        
+        try:
+            response = self._create_completion(**build_request(summary_data, style_profile))
+            return build_result(response.choices[0].message.content.strip(), summary_data, style_profile)
+        except Exception as e:
+            logger.error(f"Failed to generate {label}: {str(e)}")
+            return self._generate_fallback_post(summary_data, post_type=post_type)
     
-    def _generate_standard_post(self, summary_data: Dict, style_profile: Dict) -> Dict:
+    async def agenerate_post_from_summary(self, summary_data: Dict, 
+                                         style_profile: Dict, 
+                                         post_type: str = "standard") -> Dict:
+        """
+        Async variant of generate_post_from_summary using the async OpenAI client,
+        so several posts can be generated concurrently.
         """
-        Generate a standard LinkedIn text post.
+        post_type, (build_request, build_result, label) = self._post_builders(post_type)
+        
+        try:
+            response = await self._acreate_completion(**build_request(summary_data, style_profile))
+            return build_result(response.choices[0].message.content.strip(), summary_data, style_profile)
+        except Exception as e:
+            logger.error(f"Failed to generate {label}: {str(e)}")
+            return self._generate_fallback_post(summary_data, post_type=post_type)
+    
+    async def astream_post_from_summary(self, summary_data: Dict, 
+                                        style_profile: Dict, 
+                                        post_type: str = "standard") -> AsyncIterator[str]:
+        """
+        Stream the text of a generated LinkedIn post as it arrives, for interactive use.
+        
+        Join the chunks and pass the text to the post type's result builder for the
+        post metadata. A completion served from the cache is yielded whole.
         
         Args:
             summary_data: Summary data from ContentSummarizer
             style_profile: User's writing style profile
+            post_type: Type of post to generate ("standard", "carousel", "video_script", "poll")
             
-        Returns:
-            Dictionary with generated post data
+        Yields:
+            Chunks of the generated post text
         """
-        try:
-            # Extract key information
-            summary_text = summary_data.get('summary', '')
-            insights = summary_data.get('insights', {})
-            metadata = summary_data.get('metadata', {})
-            
-            # Create enhanced prompt
-            prompt = self._create_standard_post_prompt(summary_text, insights, style_profile)
-            
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert LinkedIn content creator specializing in data science and technology content."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=600
-            )
-            
-            post_content = response.choices[0].message.content.strip()
-            
-            # Extract hashtags and mentions
-            hashtags = self._extract_hashtags(post_content)
-            mentions = self._extract_mentions(post_content)
-            
-            return {
-                'post_type': 'standard',
-                'content': post_content,
-                'hashtags': hashtags,
-                'mentions': mentions,
-                'estimated_engagement': self._estimate_engagement(post_content, style_profile),
-                'character_count': len(post_content),
-                'word_count': len(post_content.split()),
-                'generation_timestamp': datetime.now().isoformat(),
-                'metadata': {
-                    'source_posts_analyzed': metadata.get('posts_analyzed', 0),
-                    'categories_covered': list(metadata.get('categories', {}).keys()),
-                    'style_applied': True
-                }
-            }
-            
-        except Exception as e:
-            logger.error(f"Failed to generate standard post: {str(e)}")
-            return self._generate_fallback_post(summary_data)
+        _, (build_request, _, _) = self._post_builders(post_type)
+        request = build_request(summary_data, style_profile)
+        
+        if self.completion_cache is not None:
+            cached = self.completion_cache.get(request)
+            if cached is not None:
+                yield cached.choices[0].message.content
+                return
+        
+        # Only opening the stream is throttled and retried; chunks are yielded as they arrive
+        stream = await self.rate_limiter.run(
+            lambda: self.async_client.chat.completions.create(**request, stream=True),
+            estimate_request_tokens(request)
+        )
+        
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
     
-    def _generate_carousel_post(self, summary_data: Dict, style_profile: Dict) -> Dict:
+    def generate_posts_batch(self, summary_data: Dict, 
+                             style_profile: Dict, 
+                             post_types: List[str], 
+                             calendar_days: int = 0) -> List:
         """
-        Generate a LinkedIn carousel post with multiple slides.
+        Generate several post types, and optionally a content calendar,
+        as a single OpenAI Batch API job.
         
         Args:
             summary_data: Summary data from ContentSummarizer
             style_profile: User's writing style profile
+            post_types: Post types to generate
+            calendar_days: Number of content calendar days to generate (0 to skip)
             
         Returns:
-            Dictionary with carousel post data
+            Posts ordered like post_types, followed by the content calendar when calendar_days > 0
         """
-        try:
-            insights = summary_data.get('insights', {})
-            categorized_content = summary_data.get('categorized_content', {})
+        jobs = {f"post-{index}": post_type for index, post_type in enumerate(post_types)}
+        jobs.update({f"calendar-day-{day + 1}": self._calendar_post_type(day) for day in range(calendar_days)})
+        
+        builders = {}
+        requests = {}
+        
+        for custom_id, post_type in jobs.items():
+            post_type, (build_request, build_result, label) = self._post_builders(post_type)
+            builders[custom_id] = (post_type, build_result, label)
+            requests[custom_id] = build_request(summary_data, style_profile)
+        
+        # Serve cached completions directly and only submit the misses
+        responses = {}
+        if self.completion_cache is not None:
+            for custom_id, request in requests.items():
+                cached = self.completion_cache.get(request)
+                if cached is not None:
+                    responses[custom_id] = cached
+        
+        pending = {custom_id: request for custom_id, request in requests.items() if custom_id not in responses}
+        
+        if pending:
+            try:
+                batch_responses = run_chat_batch(self.client, pending)
+            except Exception as e:
+                logger.error(f"Batch post generation failed: {str(e)}")
+                batch_responses = {}
             
-            # Create carousel structure
-            slides = []
+            if self.completion_cache is not None:
+                for custom_id, response in batch_responses.items():
+                    self.completion_cache.set(pending[custom_id], response)
+            responses.update(batch_responses)
+        
+        posts = {}
+        
+        for custom_id, (post_type, build_result, label) in builders.items():
+            try:
+                if custom_id not in responses:
+                    raise RuntimeError("no batch result")
+                posts[custom_id] = build_result(
+                    responses[custom_id].choices[0].message.content.strip(), summary_data, style_profile
+                )
+            except Exception as e:
+                logger.error(f"Failed to generate {label}: {str(e)}")
+                posts[custom_id] = self._generate_fallback_post(summary_data, post_type=post_type)
+        
+        results = [posts[f"post-{index}"] for index in range(len(post_types))]
+        
+        if calendar_days > 0:
+            results.append([
+                self._calendar_entry(day, self._calendar_post_type(day), posts[f"calendar-day-{day + 1}"])
+                for day in range(calendar_days)
+            ])
+        
+        return results
+    
+    def _post_builders(self, post_type: str):
+        """Resolve a post type to its (request builder, result builder, label) triple."""
+        builders = {
+            'standard': (self._standard_post_request, self._standard_post_result, 'standard post'),
+            'carousel': (self._carousel_post_request, self._carousel_post_result, 'carousel post'),
+            'video_script': (self._video_script_request, self._video_script_result, 'video script'),
+            'poll': (self._poll_post_request, self._poll_post_result, 'poll post')
+        }
+        
+        if post_type not in builders:
+            logger.warning(f"Unknown post type: {post_type}, defaulting to standard")
+            post_type = 'standard'
+        
+        return post_type, builders[post_type]
+    
+    def _standard_post_request(self, summary_data: Dict, style_profile: Dict) -> Dict:
+        """Build the chat completion request for a standard LinkedIn text post."""
+        # Extract key information
+        summary_text = summary_data.get('summary', '')
+        insights = summary_data.get('insights', {})
+        
+        # Create enhanced prompt
+        prompt = self._create_standard_post_prompt(summary_text, insights)
+        
+        return self._chat_request(
+            style_profile,
+            "You are an expert LinkedIn content creator specializing in data science and technology content.",
+            prompt,
+            temperature=0.7,
+            max_tokens=self._target_tokens(style_profile, max_words=300, min_tokens=600)
+        )
+    
+    def _standard_post_result(self, post_content: str, summary_data: Dict, style_profile: Dict) -> Dict:
+        """
+        Build a standard LinkedIn text post from the generated content.
+        
+        Args:
+            post_content: Generated post text
+            summary_data: Summary data from ContentSummarizer
+            style_profile: User's writing style profile
             
-            # Title slide
-            title_slide = {
-                'slide_number': 1,
-                'title': '🔍 Data Visualization Trends',
-                'content': 'Latest insights from r/dataisbeautiful',
-                'type': 'title'
+        Returns:
+            Dictionary with generated post data
+        """
+        metadata = summary_data.get('metadata', {})
+        
+        # Extract hashtags and mentions
+        hashtags = self._extract_hashtags(post_content)
+        mentions = self._extract_mentions(post_content)
+        word_count = len(post_content.split())
+        
+        return {
+            'post_type': 'standard',
+            'content': post_content,
+            'hashtags': hashtags,
+            'mentions': mentions,
+            'estimated_engagement': self._estimate_engagement(post_content, style_profile, word_count=word_count),
+            'character_count': len(post_content),
+            'word_count': word_count,
+            'generation_timestamp': datetime.now().isoformat(),
+            'metadata': {
+                'source_posts_analyzed': metadata.get('posts_analyzed', 0),
+                'categories_covered': list(metadata.get('categories', {}).keys()),
+                'style_applied': True
             }
-            slides.append(title_slide)
-            
-            # Insight slides
-            trending_keywords = insights.get('trending_keywords', [])[:5]
-            if trending_keywords:
-                trend_slide = {
-                    'slide_number': 2,
-                    'title': '📈 Trending Topics',
-                    'content': '\n'.join([f"• {keyword[0].title()}" for keyword in trending_keywords]),
-                    'type': 'content'
-                }
-                slides.append(trend_slide)
-            
-            # Tools slide
-            top_tools = insights.get('top_tools', [])[:5]
-            if top_tools:
-                tools_slide = {
-                    'slide_number': 3,
-                    'title': '🛠️ Popular Tools',
-                    'content': '\n'.join([f"• {tool[0].title()}: {tool[1]} mentions" for tool in top_tools]),
-                    'type': 'content'
-                }
-                slides.append(tools_slide)
-            
-            # Themes slide
-            content_themes = insights.get('content_themes', [])[:4]
-            if content_themes:
-                themes_slide = {
-                    'slide_number': 4,
-                    'title': '🎯 Content Themes',
-                    'content': '\n'.join([f"• {theme['theme']}: {theme['post_count']} posts" for theme in content_themes]),
-                    'type': 'content'
-                }
-                slides.append(themes_slide)
+        }
+    
+    def _carousel_slides(self, insights: Dict) -> List[Dict]:
+        """
+        Build the slides of a LinkedIn carousel post.
+        
+        Args:
+            insights: Insights from the summary data
             
-            # CTA slide
-            cta_slide = {
-                'slide_number': len(slides) + 1,
-                'title': '💬 What\'s Your Take?',
-                'content': 'Which data story caught your attention?\n\nShare your thoughts in the comments!',
-                'type': 'cta'
+        Returns:
+            List of slide dictionaries
+        """
+        # Create carousel structure
+        slides = []
+        
+        # Title slide
+        title_slide = {
+            'slide_number': 1,
+            'title': '🔍 Data Visualization Trends',
+            'content': 'Latest insights from r/dataisbeautiful',
+            'type': 'title'
+        }
+        slides.append(title_slide)
+        
+        # Insight slides
+        trending_keywords = insights.get('trending_keywords', [])[:5]
+        if trending_keywords:
+            trend_slide = {
+                'slide_number': 2,
+                'title': '📈 Trending Topics',
+                'content': '\n'.join([f"• {keyword[0].title()}" for keyword in trending_keywords]),
+                'type': 'content'
             }
-            slides.append(cta_slide)
-            
-            # Generate main post text
-            main_post_prompt = f"""
+            slides.append(trend_slide)
+        
+        # Tools slide
+        top_tools = insights.get('top_tools', [])[:5]
+        if top_tools:
+            tools_slide = {
+                'slide_number': 3,
+                'title': '🛠️ Popular Tools',
+                'content': '\n'.join([f"• {tool[0].title()}: {tool[1]} mentions" for tool in top_tools]),
+                'type': 'content'
+            }
+            slides.append(tools_slide)
+        
+        # Themes slide
+        content_themes = insights.get('content_themes', [])[:4]
+        if content_themes:
+            themes_slide = {
+                'slide_number': 4,
+                'title': '🎯 Content Themes',
+                'content': '\n'.join([f"• {theme['theme']}: {theme['post_count']} posts" for theme in content_themes]),
+                'type': 'content'
+            }
+            slides.append(themes_slide)
+        
+        # CTA slide
+        cta_slide = {
+            'slide_number': len(slides) + 1,
+            'title': '💬 What\'s Your Take?',
+            'content': 'Which data story caught your attention?\n\nShare your thoughts in the comments!',
+            'type': 'cta'
+        }
+        slides.append(cta_slide)
+        
+        return slides
+    
+    def _carousel_post_request(self, summary_data: Dict, style_profile: Dict) -> Dict:
+        """Build the chat completion request for a carousel introduction."""
+        insights = summary_data.get('insights', {})
+        trending_keywords = insights.get('trending_keywords', [])[:5]
+        top_tools = insights.get('top_tools', [])[:5]
+        content_themes = insights.get('content_themes', [])[:4]
+        
+        # Generate main post text
+        main_post_prompt = f"""
             Create a LinkedIn post to introduce this carousel about data visualization trends.
             
-            Style guidelines: {self._get_style_summary(style_profile)}
-            
             Carousel covers:
             - Trending topics: {', '.join([kw[0] for kw in trending_keywords[:3]])}
             - Popular tools: {', '.join([tool[0] for tool in top_tools[:3]])}
@@ -188,127 +438,116 @@ class LinkedInPostGenerator:
             
             Write an engaging introduction (100-150 words) that encourages people to swipe through.
             """
-            
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert at creating engaging LinkedIn carousel introductions."},
-                    {"role": "user", "content": main_post_prompt}
-                ],
-                temperature=0.7,
-                max_tokens=300
-            )
-            
-            main_content = response.choices[0].message.content.strip()
-            
-            return {
-                'post_type': 'carousel',
-                'main_content': main_content,
-                'slides': slides,
-                'total_slides': len(slides),
-                'estimated_engagement': self._estimate_engagement(main_content, style_profile, boost=1.3),
-                'generation_timestamp': datetime.now().isoformat(),
-                'instructions': [
-                    "Create slides using your preferred design tool",
-                    "Use consistent branding across all slides",
-                    "Keep text readable on mobile devices",
-                    "Include your logo/watermark on each slide"
-                ]
-            }
-            
-        except Exception as e:
-            logger.error(f"Failed to generate carousel post: {str(e)}")
-            return self._generate_fallback_post(summary_data, post_type='carousel')
+        
+        return self._chat_request(
+            style_profile,
+            "You are an expert at creating engaging LinkedIn carousel introductions.",
+            main_post_prompt,
+            temperature=0.7,
+            max_tokens=300
+        )
     
-    def _generate_video_script(self, summary_data: Dict, style_profile: Dict) -> Dict:
+    def _carousel_post_result(self, main_content: str, summary_data: Dict, style_profile: Dict) -> Dict:
         """
-        Generate a video script for LinkedIn video content.
+        Build a LinkedIn carousel post with multiple slides.
         
         Args:
+            main_content: Generated carousel introduction
             summary_data: Summary data from ContentSummarizer
             style_profile: User's writing style profile
             
         Returns:
-            Dictionary with video script data
+            Dictionary with carousel post data
         """
-        try:
-            insights = summary_data.get('insights', {})
-            
-            script_prompt = f"""
+        slides = self._carousel_slides(summary_data.get('insights', {}))
+        
+        return {
+            'post_type': 'carousel',
+            'main_content': main_content,
+            'slides': slides,
+            'total_slides': len(slides),
+            'estimated_engagement': self._estimate_engagement(main_content, style_profile, boost=1.3),
+            'generation_timestamp': datetime.now().isoformat(),
+            'instructions': [
+                "Create slides using your preferred design tool",
+                "Use consistent branding across all slides",
+                "Keep text readable on mobile devices",
+                "Include your logo/watermark on each slide"
+            ]
+        }
+    
+    def _video_script_request(self, summary_data: Dict, style_profile: Dict) -> Dict:
+        """Build the chat completion request for a LinkedIn video script."""
+        insights = summary_data.get('insights', {})
+        # Compact, key-sorted JSON: fewer prompt tokens and identical text for identical insights
+        insights_json = orjson.dumps(insights, option=orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode('utf-8')
+        
+        # Static instructions first, so only the trailing insights vary between requests
+        script_prompt = f"""
             Create a 60-90 second video script about data visualization trends from r/dataisbeautiful.
             
-            Key insights to cover:
-            {json.dumps(insights, indent=2)}
-            
-            Style guidelines: {self._get_style_summary(style_profile)}
-            
             Format the script with:
             - Hook (first 3 seconds)
             - Main content (3 key points)
             - Call to action
             
             Include timing cues and visual suggestions.
-            """
-            
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert at creating engaging social media video scripts."},
-                    {"role": "user", "content": script_prompt}
-                ],
-                temperature=0.7,
-                max_tokens=800
-            )
-            
-            script_content = response.choices[0].message.content.strip()
-            
-            # Parse script into sections
-            sections = self._parse_video_script(script_content)
-            
-            return {
-                'post_type': 'video_script',
-                'full_script': script_content,
-                'sections': sections,
-                'estimated_duration': '60-90 seconds',
-                'video_type': 'talking_head_with_graphics',
-                'estimated_engagement': self._estimate_engagement(script_content, style_profile, boost=1.5),
-                'generation_timestamp': datetime.now().isoformat(),
-                'production_notes': [
-                    "Use engaging visuals for data points",
-                    "Keep text overlays simple and readable",
-                    "Include captions for accessibility",
-                    "End with a clear call-to-action"
-                ]
-            }
             
-        except Exception as e:
-            logger.error(f"Failed to generate video script: {str(e)}")
-            return self._generate_fallback_post(summary_data, post_type='video_script')
+            Key insights to cover (JSON):
+            {insights_json}
+            """
+        
+        return self._chat_request(
+            style_profile,
+            "You are an expert at creating engaging social media video scripts.",
+            script_prompt,
+            temperature=0.7,
+            max_tokens=800
+        )
     
-    def _generate_poll_post(self, summary_data: Dict, style_profile: Dict) -> Dict:
+    def _video_script_result(self, script_content: str, summary_data: Dict, style_profile: Dict) -> Dict:
         """
-        Generate a LinkedIn poll post.
+        Build a video script for LinkedIn video content.
         
         Args:
+            script_content: Generated script text
             summary_data: Summary data from ContentSummarizer
             style_profile: User's writing style profile
             
         Returns:
-            Dictionary with poll post data
+            Dictionary with video script data
         """
-        try:
-            insights = summary_data.get('insights', {})
-            top_tools = insights.get('top_tools', [])
-            content_themes = insights.get('content_themes', [])
-            
-            poll_prompt = f"""
+        # Parse script into sections
+        sections = self._parse_video_script(script_content)
+        
+        return {
+            'post_type': 'video_script',
+            'full_script': script_content,
+            'sections': sections,
+            'estimated_duration': '60-90 seconds',
+            'video_type': 'talking_head_with_graphics',
+            'estimated_engagement': self._estimate_engagement(script_content, style_profile, boost=1.5),
+            'generation_timestamp': datetime.now().isoformat(),
+            'production_notes': [
+                "Use engaging visuals for data points",
+                "Keep text overlays simple and readable",
+                "Include captions for accessibility",
+                "End with a clear call-to-action"
+            ]
+        }
+    
+    def _poll_post_request(self, summary_data: Dict, style_profile: Dict) -> Dict:
+        """Build the chat completion request for a LinkedIn poll post."""
+        insights = summary_data.get('insights', {})
+        top_tools = insights.get('top_tools', [])
+        content_themes = insights.get('content_themes', [])
+        
+        poll_prompt = f"""
             Create a LinkedIn poll about data visualization preferences based on these trends:
             
             Top tools: {', '.join([tool[0] for tool in top_tools[:4]])}
             Top themes: {', '.join([theme['theme'] for theme in content_themes[:4]])}
             
-            Style guidelines: {self._get_style_summary(style_profile)}
-            
             Create:
             1. An engaging question for the poll
             2. 2-4 poll options
@@ -317,46 +556,86 @@ class LinkedInPostGenerator:
             
             Make it relevant to the data science/visualization community.
             """
+        
+        return self._chat_request(
+            style_profile,
+            "You are an expert at creating engaging LinkedIn polls for data science professionals.",
+            poll_prompt,
+            temperature=0.7,
+            max_tokens=500
+        )
+    
+    def _poll_post_result(self, poll_content: str, summary_data: Dict, style_profile: Dict) -> Dict:
+        """
+        Build a LinkedIn poll post.
+        
+        Args:
+            poll_content: Generated poll text
+            summary_data: Summary data from ContentSummarizer
+            style_profile: User's writing style profile
             
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert at creating engaging LinkedIn polls for data science professionals."},
-                    {"role": "user", "content": poll_prompt}
-                ],
-                temperature=0.7,
-                max_tokens=500
-            )
-            
-            poll_content = response.choices[0].message.content.strip()
-            
-            # Extract poll components
-            poll_components = self._parse_poll_content(poll_content)
-            
-            return {
-                'post_type': 'poll',
-                'content': poll_content,
-                'poll_question': poll_components.get('question', 'What\'s your preferred data visualization tool?'),
-                'poll_options': poll_components.get('options', ['Python', 'R', 'Tableau', 'Other']),
-                'context_text': poll_components.get('context', ''),
-                'estimated_engagement': self._estimate_engagement(poll_content, style_profile, boost=1.4),
-                'generation_timestamp': datetime.now().isoformat(),
-                'poll_duration': '1 week',
-                'engagement_tips': [
-                    "Respond to comments to boost engagement",
-                    "Share results in a follow-up post",
-                    "Thank participants for voting"
-                ]
-            }
+        Returns:
+            Dictionary with poll post data
+        """
+        # Extract poll components
+        poll_components = self._parse_poll_content(poll_content)
+        
+        return {
+            'post_type': 'poll',
+            'content': poll_content,
+            'poll_question': poll_components.get('question', 'What\'s your preferred data visualization tool?'),
+            'poll_options': poll_components.get('options', ['Python', 'R', 'Tableau', 'Other']),
+            'context_text': poll_components.get('context', ''),
+            'estimated_engagement': self._estimate_engagement(poll_content, style_profile, boost=1.4),
+            'generation_timestamp': datetime.now().isoformat(),
+            'poll_duration': '1 week',
+            'engagement_tips': [
+                "Respond to comments to boost engagement",
+                "Share results in a follow-up post",
+                "Thank participants for voting"
+            ]
+        }
+    
+    def _chat_request(self, style_profile: Dict, system_prompt: str, user_prompt: str, **params) -> Dict:
+        """
+        Build chat completion request parameters with a cache-friendly layout.
+        
+        The style guidelines are identical for every post generated in a run, so they
+        lead the message list as a static block and prompt_cache_key routes the requests
+        sharing it to the same cache. OpenAI only caches prefixes of 1024 tokens or more,
+        which the current prompts stay below; the layout costs nothing until they grow.
+        
+        Args:
+            style_profile: User's writing style profile
+            system_prompt: Post-type specific system instruction
+            user_prompt: Dynamic, per-request prompt
+            **params: Additional completion parameters (temperature, max_tokens, ...)
             
-        except Exception as e:
-            logger.error(f"Failed to generate poll post: {str(e)}")
-            return self._generate_fallback_post(summary_data, post_type='poll')
+        Returns:
+            Chat completion request parameters
+        """
+        static_prefix = self._create_style_prefix(style_profile)
+        
+        return {
+            'model': self.model,
+            'messages': [
+                {"role": "system", "content": static_prefix},
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            'prompt_cache_key': hashlib.sha256(static_prefix.encode('utf-8')).hexdigest(),
+            **params
+        }
+    
+    def _create_style_prefix(self, style_profile: Dict) -> str:
+        """Create the static system block shared by every generation request."""
+        return f"""You write LinkedIn content about data visualization trends from r/dataisbeautiful for data science and technology professionals, in the author's personal writing style.
+
+Writing Style Guidelines:
+{self._get_style_summary(style_profile)}"""
     
-    def _create_standard_post_prompt(self, summary_text: str, insights: Dict, style_profile: Dict) -> str:
+    def _create_standard_post_prompt(self, summary_text: str, insights: Dict) -> str:
         """Create a detailed prompt for standard post generation."""
-        style_summary = self._get_style_summary(style_profile)
-        
         prompt = f"""
         Create an engaging LinkedIn post about data visualization trends from r/dataisbeautiful.
         
@@ -368,9 +647,6 @@ class LinkedInPostGenerator:
         - Popular tools: {', '.join([tool[0] for tool in insights.get('top_tools', [])[:3]])}
         - Engagement stats: {insights.get('engagement_stats', {})}
         
-        Writing Style Guidelines:
-        {style_summary}
-        
         Requirements:
         1. Make it engaging and professional
         2. Include specific data points or trends
@@ -413,19 +689,34 @@ class LinkedInPostGenerator:
         
         return '; '.join(style_elements) if style_elements else "Professional, engaging style"
     
+    def _target_tokens(self, style_profile: Dict, max_words: int, min_tokens: int) -> int:
+        """
+        Size a completion budget from the longer of the prompt's word limit and the author's average post.
+        
+        Args:
+            style_profile: User's writing style profile
+            max_words: Upper word limit the prompt asks for
+            min_tokens: Smallest budget to grant, leaving room for emojis and hashtags,
+                which take several tokens each
+            
+        Returns:
+            max_tokens for the request, at ~1.4 tokens per word plus slack, and at least min_tokens
+        """
+        avg_words = style_profile.get('linguistic_patterns', {}).get('avg_words_per_post', 0)
+        return max(min_tokens, int(max(max_words, avg_words) * 1.4) + 100)
+    
     def _extract_hashtags(self, content: str) -> List[str]:
         """Extract hashtags from post content."""
-        import re
-        hashtags = re.findall(r'#\w+', content)
+        hashtags = HASHTAG_PATTERN.findall(content)
         return hashtags
     
     def _extract_mentions(self, content: str) -> List[str]:
         """Extract @ mentions from post content."""
-        import re
-        mentions = re.findall(r'@\w+', content)
+        mentions = MENTION_PATTERN.findall(content)
         return mentions
     
-    def _estimate_engagement(self, content: str, style_profile: Dict, boost: float = 1.0) -> Dict:
+    def _estimate_engagement(self, content: str, style_profile: Dict, boost: float = 1.0,
+                             word_count: Optional[int] = None) -> Dict:
         """
         Estimate potential engagement based on content and style.
         
@@ -433,6 +724,7 @@ class LinkedInPostGenerator:
             content: Post content
             style_profile: User's writing style profile
             boost: Multiplier for certain post types
+            word_count: Word count of the content, computed here when not given
             
         Returns:
             Dictionary with engagement estimates
@@ -440,7 +732,8 @@ class LinkedInPostGenerator:
         base_score = 100  # Base engagement score
         
         # Content factors
-        word_count = len(content.split())
+        if word_count is None:
+            word_count = len(content.split())
         if 100 <= word_count <= 300:
             base_score += 20  # Optimal length bonus
         
@@ -451,8 +744,8 @@ class LinkedInPostGenerator:
         if 1 <= hashtag_count <= 5:
             base_score += 10  # Optimal hashtag bonus
         
-        emoji_count = len([c for c in content if ord(c) > 127])  # Simple emoji detection
-        if emoji_count > 0:
+        # Simple emoji detection: any non-ASCII character; str.isascii() is O(1)
+        if not content.isascii():
             base_score += 10
         
         # Style profile factors
@@ -482,16 +775,17 @@ class LinkedInPostGenerator:
             if not line:
                 continue
                 
-            # Simple parsing logic
-            if 'hook' in line.lower() or 'intro' in line.lower():
+            # Simple parsing logic; the line is lowercased once for every keyword check
+            lowered = line.lower()
+            if 'hook' in lowered or 'intro' in lowered:
                 if current_section['content']:
                     sections.append(current_section)
                 current_section = {'type': 'intro', 'content': line, 'timing': '0-3s'}
-            elif 'point' in line.lower() or 'main' in line.lower():
+            elif 'point' in lowered or 'main' in lowered:
                 if current_section['content']:
                     sections.append(current_section)
                 current_section = {'type': 'main', 'content': line, 'timing': '3-45s'}
-            elif 'call' in line.lower() or 'cta' in line.lower():
+            elif 'call' in lowered or 'cta' in lowered:
                 if current_section['content']:
                     sections.append(current_section)
                 current_section = {'type': 'cta', 'content': line, 'timing': '45-60s'}
@@ -516,10 +810,9 @@ class LinkedInPostGenerator:
         for line in lines:
             if '?' in line and not question:
                 question = line
-            elif line.startswith(('A)', 'B)', 'C)', 'D)', '1.', '2.', '3.', '4.', '-', '•')):
+            elif (match := POLL_OPTION_PATTERN.match(line)):
                 in_options = True
-                option = line.split(')', 1)[-1].split('.', 1)[-1].strip(' -•')
-                options.append(option)
+                options.append(match.group(1))
             elif not in_options and not question:
                 context += f" {line}"
         
@@ -531,22 +824,10 @@ class LinkedInPostGenerator:
     
     def _generate_fallback_post(self, summary_data: Dict, post_type: str = 'standard') -> Dict:
         """Generate a basic fallback post if AI generation fails."""
-        fallback_content = """🔍 Latest insights from the data visualization community:
-
-📈 Trending topics include climate data, tech salaries, and personal analytics
-🛠️ Python and R continue to dominate as preferred tools
-📊 Original content (OC) posts are getting the most engagement
-
-The r/dataisbeautiful community never ceases to amaze with creative data storytelling!
-
-What's your favorite data visualization from this week?
-
-#DataScience #DataVisualization #Analytics #DataStorytelling"""
-        
         return {
             'post_type': post_type,
-            'content': fallback_content,
-            'hashtags': ['#DataScience', '#DataVisualization', '#Analytics', '#DataStorytelling'],
+            'content': FALLBACK_CONTENT,
+            'hashtags': list(FALLBACK_HASHTAGS),
             'mentions': [],
             'estimated_engagement': {
                 'estimated_likes': 50,
@@ -555,8 +836,8 @@ What's your favorite data visualization from this week?
                 'engagement_score': 85,
                 'confidence': 'low'
             },
-            'character_count': len(fallback_content),
-            'word_count': len(fallback_content.split()),
+            'character_count': len(FALLBACK_CONTENT),
+            'word_count': FALLBACK_WORD_COUNT,
             'generation_timestamp': datetime.now().isoformat(),
             'is_fallback': True
         }
@@ -567,6 +848,12 @@ What's your favorite data visualization from this week?
         """
         Generate a content calendar with multiple post variations.
         
+        When the model supports JSON mode, the days are requested in chunks of up to
+        CALENDAR_CHUNK_DAYS, each a single completion returning a JSON array of posts.
+        The days of a chunk whose response fails validation, or every day on a model
+        without JSON mode, are generated with one request per post type, sampling a
+        completion for each day of that type. Up to max_concurrent requests run at once.
+        
         Args:
             summary_data: Summary data from ContentSummarizer
             style_profile: User's writing style profile
@@ -575,27 +862,322 @@ What's your favorite data visualization from this week?
         Returns:
             List of scheduled post suggestions
         """
+        if days <= 0:
+            return []
+        
         calendar = []
-        post_types = ['standard', 'poll', 'carousel', 'video_script']
+        fallback_days = []
+        
+        # Each request is a blocking network round trip; overlap them on worker threads
+        with ThreadPoolExecutor(max_workers=self.max_concurrent, thread_name_prefix='calendar-post') as executor:
+            if self._supports_json_mode():
+                chunks = self._calendar_chunks(days)
+                chunk_entries = executor.map(
+                    lambda chunk: self._generate_calendar_chunk(summary_data, style_profile, chunk),
+                    chunks
+                )
+                for chunk, entries in zip(chunks, chunk_entries):
+                    if entries is None:
+                        fallback_days.extend(chunk)
+                    else:
+                        calendar.extend(entries)
+            else:
+                fallback_days = list(range(days))
+            
+            if fallback_days:
+                days_by_type = self._calendar_days_by_type(fallback_days)
+                variants = executor.map(
+                    lambda post_type: self._generate_post_variants(
+                        summary_data, style_profile, post_type, len(days_by_type[post_type])
+                    ),
+                    days_by_type
+                )
+                calendar.extend(self._calendar_from_variants(days_by_type, variants))
+        
+        return sorted(calendar, key=lambda entry: entry['day'])
+    
+    async def agenerate_content_calendar(self, summary_data: Dict, 
+                                        style_profile: Dict, 
+                                        days: int = 7,
+                                        timeout_per_post: Optional[float] = None) -> List[Dict]:
+        """
+        Async variant of generate_content_calendar; the per-post-type fallback requests
+        run concurrently, within the rate limiter's budgets.
+        """
+        calendar = [entry async for entry in self.astream_content_calendar(
+            summary_data, style_profile, days, timeout_per_post=timeout_per_post
+        )]
+        return sorted(calendar, key=lambda entry: entry['day'])
+    
+    async def astream_content_calendar(self, summary_data: Dict, 
+                                       style_profile: Dict, 
+                                       days: int = 7,
+                                       timeout_per_post: Optional[float] = None) -> AsyncIterator[Dict]:
+        """
+        Stream content calendar entries as their posts are generated, for interactive use.
+        
+        Entries arrive in completion order, not day order: the batched calendar chunks
+        and, for the days they do not cover, the per-post-type requests run concurrently
+        and each one's days are yielded as soon as it returns, so a slow request does not
+        hold back the rest.
         
-        for day in range(days):
-            post_type = post_types[day % len(post_types)]
+        Args:
+            summary_data: Summary data from ContentSummarizer
+            style_profile: User's writing style profile
+            days: Number of days to generate content for
+            timeout_per_post: Seconds to wait for each post type's request before using
+                fallback posts for its days (None waits indefinitely)
             
-            post = self.generate_post_from_summary(summary_data, style_profile, post_type)
+        Yields:
+            Scheduled post suggestions
+        """
+        if days <= 0:
+            return
+        
+        fallback_days = []
+        
+        if self._supports_json_mode():
+            chunk_tasks = [
+                asyncio.ensure_future(self._agenerate_calendar_chunk(summary_data, style_profile, chunk))
+                for chunk in self._calendar_chunks(days)
+            ]
             
-            calendar_entry = {
-                'day': day + 1,
-                'suggested_post_time': '9:00 AM' if day % 2 == 0 else '2:00 PM',
-                'post_type': post_type,
-                'post_data': post,
-                'notes': self._get_scheduling_notes(post_type),
-                'priority': 'high' if post_type in ['standard', 'poll'] else 'medium'
-            }
+            try:
+                for next_done in asyncio.as_completed(chunk_tasks):
+                    chunk, entries = await next_done
+                    if entries is None:
+                        fallback_days.extend(chunk)
+                        continue
+                    for entry in entries:
+                        yield entry
+            finally:
+                for task in chunk_tasks:
+                    task.cancel()
+        else:
+            fallback_days = list(range(days))
+        
+        if not fallback_days:
+            return
+        
+        days_by_type = self._calendar_days_by_type(fallback_days)
+        
+        tasks = [
+            asyncio.ensure_future(self._agenerate_post_variants_within(
+                summary_data, style_profile, post_type, len(type_days), timeout_per_post
+            ))
+            for post_type, type_days in days_by_type.items()
+        ]
+        
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                post_type, posts = await next_done
+                for day, post in zip(days_by_type[post_type], posts):
+                    yield self._calendar_entry(day, post_type, post)
+        finally:
+            # A consumer that stops early leaves requests in flight
+            for task in tasks:
+                task.cancel()
+    
+    def _generate_post_variants(self, summary_data: Dict, style_profile: Dict, 
+                                post_type: str, count: int) -> List[Dict]:
+        """
+        Generate several posts of one type from a single request sampling n completions.
+        
+        The prompt is sent and billed once instead of once per post, and the samples
+        differ from each other, where repeating an identical request would be answered
+        from the completion cache with the same post.
+        """
+        post_type, (build_request, build_result, label) = self._post_builders(post_type)
+        
+        try:
+            response = self._create_completion(**self._variants_request(build_request, summary_data, style_profile, count))
+        except Exception as e:
+            logger.error(f"Failed to generate {label}: {str(e)}")
+            return [self._generate_fallback_post(summary_data, post_type=post_type) for _ in range(count)]
+        
+        return self._posts_from_variants(response, count, post_type, build_result, label, summary_data, style_profile)
+    
+    async def _agenerate_post_variants(self, summary_data: Dict, style_profile: Dict, 
+                                       post_type: str, count: int) -> List[Dict]:
+        """Async variant of _generate_post_variants using the async OpenAI client."""
+        post_type, (build_request, build_result, label) = self._post_builders(post_type)
+        
+        try:
+            response = await self._acreate_completion(**self._variants_request(build_request, summary_data, style_profile, count))
+        except Exception as e:
+            logger.error(f"Failed to generate {label}: {str(e)}")
+            return [self._generate_fallback_post(summary_data, post_type=post_type) for _ in range(count)]
+        
+        return self._posts_from_variants(response, count, post_type, build_result, label, summary_data, style_profile)
+    
+    async def _agenerate_post_variants_within(self, summary_data: Dict, style_profile: Dict, post_type: str,
+                                              count: int, timeout: Optional[float]) -> Tuple[str, List[Dict]]:
+        """Run _agenerate_post_variants within a timeout, returning the post type with its posts."""
+        try:
+            posts = await asyncio.wait_for(
+                self._agenerate_post_variants(summary_data, style_profile, post_type, count), timeout
+            )
+        except asyncio.TimeoutError:
+            logger.error(f"Generating {post_type} posts timed out after {timeout}s")
+            posts = [self._generate_fallback_post(summary_data, post_type=post_type) for _ in range(count)]
+        
+        return post_type, posts
+    
+    def _variants_request(self, build_request, summary_data: Dict, style_profile: Dict, count: int) -> Dict:
+        """Build a post request sampling count completions (a plain request for one)."""
+        request = build_request(summary_data, style_profile)
+        if count > 1:
+            request['n'] = count
+        return request
+    
+    def _posts_from_variants(self, response, count: int, post_type: str, build_result, label: str,
+                             summary_data: Dict, style_profile: Dict) -> List[Dict]:
+        """Build one post per sampled completion, falling back for any missing or unusable one."""
+        posts = []
+        
+        for index in range(count):
+            try:
+                posts.append(build_result(response.choices[index].message.content.strip(), summary_data, style_profile))
+            except Exception as e:
+                logger.error(f"Failed to generate {label}: {str(e)}")
+                posts.append(self._generate_fallback_post(summary_data, post_type=post_type))
+        
+        return posts
+    
+    def _supports_json_mode(self) -> bool:
+        """Whether the generation model accepts JSON mode, which the batched calendar needs."""
+        # Fine-tuned models are named "ft:<base model>:<org>:..."
+        base_model = self.model.split(':')[1] if self.model.startswith('ft:') else self.model
+        return base_model not in NO_JSON_MODE_MODELS
+    
+    def _calendar_chunks(self, days: int) -> List[range]:
+        """Split the calendar days (0-based) into near-equal chunks of at most CALENDAR_CHUNK_DAYS."""
+        chunk_count = -(-days // CALENDAR_CHUNK_DAYS)
+        bounds = [days * index // chunk_count for index in range(chunk_count + 1)]
+        return [range(start, stop) for start, stop in zip(bounds, bounds[1:])]
+    
+    def _generate_calendar_chunk(self, summary_data: Dict, style_profile: Dict, 
+                                 chunk: range) -> Optional[List[Dict]]:
+        """Generate a chunk of calendar days in one JSON completion; None if it fails."""
+        try:
+            response = self._create_completion(**self._calendar_request(summary_data, style_profile, chunk))
+            return self._calendar_from_response(response.choices[0].message.content, summary_data, style_profile, chunk)
+        except Exception as e:
+            logger.warning(f"Batched calendar generation failed for days {chunk[0] + 1}-{chunk[-1] + 1}, "
+                           f"generating them separately: {str(e)}")
+            return None
+    
+    async def _agenerate_calendar_chunk(self, summary_data: Dict, style_profile: Dict, 
+                                        chunk: range) -> Tuple[range, Optional[List[Dict]]]:
+        """Async variant of _generate_calendar_chunk, returning the chunk with its entries."""
+        try:
+            response = await self._acreate_completion(**self._calendar_request(summary_data, style_profile, chunk))
+            return chunk, self._calendar_from_response(response.choices[0].message.content, summary_data, style_profile, chunk)
+        except Exception as e:
+            logger.warning(f"Batched calendar generation failed for days {chunk[0] + 1}-{chunk[-1] + 1}, "
+                           f"generating them separately: {str(e)}")
+            return chunk, None
+    
+    def _calendar_days_by_type(self, days: Iterable[int]) -> Dict[str, List[int]]:
+        """Group calendar days (0-based) by their post type, in order of first use."""
+        days_by_type = {}
+        for day in days:
+            days_by_type.setdefault(self._calendar_post_type(day), []).append(day)
+        return days_by_type
+    
+    def _calendar_from_variants(self, days_by_type: Dict[str, List[int]], 
+                                variants: Iterable[List[Dict]]) -> List[Dict]:
+        """Build a calendar entry for each post type's days from its generated posts."""
+        return [
+            self._calendar_entry(day, post_type, post)
+            for (post_type, type_days), type_posts in zip(days_by_type.items(), variants)
+            for day, post in zip(type_days, type_posts)
+        ]
+    
+    def _calendar_request(self, summary_data: Dict, style_profile: Dict, days: range) -> Dict:
+        """Build a single chat completion request covering a range of calendar days (0-based)."""
+        summary_text = summary_data.get('summary', '')
+        insights = summary_data.get('insights', {})
+        schedule = '\n            '.join(
+            f"Day {day + 1}: {self._calendar_post_type(day)}" for day in days
+        )
+        
+        prompt = f"""
+            Create a {len(days)}-day LinkedIn content calendar about data visualization trends from r/dataisbeautiful.
+            
+            Content Summary:
+            {summary_text}
+            
+            Key Insights:
+            - Trending keywords: {', '.join([kw[0] for kw in insights.get('trending_keywords', [])[:5]])}
+            - Popular tools: {', '.join([tool[0] for tool in insights.get('top_tools', [])[:3]])}
+            - Content themes: {', '.join([theme['theme'] for theme in insights.get('content_themes', [])[:3]])}
+            
+            Post type for each day:
+            {schedule}
             
-            calendar.append(calendar_entry)
+            Post type formats:
+            - standard: an engaging 150-300 word post that ends with a question or insight
+            - poll: a poll question, 2-4 options on separate lines starting with A), B), C), D), and 100-150 words of context
+            - carousel: a 100-150 word introduction that encourages people to swipe through
+            - video_script: a 60-90 second script with a hook, 3 key points and a call to action, with timing cues
+            
+            Respond with a JSON object of the form
+            {{"calendar": [{{"day": {days[0] + 1}, "post_type": "{self._calendar_post_type(days[0])}", "content": "..."}}]}}
+            containing exactly one entry per day, in day order.
+            """
+        
+        return self._chat_request(
+            style_profile,
+            "You are an expert LinkedIn content strategist planning posts for data science professionals.",
+            prompt,
+            temperature=0.7,
+            max_tokens=CALENDAR_TOKENS_PER_DAY * len(days),
+            response_format={"type": "json_object"}
+        )
+    
+    def _calendar_from_response(self, content: str, summary_data: Dict, 
+                                style_profile: Dict, days: range) -> List[Dict]:
+        """
+        Build calendar entries for a range of days from a batched calendar completion.
+        
+        Raises:
+            ValueError: If the response does not hold one post per calendar day
+        """
+        entries = json.loads(content).get('calendar')
+        
+        if not isinstance(entries, list) or len(entries) != len(days):
+            raise ValueError(f"Expected {len(days)} calendar entries in the response")
+        
+        calendar = []
+        
+        for day, entry in zip(days, entries):
+            post_content = entry.get('content') if isinstance(entry, dict) else None
+            if not isinstance(post_content, str) or not post_content.strip():
+                raise ValueError(f"Calendar day {day + 1} has no content")
+            
+            post_type, (_, build_result, _) = self._post_builders(self._calendar_post_type(day))
+            post = build_result(post_content.strip(), summary_data, style_profile)
+            calendar.append(self._calendar_entry(day, post_type, post))
         
         return calendar
     
+    def _calendar_post_type(self, day: int) -> str:
+        """Rotate through post types across the calendar days."""
+        post_types = ['standard', 'poll', 'carousel', 'video_script']
+        return post_types[day % len(post_types)]
+    
+    def _calendar_entry(self, day: int, post_type: str, post: Dict) -> Dict:
+        """Build a single content calendar entry."""
+        return {
+            'day': day + 1,
+            'suggested_post_time': '9:00 AM' if day % 2 == 0 else '2:00 PM',
+            'post_type': post_type,
+            'post_data': post,
+            'notes': self._get_scheduling_notes(post_type),
+            'priority': 'high' if post_type in ['standard', 'poll'] else 'medium'
+        }
+    
     def _get_scheduling_notes(self, post_type: str) -> List[str]:
         """Get scheduling and optimization notes for different post types."""
         notes = {
@@ -626,8 +1208,9 @@ What's your favorite data visualization from this week?
     def save_generated_content(self, content: Dict, filename: str = "linkedin_post.json"):
         """Save generated content to a JSON file."""
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(content, f, indent=2, ensure_ascii=False)
+            # orjson encodes straight to UTF-8 bytes, much faster than json.dump with indent
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(content, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
             logger.info(f"Generated content saved to {filename}")
         except Exception as e:
             logger.error(f"Failed to save generated content: {str(e)}")
\ No newline at end of file
@@ -2,12 +2,17 @@ import praw
 import requests
 import time
 import json
-from typing import List, Dict, Optional
+import re
+from collections import Counter
+from typing import List, Dict, Iterable, Iterator, Optional
 from datetime import datetime, timedelta
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Meaningful words for trending topics: 3+ lowercase letters
+TOPIC_WORD_PATTERN = re.compile(r'\b[a-z]{3,}\b')
+
 
 class RedditScraper:
     """
@@ -67,11 +72,31 @@ class RedditScraper:
         Returns:
             List of dictionaries containing post data
         """
+        return list(self.iter_dataisbeautiful_posts(time_filter, limit, sort))
+    
+    def iter_dataisbeautiful_posts(self, 
+                                   time_filter: str = "week", 
+                                   limit: int = 100,
+                                   sort: str = "hot") -> Iterator[Dict]:
+        """
+        Yield posts from r/dataisbeautiful as PRAW's listing produces them.
+        
+        Lets callers filter posts while they are scraped instead of first
+        materializing the full list.
+        
+        Args:
+            time_filter: Time period to filter posts ("hour", "day", "week", "month", "year", "all")
+            limit: Maximum number of posts to retrieve
+            sort: Sorting method ("hot", "new", "top", "rising")
+            
+        Yields:
+            Dictionaries containing post data
+        """
         if not self.reddit:
             if not self.setup_reddit_client():
-                return []
+                return
         
-        posts = []
+        scraped = 0
         
         try:
             subreddit = self.reddit.subreddit("dataisbeautiful")
@@ -91,17 +116,16 @@ class RedditScraper:
             for submission in submissions:
                 post_data = self._extract_post_data(submission)
                 if post_data:
-                    posts.append(post_data)
+                    scraped += 1
+                    yield post_data
                     
                 # Rate limiting
                 time.sleep(0.1)
             
-            logger.info(f"Scraped {len(posts)} posts from r/dataisbeautiful")
-            return posts
+            logger.info(f"Scraped {scraped} posts from r/dataisbeautiful")
             
         except Exception as e:
             logger.error(f"Failed to scrape Reddit posts: {str(e)}")
-            return posts
     
     def _extract_post_data(self, submission) -> Optional[Dict]:
         """
@@ -188,14 +212,15 @@ class RedditScraper:
         
         return comments
     
-    def filter_high_quality_posts(self, posts: List[Dict], 
+    def filter_high_quality_posts(self, posts: Iterable[Dict], 
                                   min_score: int = 50, 
                                   min_comments: int = 10) -> List[Dict]:
         """
         Filter posts based on engagement metrics to get high-quality content.
         
         Args:
-            posts: List of post dictionaries
+            posts: Post dictionaries; may be a generator such as iter_dataisbeautiful_posts,
+                so only the filtered posts are ever held in memory
             min_score: Minimum score threshold
             min_comments: Minimum number of comments
             
@@ -203,15 +228,17 @@ class RedditScraper:
             Filtered list of high-quality posts
         """
         filtered_posts = []
+        total_posts = 0
         
         for post in posts:
+            total_posts += 1
             if (post['score'] >= min_score and 
                 post['num_comments'] >= min_comments and 
                 not post['over_18'] and 
                 not post['spoiler']):
                 filtered_posts.append(post)
         
-        logger.info(f"Filtered {len(filtered_posts)} high-quality posts from {len(posts)} total posts")
+        logger.info(f"Filtered {len(filtered_posts)} high-quality posts from {total_posts} total posts")
         return filtered_posts
     
     def categorize_posts(self, posts: List[Dict]) -> Dict[str, List[Dict]]:
@@ -276,9 +303,6 @@ class RedditScraper:
         Returns:
             List of trending topic dictionaries
         """
-        from collections import Counter
-        import re
-        
         # Extract words from titles and text
         all_words = []
         topic_scores = Counter()
@@ -294,7 +318,7 @@ class RedditScraper:
             text = f"{post['title']} {post['selftext']}".lower()
             
             # Extract meaningful words (3+ characters, alphanumeric)
-            words = re.findall(r'\b[a-z]{3,}\b', text)
+            words = TOPIC_WORD_PATTERN.findall(text)
             
             # Filter out stop words and add to collection
             meaningful_words = [word for word in words if word not in stop_words]
@@ -452,4 +476,8 @@ class MockRedditScraper(RedditScraper):
     def get_dataisbeautiful_posts(self, time_filter: str = "week", limit: int = 100, sort: str = "hot") -> List[Dict]:
         """Return sample posts instead of scraping."""
         logger.info(f"Returning {len(self.sample_posts)} mock Reddit posts")
-        return self.sample_posts[:limit]
\ No newline at end of file
+        return self.sample_posts[:limit]
+    
+    def iter_dataisbeautiful_posts(self, time_filter: str = "week", limit: int = 100, sort: str = "hot") -> Iterator[Dict]:
+        """Yield sample posts instead of scraping."""
+        yield from self.get_dataisbeautiful_posts(time_filter, limit, sort)
\ No newline at end of file
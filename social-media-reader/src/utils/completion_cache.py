@@ -0,0 +1,119 @@
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+from openai.types.chat import ChatCompletion
+
+logger = logging.getLogger(__name__)
+
+
+class CompletionCache:
+    """
+    On-disk LRU cache for OpenAI chat completions, keyed by a hash of the request.
+
+    Repeated pipeline runs re-issue identical completions; serving them from disk
+    skips the network round trip and the API cost. Entries expire after a TTL and
+    the least recently used ones are evicted once the cache exceeds its capacity.
+    """
+
+    def __init__(self, cache_dir: str, capacity: int = 1000, ttl_hours: float = 24):
+        """
+        Initialize the completion cache.
+
+        Args:
+            cache_dir: Directory holding the cache database
+            capacity: Maximum number of cached completions
+            ttl_hours: Hours before a cached completion expires
+        """
+        Path(cache_dir).mkdir(parents=True, exist_ok=True)
+        self.capacity = capacity
+        self.ttl_seconds = ttl_hours * 3600
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(Path(cache_dir) / 'completions.sqlite3'), check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS completions ("
+            "key TEXT PRIMARY KEY, response TEXT NOT NULL, "
+            "created_at REAL NOT NULL, last_access REAL NOT NULL)"
+        )
+        self._db.commit()
+
+    @staticmethod
+    def make_key(request: Dict) -> str:
+        """Hash the model, messages and sampling parameters of a completion request."""
+        payload = json.dumps(request, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, request: Dict) -> Optional[ChatCompletion]:
+        """
+        Look up a cached completion.
+
+        Args:
+            request: Chat completion request parameters
+
+        Returns:
+            Cached ChatCompletion, or None on a miss
+        """
+        key = self.make_key(request)
+        now = time.time()
+
+        with self._lock:
+            row = self._db.execute(
+                "SELECT response, created_at FROM completions WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            if now - row[1] > self.ttl_seconds:
+                self._db.execute("DELETE FROM completions WHERE key = ?", (key,))
+                self._db.commit()
+                return None
+
+            self._db.execute("UPDATE completions SET last_access = ? WHERE key = ?", (now, key))
+            self._db.commit()
+
+        logger.debug(f"Completion cache hit: {key[:12]}")
+        return ChatCompletion.model_validate_json(row[0])
+
+    def set(self, request: Dict, response: ChatCompletion):
+        """
+        Store a completion, evicting the least recently used entries above capacity.
+
+        Args:
+            request: Chat completion request parameters
+            response: ChatCompletion returned for the request
+        """
+        key = self.make_key(request)
+        now = time.time()
+
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO completions (key, response, created_at, last_access) VALUES (?, ?, ?, ?)",
+                (key, response.model_dump_json(), now, now)
+            )
+            self._db.execute(
+                "DELETE FROM completions WHERE key IN ("
+                "SELECT key FROM completions ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+                (self.capacity,)
+            )
+            self._db.commit()
+
+    def clear(self):
+        """Remove every cached completion."""
+        with self._lock:
+            self._db.execute("DELETE FROM completions")
+            self._db.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM completions").fetchone()[0]
+
+    def close(self):
+        """Close the cache database."""
+        with self._lock:
+            self._db.close()
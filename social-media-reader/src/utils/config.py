@@ -62,6 +62,18 @@ class Config:
     def OPENAI_MODEL(self) -> str:
         return os.getenv('OPENAI_MODEL', 'gpt-4')
     
+    @property
+    def OPENAI_MODEL_LIGHT(self) -> str:
+        return os.getenv('OPENAI_MODEL_LIGHT', 'gpt-4.1-nano')
+    
+    @property
+    def OPENAI_MODEL_HEAVY(self) -> str:
+        return os.getenv('OPENAI_MODEL_HEAVY', self.OPENAI_MODEL)
+    
+    @property
+    def USE_BATCH_API(self) -> bool:
+        return os.getenv('USE_BATCH_API', 'false').lower() in ('true', '1', 'yes')
+    
     # LinkedIn Configuration
     @property
     def LINKEDIN_EMAIL(self) -> str:
@@ -115,6 +127,10 @@ class Config:
     def DATA_DIR(self) -> str:
         return os.getenv('DATA_DIR', './data')
     
+    @property
+    def SAVE_INTERMEDIATES(self) -> bool:
+        return os.getenv('SAVE_INTERMEDIATES', 'false').lower() in ('true', '1', 'yes')
+    
     # Logging Configuration
     @property
     def LOG_LEVEL(self) -> str:
@@ -228,6 +244,24 @@ class Config:
         except ValueError:
             return 24
     
+    @property
+    def LLM_CACHE_CAPACITY(self) -> int:
+        try:
+            return int(os.getenv('LLM_CACHE_CAPACITY', '1000'))
+        except ValueError:
+            return 1000
+    
+    @property
+    def STYLE_CACHE_TTL_HOURS(self) -> int:
+        try:
+            return int(os.getenv('STYLE_CACHE_TTL_HOURS', '24'))
+        except ValueError:
+            return 24
+    
+    @property
+    def ENABLE_SEMANTIC_CACHE(self) -> bool:
+        return os.getenv('ENABLE_SEMANTIC_CACHE', 'false').lower() in ('true', '1', 'yes')
+    
     # Feature Flags
     @property
     def ENABLE_VIDEO_SCRIPTS(self) -> bool:
@@ -289,6 +323,9 @@ class Config:
         """Get a summary of current configuration (excluding sensitive data)."""
         return {
             'openai_model': self.OPENAI_MODEL,
+            'openai_model_light': self.OPENAI_MODEL_LIGHT,
+            'openai_model_heavy': self.OPENAI_MODEL_HEAVY,
+            'use_batch_api': self.USE_BATCH_API,
             'use_mock_data': self.USE_MOCK_DATA,
             'max_linkedin_posts': self.MAX_LINKEDIN_POSTS,
             'max_reddit_posts': self.MAX_REDDIT_POSTS,
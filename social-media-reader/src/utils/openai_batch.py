@@ -0,0 +1,97 @@
+import json
+import time
+import logging
+from typing import Dict
+
+from openai.types.chat import ChatCompletion
+
+from src.utils.rate_limiter import call_with_retries
+
+logger = logging.getLogger(__name__)
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+BATCH_TERMINAL_STATUSES = ('completed', 'failed', 'expired', 'cancelled')
+
+
+def run_chat_batch(client, requests: Dict[str, Dict],
+                   poll_interval: float = 30.0) -> Dict[str, ChatCompletion]:
+    """
+    Submit chat completion requests through the OpenAI Batch API and wait for the results.
+
+    The Batch API is billed at half the real-time price in exchange for
+    asynchronous (up to 24h) turnaround, which suits the offline pipeline.
+
+    Args:
+        client: OpenAI client
+        requests: Mapping of custom_id to chat completion request parameters
+        poll_interval: Seconds to wait between batch status checks
+
+    Returns:
+        Mapping of custom_id to ChatCompletion for every request that succeeded
+    """
+    batch_input = '\n'.join(
+        json.dumps({
+            'custom_id': custom_id,
+            'method': 'POST',
+            'url': BATCH_ENDPOINT,
+            'body': body
+        }, ensure_ascii=False)
+        for custom_id, body in requests.items()
+    ).encode('utf-8')
+
+    input_file = call_with_retries(
+        lambda: client.files.create(file=('batch_input.jsonl', batch_input), purpose='batch')
+    )
+    batch = call_with_retries(lambda: client.batches.create(
+        input_file_id=input_file.id,
+        endpoint=BATCH_ENDPOINT,
+        completion_window='24h'
+    ))
+    logger.info(f"Submitted batch {batch.id} with {len(requests)} requests")
+
+    while batch.status not in BATCH_TERMINAL_STATUSES:
+        time.sleep(poll_interval)
+        batch = call_with_retries(lambda: client.batches.retrieve(batch.id))
+
+    if batch.status != 'completed':
+        raise RuntimeError(f"Batch {batch.id} finished with status: {batch.status}")
+
+    results = {}
+
+    if batch.output_file_id:
+        output = call_with_retries(lambda: client.files.content(batch.output_file_id)).text
+
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+
+            result = json.loads(line)
+            response = result.get('response') or {}
+
+            if response.get('status_code') == 200:
+                results[result['custom_id']] = ChatCompletion.model_validate(response['body'])
+            else:
+                logger.warning(f"Batch request {result['custom_id']} failed: {result.get('error') or response}")
+
+    logger.info(f"Batch {batch.id} completed: {len(results)}/{len(requests)} requests succeeded")
+    return results
+
+
+def create_batch_completion(client, request: Dict, poll_interval: float = 30.0) -> ChatCompletion:
+    """
+    Run a single chat completion request through the Batch API.
+
+    Args:
+        client: OpenAI client
+        request: Chat completion request parameters
+        poll_interval: Seconds to wait between batch status checks
+
+    Returns:
+        ChatCompletion for the request
+    """
+    results = run_chat_batch(client, {'request-0': request}, poll_interval)
+
+    if 'request-0' not in results:
+        raise RuntimeError("Batch completion request failed")
+
+    return results['request-0']
@@ -0,0 +1,183 @@
+import time
+import random
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+
+import openai
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# Errors worth retrying: throttling and transient server or network failures. OpenAI
+# clients are built with max_retries=0 so these retries are not multiplied by the SDK's
+RETRYABLE_ERRORS = (openai.RateLimitError, openai.APIConnectionError, openai.InternalServerError)
+
+
+def estimate_request_tokens(request: Dict) -> int:
+    """
+    Estimate the tokens a chat completion request consumes against the TPM limit.
+
+    Uses the ~4 characters per token rule of thumb for the prompt plus the
+    requested completion budget.
+
+    Args:
+        request: Chat completion request parameters
+
+    Returns:
+        Estimated token count
+    """
+    prompt_chars = sum(len(str(message.get('content', ''))) for message in request.get('messages', []))
+    completion_tokens = request.get('max_tokens', 15) * request.get('n', 1)
+    return prompt_chars // 4 + completion_tokens
+
+
+def backoff_delay(attempt: int, base_delay: float, max_delay: float) -> float:
+    """Full-jitter exponential backoff delay in seconds after the given failed attempt."""
+    return random.uniform(0, min(max_delay, base_delay * 2 ** attempt))
+
+
+def call_with_retries(make_request: Callable[[], T], max_attempts: int = 5,
+                      base_delay: float = 1.0, max_delay: float = 60.0) -> T:
+    """
+    Run a blocking request, retrying throttled or transient failures with jittered backoff.
+    
+    Args:
+        make_request: Callable issuing the request, invoked once per attempt
+        max_attempts: Attempts before giving up
+        base_delay: Backoff delay in seconds before the first retry
+        max_delay: Upper bound for a single backoff delay in seconds
+        
+    Returns:
+        Result of the request
+    """
+    for attempt in range(max_attempts):
+        try:
+            return make_request()
+        except RETRYABLE_ERRORS as e:
+            if attempt == max_attempts - 1:
+                raise
+            
+            delay = backoff_delay(attempt, base_delay, max_delay)
+            logger.warning(f"Request failed ({type(e).__name__}), retrying in {delay:.1f}s "
+                           f"(attempt {attempt + 1}/{max_attempts})")
+            time.sleep(delay)
+
+
+class AsyncRateLimiter:
+    """
+    Client-side throttle for concurrent OpenAI requests.
+
+    Two token buckets enforce the requests-per-minute and tokens-per-minute
+    limits, a semaphore caps the requests in flight, and throttled or transient
+    failures are retried with jittered exponential backoff, following OpenAI's
+    api_request_parallel_processor pattern.
+    """
+
+    def __init__(self, max_requests_per_minute: float = 500,
+                 max_tokens_per_minute: float = 30000,
+                 max_concurrent: int = 10,
+                 max_attempts: int = 5,
+                 base_delay: float = 1.0,
+                 max_delay: float = 60.0):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            max_requests_per_minute: Request budget per minute
+            max_tokens_per_minute: Token budget per minute
+            max_concurrent: Maximum number of requests in flight
+            max_attempts: Attempts per request before giving up
+            base_delay: Backoff delay in seconds before the first retry
+            max_delay: Upper bound for a single backoff delay in seconds
+        """
+        self.max_requests_per_minute = max_requests_per_minute
+        self.max_tokens_per_minute = max_tokens_per_minute
+        self.max_concurrent = max_concurrent
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+        self._available_requests = float(max_requests_per_minute)
+        self._available_tokens = float(max_tokens_per_minute)
+        self._last_update = time.monotonic()
+
+        # asyncio primitives bind to the loop they are used on; recreated per loop
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _bind_loop(self):
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._lock = asyncio.Lock()
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+
+    def _refill(self):
+        """Refill both buckets for the time elapsed since the last update."""
+        now = time.monotonic()
+        elapsed_minutes = (now - self._last_update) / 60
+        self._last_update = now
+
+        self._available_requests = min(
+            self.max_requests_per_minute,
+            self._available_requests + elapsed_minutes * self.max_requests_per_minute
+        )
+        self._available_tokens = min(
+            self.max_tokens_per_minute,
+            self._available_tokens + elapsed_minutes * self.max_tokens_per_minute
+        )
+
+    async def acquire(self, tokens: int):
+        """
+        Wait until the budgets allow one more request consuming the given tokens.
+
+        Args:
+            tokens: Estimated tokens for the request
+        """
+        self._bind_loop()
+        # A request larger than the whole minute budget would otherwise wait forever
+        tokens = min(tokens, self.max_tokens_per_minute)
+
+        async with self._lock:
+            while True:
+                self._refill()
+
+                if self._available_requests >= 1 and self._available_tokens >= tokens:
+                    self._available_requests -= 1
+                    self._available_tokens -= tokens
+                    return
+
+                request_wait = (1 - self._available_requests) / self.max_requests_per_minute * 60
+                token_wait = (tokens - self._available_tokens) / self.max_tokens_per_minute * 60
+                await asyncio.sleep(max(request_wait, token_wait, 0.001))
+
+    async def run(self, make_request: Callable[[], Awaitable[T]], tokens: int) -> T:
+        """
+        Run a request within the rate limits, retrying throttled or transient failures.
+
+        Args:
+            make_request: Factory returning a new awaitable for each attempt
+            tokens: Estimated tokens for the request
+
+        Returns:
+            Result of the request
+        """
+        self._bind_loop()
+
+        async with self._semaphore:
+            for attempt in range(self.max_attempts):
+                await self.acquire(tokens)
+
+                try:
+                    return await make_request()
+                except RETRYABLE_ERRORS as e:
+                    if attempt == self.max_attempts - 1:
+                        raise
+
+                    delay = backoff_delay(attempt, self.base_delay, self.max_delay)
+                    logger.warning(f"Request failed ({type(e).__name__}), retrying in {delay:.1f}s "
+                                   f"(attempt {attempt + 1}/{self.max_attempts})")
+                    await asyncio.sleep(delay)
@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, AsyncMock
 import json
 import tempfile
 from pathlib import Path
@@ -100,6 +100,14 @@ class TestWritingStyleAnalyzer:
         assert 'overall_tone' in tone
         assert tone['overall_tone'] in ['positive', 'negative', 'neutral']
     
+    def test_count_keywords_matches_str_count(self, analyzer):
+        """Test keyword counting matches str.count, including self-overlapping keywords."""
+        text = "learning to lead: experiencexperience, successuccess and ai in data teams"
+        counts = analyzer._count_keywords(text)
+        
+        for keyword in ('learn', 'learning', 'lead', 'experience', 'success', 'ai', 'data', 'team'):
+            assert counts[keyword] == text.count(keyword)
+    
     def test_analyze_engagement_patterns(self, analyzer, sample_linkedin_posts):
         """Test engagement pattern analysis."""
         patterns = analyzer._analyze_engagement_patterns(sample_linkedin_posts)
@@ -144,6 +152,9 @@ class TestWritingStyleAnalyzer:
         assert 'voice_characteristics' in profile
         assert 'common_phrases' in profile
         assert profile == mock_style_profile
+        
+        call_kwargs = analyzer.client.chat.completions.create.call_args.kwargs
+        assert call_kwargs['response_format'] == {"type": "json_object"}
     
     def test_full_analysis_workflow(self, analyzer, sample_linkedin_posts):
         """Test complete analysis workflow."""
@@ -165,6 +176,38 @@ class TestWritingStyleAnalyzer:
             # Check that style_profile was stored
             assert analyzer.style_profile == result
     
+    def test_analyze_posts_batch(self, analyzer, sample_linkedin_posts):
+        """Test analyzing several authors with one batch job for the AI style profiles."""
+        response = Mock()
+        response.choices = [Mock()]
+        response.choices[0].message.content = json.dumps({"tone": "enthusiastic"})
+        
+        posts_by_author = {
+            'https://linkedin.com/in/alice': sample_linkedin_posts,
+            'https://linkedin.com/in/bob': sample_linkedin_posts[:1],
+            'https://linkedin.com/in/carol': [{"likes": 3}]
+        }
+        
+        with patch('src.analyzers.style_analyzer.run_chat_batch') as mock_batch:
+            mock_batch.side_effect = lambda client, requests: {
+                custom_id: response for custom_id in requests if custom_id != 'author-1'
+            }
+            
+            results = analyzer.analyze_posts_batch(posts_by_author)
+        
+        # One batch job carries every author with text
+        assert mock_batch.call_count == 1
+        assert len(mock_batch.call_args[0][1]) == 2
+        
+        alice = results['https://linkedin.com/in/alice']
+        assert alice['ai_style_profile'] == {"tone": "enthusiastic"}
+        assert 'linguistic_patterns' in alice
+        
+        # Missing batch results fall back per author; authors without text are skipped
+        assert results['https://linkedin.com/in/bob']['ai_style_profile']['tone'] == 'professional'
+        assert results['https://linkedin.com/in/carol'] == {}
+        assert analyzer.style_profile == {}
+    
     def test_generate_style_summary(self, analyzer, sample_style_profile):
         """Test style summary generation."""
         analyzer.style_profile = sample_style_profile
@@ -221,9 +264,9 @@ class TestContentSummarizer:
         # Posts should be sorted by engagement (score + comments)
         assert selected_posts[0]['score'] >= selected_posts[1]['score']
     
-    def test_categorize_content(self, summarizer, sample_reddit_posts):
+    def test_analyze_posts_categories(self, summarizer, sample_reddit_posts):
         """Test content categorization."""
-        categories = summarizer._categorize_content(sample_reddit_posts)
+        categories, _ = summarizer._analyze_posts(sample_reddit_posts)
         
         expected_categories = [
             'data_visualizations', 'datasets_and_tools', 'analysis_and_insights',
@@ -238,9 +281,18 @@ class TestContentSummarizer:
         total_categorized = sum(len(posts) for posts in categories.values())
         assert total_categorized > 0
     
-    def test_extract_insights(self, summarizer, sample_reddit_posts):
+    def test_match_buckets(self, summarizer):
+        """Test keyword matching picks the first category and every matching theme."""
+        category, themes = summarizer._match_buckets("[oc] climate chart: global warming and salary trends over time")
+        
+        assert category == 'data_visualizations'
+        assert themes == {'Climate & Environment', 'Economics & Finance'}
+        
+        assert summarizer._match_buckets("my weekend project") == ('personal_projects', set())
+    
+    def test_analyze_posts_insights(self, summarizer, sample_reddit_posts):
         """Test insight extraction."""
-        insights = summarizer._extract_insights(sample_reddit_posts)
+        _, insights = summarizer._analyze_posts(sample_reddit_posts)
         
         assert 'trending_keywords' in insights
         assert 'top_tools' in insights
@@ -255,9 +307,9 @@ class TestContentSummarizer:
         assert 'total_posts_analyzed' in stats
         assert stats['total_posts_analyzed'] == len(sample_reddit_posts)
     
-    def test_identify_content_themes(self, summarizer, sample_reddit_posts):
+    def test_analyze_posts_content_themes(self, summarizer, sample_reddit_posts):
         """Test content theme identification."""
-        themes = summarizer._identify_content_themes(sample_reddit_posts)
+        themes = summarizer._analyze_posts(sample_reddit_posts)[1]['content_themes']
         
         assert isinstance(themes, list)
         
@@ -271,8 +323,7 @@ class TestContentSummarizer:
     
     def test_prepare_content_for_ai(self, summarizer, sample_reddit_posts, sample_style_profile):
         """Test content preparation for AI processing."""
-        categorized_content = summarizer._categorize_content(sample_reddit_posts)
-        insights = summarizer._extract_insights(sample_reddit_posts)
+        categorized_content, insights = summarizer._analyze_posts(sample_reddit_posts)
         
         content_summary = summarizer._prepare_content_for_ai(categorized_content, insights)
         
@@ -293,18 +344,51 @@ class TestContentSummarizer:
     
     def test_generate_styled_summary(self, summarizer, sample_reddit_posts, sample_style_profile):
         """Test styled summary generation."""
-        categorized_content = summarizer._categorize_content(sample_reddit_posts)
-        insights = summarizer._extract_insights(sample_reddit_posts)
+        categorized_content, insights = summarizer._analyze_posts(sample_reddit_posts)
         
         summary = summarizer._generate_styled_summary(categorized_content, insights, sample_style_profile)
         
         assert isinstance(summary, str)
         assert len(summary) > 0
     
+    def test_semantic_cache(self, summarizer, mock_openai_client, sample_reddit_posts, sample_style_profile):
+        """Test near-identical content reuses the cached styled summary."""
+        summarizer.use_semantic_cache = True
+        summarizer.response_cache_size = 0  # isolate from the exact-match cache
+        embeddings = [[1.0, 0.0], [0.99, 0.05], [0.0, 1.0]]
+        mock_openai_client.embeddings.create.side_effect = [
+            Mock(data=[Mock(embedding=embedding)]) for embedding in embeddings
+        ]
+        categorized_content, insights = summarizer._analyze_posts(sample_reddit_posts)
+        
+        first = summarizer._generate_styled_summary(categorized_content, insights, sample_style_profile)
+        second = summarizer._generate_styled_summary(categorized_content, insights, sample_style_profile)
+        
+        assert second == first
+        assert mock_openai_client.chat.completions.create.call_count == 1
+        
+        # A dissimilar embedding misses the cache
+        summarizer._generate_styled_summary(categorized_content, insights, sample_style_profile)
+        assert mock_openai_client.chat.completions.create.call_count == 2
+    
+    def test_exact_match_response_cache(self, mock_openai_client, sample_reddit_posts, sample_style_profile):
+        """Test identical requests are served from the in-memory cache in deterministic mode."""
+        with patch('src.analyzers.content_summarizer.openai.OpenAI') as mock_openai:
+            mock_openai.return_value = mock_openai_client
+            summarizer = ContentSummarizer("test-api-key", "gpt-4", deterministic=True)
+        
+        categorized_content, insights = summarizer._analyze_posts(sample_reddit_posts)
+        
+        first = summarizer._generate_styled_summary(categorized_content, insights, sample_style_profile)
+        second = summarizer._generate_styled_summary(categorized_content, insights, sample_style_profile)
+        
+        assert second == first
+        assert mock_openai_client.chat.completions.create.call_count == 1
+        assert mock_openai_client.chat.completions.create.call_args.kwargs['temperature'] == 0
+    
     def test_generate_fallback_summary(self, summarizer, sample_reddit_posts, sample_style_profile):
         """Test fallback summary generation."""
-        categorized_content = summarizer._categorize_content(sample_reddit_posts)
-        insights = summarizer._extract_insights(sample_reddit_posts)
+        categorized_content, insights = summarizer._analyze_posts(sample_reddit_posts)
         
         fallback_summary = summarizer._generate_fallback_summary(categorized_content, insights)
         
@@ -326,6 +410,11 @@ class TestContentSummarizer:
         assert 'insights' in result
         assert 'categorized_content' in result
         
+        # Categorized posts are saved as references, not full copies
+        for posts in result['categorized_content'].values():
+            for post in posts:
+                assert set(post) == {'id', 'title', 'score'}
+        
         # Check metadata
         metadata = result['metadata']
         assert 'posts_analyzed' in metadata
@@ -334,8 +423,13 @@ class TestContentSummarizer:
         assert 'generation_timestamp' in metadata
         assert metadata['style_applied'] == True
     
-    def test_generate_multiple_variations(self, summarizer, sample_reddit_posts, sample_style_profile):
+    def test_generate_multiple_variations(self, summarizer, mock_openai_client, sample_reddit_posts, sample_style_profile):
         """Test generating multiple summary variations."""
+        summarizer._async_client = Mock()
+        summarizer._async_client.chat.completions.create = AsyncMock(
+            return_value=mock_openai_client.chat.completions.create.return_value
+        )
+        
         variations = summarizer.generate_multiple_variations(
             sample_reddit_posts, 
             sample_style_profile, 
@@ -350,6 +444,31 @@ class TestContentSummarizer:
             assert 'summary' in variation
             assert 'timestamp' in variation
             assert variation['variation'] == i + 1
+        
+        # One base summary; the mocked reply is not a JSON batch, so after the batched
+        # attempt the focused rewrites run concurrently, one per angle
+        assert mock_openai_client.chat.completions.create.call_count == 1
+        assert summarizer._async_client.chat.completions.create.await_count == 4
+    
+    def test_generate_multiple_variations_single_call(self, summarizer, mock_openai_client, sample_reddit_posts, sample_style_profile):
+        """Test that every focused rewrite comes from one batched request."""
+        batch_response = Mock()
+        batch_response.choices = [Mock()]
+        batch_response.choices[0].message.content = json.dumps({
+            'variations': [{'focus': f'angle {i}', 'summary': f'Rewrite {i}'} for i in range(3)]
+        })
+        summarizer._async_client = Mock()
+        summarizer._async_client.chat.completions.create = AsyncMock(return_value=batch_response)
+        
+        variations = summarizer.generate_multiple_variations(
+            sample_reddit_posts, 
+            sample_style_profile, 
+            num_variations=3
+        )
+        
+        assert [variation['summary'] for variation in variations] == ['Rewrite 0', 'Rewrite 1', 'Rewrite 2']
+        assert summarizer._async_client.chat.completions.create.await_count == 1
+        assert summarizer._async_client.chat.completions.create.call_args.kwargs['model'] == summarizer.rewrite_model
     
     def test_save_summary(self, summarizer, sample_summary_data, temp_dir):
         """Test saving summary to file."""
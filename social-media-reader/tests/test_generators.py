@@ -1,6 +1,8 @@
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, AsyncMock
 import json
+import re
+import asyncio
 from pathlib import Path
 
 from src.generators.linkedin_post_generator import LinkedInPostGenerator
@@ -22,7 +24,26 @@ class TestLinkedInPostGenerator:
         with patch('src.generators.linkedin_post_generator.openai.OpenAI') as mock_openai:
             generator = LinkedInPostGenerator("test-key", "gpt-3.5-turbo")
             assert generator.model == "gpt-3.5-turbo"
-    
+
+    def test_init_with_shared_client(self, mock_openai_client):
+        """Test injected sync and async clients are used instead of creating new ones."""
+        mock_async_client = Mock()
+        with patch('src.generators.linkedin_post_generator.openai.OpenAI') as mock_openai, \
+             patch('src.generators.linkedin_post_generator.openai.AsyncOpenAI') as mock_async_openai:
+            generator = LinkedInPostGenerator("test-key", client=mock_openai_client, async_client=mock_async_client)
+
+            assert generator.client is mock_openai_client
+            assert generator.async_client is mock_async_client
+            mock_openai.assert_not_called()
+            mock_async_openai.assert_not_called()
+
+    def test_init_disables_sdk_retries(self):
+        """Test the client is built without SDK retries, which would multiply the generator's own."""
+        with patch('src.generators.linkedin_post_generator.openai.OpenAI') as mock_openai:
+            LinkedInPostGenerator("test-key")
+
+            mock_openai.assert_called_once_with(api_key="test-key", max_retries=0)
+
     def test_generate_post_from_summary_standard(self, generator, sample_summary_data, sample_style_profile):
         """Test generating standard post from summary data."""
         result = generator.generate_post_from_summary(
@@ -138,14 +159,28 @@ class TestLinkedInPostGenerator:
             'engagement_stats': {'avg_score': 1500, 'avg_comments': 100}
         }
         
-        prompt = generator._create_standard_post_prompt(summary_text, insights, sample_style_profile)
+        prompt = generator._create_standard_post_prompt(summary_text, insights)
         
         assert isinstance(prompt, str)
         assert len(prompt) > 0
         assert "Content Summary:" in prompt
         assert "Key Insights:" in prompt
-        assert "Writing Style Guidelines:" in prompt
         assert "Requirements:" in prompt
+        
+        # Style guidelines live in the static, cacheable prefix instead
+        assert "Writing Style Guidelines:" not in prompt
+        assert "Writing Style Guidelines:" in generator._create_style_prefix(sample_style_profile)
+    
+    def test_chat_request_static_prefix(self, generator, sample_summary_data, sample_style_profile):
+        """Test that every post type shares the same leading message and cache key."""
+        requests = [
+            generator._post_builders(post_type)[1][0](sample_summary_data, sample_style_profile)
+            for post_type in ['standard', 'carousel', 'video_script', 'poll']
+        ]
+        
+        assert len({request['prompt_cache_key'] for request in requests}) == 1
+        assert len({json.dumps(request['messages'][0]) for request in requests}) == 1
+        assert all(request['messages'][-1]['role'] == 'user' for request in requests)
     
     def test_get_style_summary(self, generator, sample_style_profile):
         """Test style summary extraction."""
@@ -158,7 +193,14 @@ class TestLinkedInPostGenerator:
         expected_elements = ['tone', 'voice', 'words']
         style_lower = style_summary.lower()
         assert any(element in style_lower for element in expected_elements)
-    
+
+    def test_target_tokens(self, generator):
+        """Test completion budget follows the longer of the prompt limit and the author's posts."""
+        assert generator._target_tokens({}, max_words=300, min_tokens=600) == 600
+
+        verbose_profile = {'linguistic_patterns': {'avg_words_per_post': 500}}
+        assert generator._target_tokens(verbose_profile, max_words=300, min_tokens=600) == 800
+
     def test_extract_hashtags(self, generator):
         """Test hashtag extraction."""
         content = "Great insights about #DataScience and #MachineLearning trends! #AI #Analytics"
@@ -250,7 +292,13 @@ class TestLinkedInPostGenerator:
         assert len(options) == 4
         assert 'Python' in options[0]
         assert 'R' in options[1]
-    
+
+    def test_parse_poll_content_keeps_option_text_after_marker(self, generator):
+        """Test option text containing periods is kept whole."""
+        parsed = generator._parse_poll_content("Which version?\nA) Python 3.12\nB) R 4.4\n1. pandas 2.2\n- Excel")
+
+        assert parsed['options'] == ['Python 3.12', 'R 4.4', 'pandas 2.2', 'Excel']
+
     def test_generate_fallback_post(self, generator, sample_summary_data):
         """Test fallback post generation."""
         fallback = generator._generate_fallback_post(sample_summary_data)
@@ -275,6 +323,10 @@ class TestLinkedInPostGenerator:
         )
         
         assert len(calendar) == 5
+        # gpt-4 has no JSON mode, so the calendar is generated with one call per post type
+        assert generator.client.chat.completions.create.call_count == 4
+        assert not any('response_format' in call.kwargs for call in generator.client.chat.completions.create.call_args_list)
+        assert [entry['post_type'] for entry in calendar] == ['standard', 'poll', 'carousel', 'video_script', 'standard']
         
         for day, entry in enumerate(calendar):
             assert entry['day'] == day + 1
@@ -289,6 +341,258 @@ class TestLinkedInPostGenerator:
             assert 'post_type' in post_data
             assert entry['post_type'] == post_data['post_type']
     
+    def test_generate_content_calendar_single_call(self, generator, mock_openai_client, sample_summary_data, sample_style_profile):
+        """Test the content calendar is generated by one JSON completion."""
+        generator.model = "gpt-4o"
+        entries = [
+            {'day': 1, 'post_type': 'standard', 'content': 'Data viz trends this week. What do you think?'},
+            {'day': 2, 'post_type': 'poll', 'content': 'Which tool do you prefer?\nA) Python\nB) R'},
+            {'day': 3, 'post_type': 'carousel', 'content': 'Swipe through the top trends.'}
+        ]
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = json.dumps({'calendar': entries})
+        mock_openai_client.chat.completions.create.return_value = mock_response
+        
+        calendar = generator.generate_content_calendar(
+            sample_summary_data,
+            sample_style_profile,
+            days=3
+        )
+        
+        assert mock_openai_client.chat.completions.create.call_count == 1
+        request = mock_openai_client.chat.completions.create.call_args.kwargs
+        assert request['response_format'] == {"type": "json_object"}
+        
+        assert [entry['post_type'] for entry in calendar] == ['standard', 'poll', 'carousel']
+        assert calendar[0]['post_data']['content'] == entries[0]['content']
+        assert calendar[1]['post_data']['poll_options'] == ['Python', 'R']
+    
+    def test_generate_content_calendar_chunks_long_calendars(self, generator, mock_openai_client, sample_summary_data, sample_style_profile):
+        """Test a long calendar is requested in chunks of days that each fit the output limit."""
+        generator.model = "gpt-4o"
+        
+        def create(**request):
+            days = [int(day) for day in re.findall(r'Day (\d+):', request['messages'][-1]['content'])]
+            response = Mock()
+            response.choices = [Mock()]
+            response.choices[0].message.content = json.dumps({'calendar': [
+                {'day': day, 'content': f"Day {day} post. What do you think?"} for day in days
+            ]})
+            return response
+        
+        mock_openai_client.chat.completions.create.side_effect = create
+        
+        calendar = generator.generate_content_calendar(
+            sample_summary_data,
+            sample_style_profile,
+            days=10
+        )
+        
+        requests = [call.kwargs for call in mock_openai_client.chat.completions.create.call_args_list]
+        assert len(requests) == 2
+        assert all(request['max_tokens'] <= 4096 for request in requests)
+        
+        assert [entry['day'] for entry in calendar] == list(range(1, 11))
+        assert calendar[9]['post_data']['content'].startswith('Day 10 post')
+        assert not any(entry['post_data'].get('is_fallback') for entry in calendar)
+    
+    def test_generate_content_calendar_samples_variants(self, generator, mock_openai_client, sample_summary_data, sample_style_profile):
+        """Test days sharing a post type get distinct samples from one n= request."""
+        generator.model = "gpt-4o"
+        def create(**request):
+            response = Mock()
+            if 'response_format' in request:
+                response.choices = [Mock()]
+                response.choices[0].message.content = "not a calendar"
+                return response
+            
+            response.choices = [Mock() for _ in range(request.get('n', 1))]
+            for index, choice in enumerate(response.choices):
+                choice.message.content = f"Variant {index + 1}: data viz trends. What do you think?"
+            return response
+        
+        mock_openai_client.chat.completions.create.side_effect = create
+        
+        calendar = generator.generate_content_calendar(
+            sample_summary_data,
+            sample_style_profile,
+            days=6
+        )
+        
+        requests = [call.kwargs for call in mock_openai_client.chat.completions.create.call_args_list[1:]]
+        assert sorted(request.get('n', 1) for request in requests) == [1, 1, 2, 2]
+        
+        assert [entry['post_type'] for entry in calendar] == ['standard', 'poll', 'carousel', 'video_script', 'standard', 'poll']
+        assert calendar[0]['post_data']['content'].startswith('Variant 1')
+        assert calendar[4]['post_data']['content'].startswith('Variant 2')
+        assert not any(entry['post_data'].get('is_fallback') for entry in calendar)
+    
+    @pytest.mark.asyncio
+    async def test_agenerate_post_from_summary(self, generator, mock_openai_client, sample_summary_data, sample_style_profile):
+        """Test async post generation matches the sync result structure."""
+        generator._async_client = Mock()
+        generator._async_client.chat.completions.create = AsyncMock(
+            return_value=mock_openai_client.chat.completions.create.return_value
+        )
+        
+        for post_type in ['standard', 'carousel', 'video_script', 'poll']:
+            result = await generator.agenerate_post_from_summary(
+                sample_summary_data,
+                sample_style_profile,
+                post_type=post_type
+            )
+            sync_result = generator.generate_post_from_summary(
+                sample_summary_data,
+                sample_style_profile,
+                post_type=post_type
+            )
+            
+            assert result['post_type'] == post_type
+            assert set(result.keys()) == set(sync_result.keys())
+    
+    @pytest.mark.asyncio
+    async def test_astream_post_from_summary(self, generator, sample_summary_data, sample_style_profile):
+        """Test streaming yields the post text chunk by chunk."""
+        def chunk(content):
+            delta_chunk = Mock()
+            delta_chunk.choices = [Mock()]
+            delta_chunk.choices[0].delta.content = content
+            return delta_chunk
+        
+        async def stream():
+            for content in ['Data viz ', None, 'trends! ', '#DataScience']:
+                yield chunk(content)
+        
+        generator._async_client = Mock()
+        generator._async_client.chat.completions.create = AsyncMock(return_value=stream())
+        
+        chunks = [text async for text in generator.astream_post_from_summary(sample_summary_data, sample_style_profile)]
+        
+        assert chunks == ['Data viz ', 'trends! ', '#DataScience']
+        assert generator._async_client.chat.completions.create.call_args.kwargs['stream'] is True
+    
+    @pytest.mark.asyncio
+    async def test_agenerate_content_calendar(self, generator, mock_openai_client, sample_summary_data, sample_style_profile):
+        """Test async content calendar generation."""
+        generator._async_client = Mock()
+        generator._async_client.chat.completions.create = AsyncMock(
+            return_value=mock_openai_client.chat.completions.create.return_value
+        )
+        
+        calendar = await generator.agenerate_content_calendar(
+            sample_summary_data,
+            sample_style_profile,
+            days=5
+        )
+        
+        assert len(calendar) == 5
+        # gpt-4 has no JSON mode, so the calendar is generated with one call per post type
+        assert generator._async_client.chat.completions.create.await_count == 4
+        assert [entry['post_type'] for entry in calendar] == ['standard', 'poll', 'carousel', 'video_script', 'standard']
+        
+        for day, entry in enumerate(calendar):
+            assert entry['day'] == day + 1
+            assert entry['post_type'] == entry['post_data']['post_type']
+
+    @pytest.mark.asyncio
+    async def test_astream_content_calendar_yields_as_completed(self, generator, mock_openai_client, sample_summary_data, sample_style_profile):
+        """Test calendar entries stream in completion order and a stuck request falls back after the timeout."""
+        reply = mock_openai_client.chat.completions.create.return_value
+
+        async def create(**request):
+            system_prompt = request['messages'][1]['content']
+            if 'video scripts' in system_prompt:
+                await asyncio.sleep(10)
+            elif 'carousel' in system_prompt:
+                await asyncio.sleep(0.05)
+            return reply
+
+        generator._async_client = Mock()
+        generator._async_client.chat.completions.create = AsyncMock(side_effect=create)
+
+        entries = [entry async for entry in generator.astream_content_calendar(
+            sample_summary_data,
+            sample_style_profile,
+            days=4,
+            timeout_per_post=0.2
+        )]
+
+        assert [entry['post_type'] for entry in entries] == ['standard', 'poll', 'carousel', 'video_script']
+        assert entries[-1]['post_data']['is_fallback']
+        assert not any(entry['post_data'].get('is_fallback') for entry in entries[:-1])
+
+    @pytest.mark.asyncio
+    async def test_agenerate_content_calendar_bounded_concurrency(self, mock_openai_client, sample_summary_data, sample_style_profile):
+        """Test the per-day calendar fallback keeps at most max_concurrent requests in flight."""
+        with patch('src.generators.linkedin_post_generator.openai.OpenAI'):
+            generator = LinkedInPostGenerator("test-api-key", "gpt-4", max_concurrent=2)
+        in_flight = 0
+        peak = 0
+        
+        async def create(**request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return mock_openai_client.chat.completions.create.return_value
+        
+        generator._async_client = Mock()
+        generator._async_client.chat.completions.create = AsyncMock(side_effect=create)
+        
+        calendar = await generator.agenerate_content_calendar(
+            sample_summary_data,
+            sample_style_profile,
+            days=6
+        )
+        
+        assert len(calendar) == 6
+        assert peak == 2
+    
+    def test_generate_posts_batch(self, generator, mock_openai_client, sample_summary_data, sample_style_profile):
+        """Test generating all post types and the calendar as one batch job."""
+        response = mock_openai_client.chat.completions.create.return_value
+        
+        with patch('src.generators.linkedin_post_generator.run_chat_batch') as mock_batch:
+            mock_batch.side_effect = lambda client, requests: {
+                custom_id: response for custom_id in requests if custom_id != 'post-1'
+            }
+            
+            results = generator.generate_posts_batch(
+                sample_summary_data,
+                sample_style_profile,
+                ['standard', 'poll'],
+                calendar_days=3
+            )
+        
+        # One batch job carries every completion
+        assert mock_batch.call_count == 1
+        assert len(mock_batch.call_args[0][1]) == 5
+        
+        standard, poll, calendar = results
+        assert standard['post_type'] == 'standard'
+        assert 'is_fallback' not in standard
+        
+        # Missing batch results fall back per post
+        assert poll['post_type'] == 'poll'
+        assert poll['is_fallback'] == True
+        
+        assert [entry['post_type'] for entry in calendar] == ['standard', 'poll', 'carousel']
+    
+    def test_completion_cache_hit(self, generator, mock_openai_client, sample_summary_data, sample_style_profile):
+        """Test that cached completions skip the OpenAI client."""
+        cached_response = mock_openai_client.chat.completions.create.return_value
+        generator.completion_cache = Mock()
+        generator.completion_cache.get.side_effect = [None, cached_response]
+        
+        first = generator.generate_post_from_summary(sample_summary_data, sample_style_profile)
+        second = generator.generate_post_from_summary(sample_summary_data, sample_style_profile)
+        
+        assert mock_openai_client.chat.completions.create.call_count == 1
+        assert generator.completion_cache.set.call_count == 1
+        assert first['content'] == second['content']
+    
     def test_get_scheduling_notes(self, generator):
         """Test scheduling notes generation."""
         post_types = ['standard', 'poll', 'carousel', 'video_script', 'unknown']
@@ -171,6 +171,15 @@ class TestRedditScraper:
         assert all(post["num_comments"] >= 10 for post in filtered_posts)
         assert all(not post["over_18"] for post in filtered_posts)
     
+    def test_filter_high_quality_posts_from_generator(self):
+        """Test filtering posts streamed from a generator."""
+        scraper = MockRedditScraper()
+        
+        posts = scraper.iter_dataisbeautiful_posts(limit=5)
+        filtered_posts = scraper.filter_high_quality_posts(posts, min_score=0, min_comments=0)
+        
+        assert filtered_posts == scraper.get_dataisbeautiful_posts(limit=5)
+    
     def test_categorize_posts(self):
         """Test post categorization."""
         scraper = RedditScraper("client_id", "client_secret", "user_agent")
@@ -1,12 +1,16 @@
 import pytest
 import os
 import tempfile
+import json
 import logging
 from pathlib import Path
-from unittest.mock import patch, Mock
+from unittest.mock import patch, Mock, AsyncMock
 
 from src.utils.config import Config, get_config, load_config
 from src.utils.logger import setup_logger, setup_component_logger, LoggerContextManager, StructuredLogger
+from src.utils.openai_batch import run_chat_batch, create_batch_completion
+from src.utils.completion_cache import CompletionCache
+from src.utils.rate_limiter import AsyncRateLimiter, call_with_retries, estimate_request_tokens
 
 
 class TestConfig:
@@ -413,6 +417,179 @@ class TestLogger:
             assert "Test error" in call_args
 
 
+class TestOpenAIBatch:
+    """Test cases for the OpenAI Batch API helpers."""
+    
+    @staticmethod
+    def _completion_body(content):
+        return {
+            "id": "chatcmpl-test",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "gpt-4",
+            "choices": [{
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": content}
+            }]
+        }
+    
+    def test_run_chat_batch(self):
+        """Test batch submission, polling and result mapping by custom_id."""
+        client = Mock()
+        client.files.create.return_value = Mock(id="file-in")
+        client.batches.create.return_value = Mock(id="batch-1", status="in_progress")
+        client.batches.retrieve.return_value = Mock(id="batch-1", status="completed", output_file_id="file-out")
+        client.files.content.return_value = Mock(text="\n".join([
+            json.dumps({"custom_id": "a", "response": {"status_code": 200, "body": self._completion_body("first")}}),
+            json.dumps({"custom_id": "b", "response": {"status_code": 500, "body": {}}, "error": "server error"})
+        ]))
+        
+        with patch('src.utils.openai_batch.time.sleep'):
+            results = run_chat_batch(client, {
+                "a": {"model": "gpt-4", "messages": []},
+                "b": {"model": "gpt-4", "messages": []}
+            })
+        
+        assert list(results.keys()) == ["a"]
+        assert results["a"].choices[0].message.content == "first"
+        
+        # Requests are uploaded as one JSONL file
+        _, batch_input = client.files.create.call_args.kwargs['file']
+        lines = [json.loads(line) for line in batch_input.decode('utf-8').splitlines()]
+        assert [line['custom_id'] for line in lines] == ["a", "b"]
+        assert all(line['url'] == "/v1/chat/completions" for line in lines)
+        assert client.batches.create.call_args.kwargs['completion_window'] == "24h"
+    
+    def test_create_batch_completion_failed_batch(self):
+        """Test that a batch ending in a non-completed status raises."""
+        client = Mock()
+        client.files.create.return_value = Mock(id="file-in")
+        client.batches.create.return_value = Mock(id="batch-1", status="failed")
+        
+        with pytest.raises(RuntimeError):
+            create_batch_completion(client, {"model": "gpt-4", "messages": []})
+
+
+class TestCompletionCache:
+    """Test cases for the on-disk completion cache."""
+    
+    @staticmethod
+    def _completion(content):
+        from openai.types.chat import ChatCompletion
+        return ChatCompletion.model_validate({
+            "id": "chatcmpl-test",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "gpt-4",
+            "choices": [{
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": content}
+            }]
+        })
+    
+    def test_get_and_set(self, temp_dir):
+        """Test cache misses, hits and key sensitivity to request parameters."""
+        cache = CompletionCache(temp_dir)
+        request = {"model": "gpt-4", "messages": [{"role": "user", "content": "hi"}], "temperature": 0.7}
+        
+        assert cache.get(request) is None
+        
+        cache.set(request, self._completion("hello"))
+        
+        assert cache.get(request).choices[0].message.content == "hello"
+        assert cache.get({**request, "temperature": 0.3}) is None
+        assert cache.get({**request, "model": "gpt-3.5-turbo"}) is None
+        
+        # Entries persist across cache instances
+        cache.close()
+        assert CompletionCache(temp_dir).get(request).choices[0].message.content == "hello"
+    
+    def test_lru_eviction(self, temp_dir):
+        """Test that the least recently used entry is evicted above capacity."""
+        cache = CompletionCache(temp_dir, capacity=2)
+        requests = [{"model": "gpt-4", "messages": [{"role": "user", "content": str(i)}]} for i in range(3)]
+        
+        with patch('src.utils.completion_cache.time.time', side_effect=[1, 2, 3, 4, 5, 6, 7]):
+            cache.set(requests[0], self._completion("0"))
+            cache.set(requests[1], self._completion("1"))
+            cache.get(requests[0])  # requests[1] is now least recently used
+            cache.set(requests[2], self._completion("2"))
+            
+            assert len(cache) == 2
+            assert cache.get(requests[1]) is None
+            assert cache.get(requests[0]) is not None
+    
+    def test_ttl_expiry(self, temp_dir):
+        """Test that expired entries are treated as misses."""
+        cache = CompletionCache(temp_dir, ttl_hours=1)
+        request = {"model": "gpt-4", "messages": []}
+        
+        with patch('src.utils.completion_cache.time.time', side_effect=[0, 3601]):
+            cache.set(request, self._completion("stale"))
+            assert cache.get(request) is None
+        
+        assert len(cache) == 0
+
+
+class TestAsyncRateLimiter:
+    """Test cases for the async OpenAI rate limiter."""
+    
+    def test_estimate_request_tokens(self):
+        """Test token estimate from prompt length and completion budget."""
+        request = {"messages": [{"role": "user", "content": "x" * 400}], "max_tokens": 100}
+        
+        assert estimate_request_tokens(request) == 200
+    
+    @pytest.mark.asyncio
+    async def test_retries_rate_limit_errors(self):
+        """Test that rate-limited requests are retried until they succeed."""
+        import httpx
+        import openai
+        
+        response = httpx.Response(429, request=httpx.Request("POST", "https://api.openai.com/v1/chat/completions"))
+        make_request = AsyncMock(side_effect=[
+            openai.RateLimitError("rate limited", response=response, body=None),
+            "ok"
+        ])
+        limiter = AsyncRateLimiter(base_delay=0)
+        
+        assert await limiter.run(make_request, tokens=10) == "ok"
+        assert make_request.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_token_budget(self):
+        """Test that requests beyond the token budget wait for the bucket to refill."""
+        limiter = AsyncRateLimiter(max_tokens_per_minute=60)
+        
+        with patch('src.utils.rate_limiter.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            with patch('src.utils.rate_limiter.time.monotonic', side_effect=[0, 0, 30]):
+                limiter._last_update = 0
+                await limiter.acquire(60)
+                await limiter.acquire(30)
+        
+        mock_sleep.assert_awaited_once()
+        assert mock_sleep.await_args.args[0] == pytest.approx(30)
+    
+    def test_call_with_retries(self):
+        """Test that blocking requests retry transient errors and re-raise after the last attempt."""
+        import httpx
+        import openai
+        
+        request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+        make_request = Mock(side_effect=[openai.APIConnectionError(request=request), "ok"])
+        
+        assert call_with_retries(make_request, base_delay=0) == "ok"
+        assert make_request.call_count == 2
+        
+        make_request = Mock(side_effect=openai.APIConnectionError(request=request))
+        
+        with pytest.raises(openai.APIConnectionError):
+            call_with_retries(make_request, max_attempts=3, base_delay=0)
+        assert make_request.call_count == 3
+
+
 class TestUtilsIntegration:
     """Integration tests for utilities."""
     
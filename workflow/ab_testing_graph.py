@@ -1,9 +1,11 @@
-from typing import Dict, Any, List, TypedDict
+from typing import Annotated, Dict, Any, List, TypedDict
 from langgraph.graph import StateGraph, END
 from langchain_openai import ChatOpenAI
 from langchain.schema import HumanMessage, SystemMessage
 import json
 import asyncio
+import operator
+from dataclasses import asdict
 from agents.personas import SingleMotherPersona, YoungMalePersona, ElderlyRetireePersona, PersonaResponse
 
 class ABTestState(TypedDict):
@@ -12,7 +14,7 @@ class ABTestState(TypedDict):
     product_info: Dict[str, Any]
     variant_a_info: Dict[str, Any]
     variant_b_info: Dict[str, Any]
-    persona_responses: List[Dict[str, Any]]
+    persona_responses: Annotated[List[Dict[str, Any]], operator.add]  # Variant branches append concurrently
     current_variant: str
     test_results: Dict[str, Any]
     analysis_complete: bool
@@ -41,10 +43,10 @@ class ABTestingWorkflow:
         graph.add_node("collect_responses", self.collect_responses)
         graph.add_node("analyze_results", self.analyze_results)
         
-        # Add edges
+        # Add edges - both variants are independent, so they run as parallel branches
         graph.add_edge("analyze_image", "test_variant_a")
-        graph.add_edge("test_variant_a", "test_variant_b")
-        graph.add_edge("test_variant_b", "collect_responses")
+        graph.add_edge("analyze_image", "test_variant_b")
+        graph.add_edge(["test_variant_a", "test_variant_b"], "collect_responses")
         graph.add_edge("collect_responses", "analyze_results")
         graph.add_edge("analyze_results", END)
         
@@ -86,7 +88,6 @@ Be specific and detailed in your analysis."""),
                 product_info["category"] = category_response.content.strip()
             
             return {
-                **state,
                 "image_description": description,
                 "product_info": product_info
             }
@@ -94,62 +95,36 @@ Be specific and detailed in your analysis."""),
         except Exception as e:
             # Fallback if image analysis fails
             return {
-                **state,
                 "image_description": f"Image analysis failed: {str(e)}. Using provided product info.",
                 "product_info": state.get("product_info", {"category": "general", "price": 50})
             }
     
     async def test_variant_a(self, state: ABTestState) -> Dict[str, Any]:
         """Test variant A with all personas"""
-        variant_info = state["variant_a_info"]
-        responses = []
-        
-        # Combine image description with variant-specific information
-        enhanced_description = f"{state['image_description']}\n\nVariant A Details: {variant_info.get('description', '')}"
-        product_info = {**state["product_info"], **variant_info}
-        
-        for persona_name, persona in self.personas.items():
-            response = persona.analyze_image(enhanced_description, product_info)
-            responses.append({
-                "variant": "A",
-                "persona": persona_name,
-                "response": response.__dict__
-            })
-        
-        current_responses = state.get("persona_responses", [])
-        current_responses.extend(responses)
-        
-        return {
-            **state,
-            "persona_responses": current_responses,
-            "current_variant": "A"
-        }
+        return {"persona_responses": self._test_variant(state, "A", state["variant_a_info"])}
     
     async def test_variant_b(self, state: ABTestState) -> Dict[str, Any]:
         """Test variant B with all personas"""
-        variant_info = state["variant_b_info"]
+        return {"persona_responses": self._test_variant(state, "B", state["variant_b_info"])}
+    
+    def _test_variant(self, state: ABTestState, variant: str, variant_info: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Score one variant with every persona"""
         responses = []
         
         # Combine image description with variant-specific information
-        enhanced_description = f"{state['image_description']}\n\nVariant B Details: {variant_info.get('description', '')}"
+        enhanced_description = f"{state['image_description']}\n\nVariant {variant} Details: {variant_info.get('description', '')}"
+        description_lower = enhanced_description.lower()
         product_info = {**state["product_info"], **variant_info}
         
         for persona_name, persona in self.personas.items():
-            response = persona.analyze_image(enhanced_description, product_info)
+            response = persona.analyze_lowered(description_lower, product_info)
             responses.append({
-                "variant": "B",
+                "variant": variant,
                 "persona": persona_name,
-                "response": response.__dict__
+                "response": asdict(response)
             })
         
-        current_responses = state.get("persona_responses", [])
-        current_responses.extend(responses)
-        
-        return {
-            **state,
-            "persona_responses": current_responses,
-            "current_variant": "B"
-        }
+        return responses
     
     async def collect_responses(self, state: ABTestState) -> Dict[str, Any]:
         """Collect and organize all persona responses"""
@@ -167,7 +142,6 @@ Be specific and detailed in your analysis."""),
             organized_responses[variant][persona] = response_data["response"]
         
         return {
-            **state,
             "organized_responses": organized_responses
         }
     
@@ -213,7 +187,6 @@ Be specific and detailed in your analysis."""),
         }
         
         return {
-            **state,
             "test_results": test_results,
             "analysis_complete": True
         }